@@ -1,3 +1,4 @@
 from app.config.jwt_config import Config
+from app.config.ingestion_config import IngestionConfig
 
-__all__ = ['Config']
+__all__ = ['Config', 'IngestionConfig']
@@ -0,0 +1,62 @@
+import os
+
+class IngestionConfig:
+    # Parallel page extraction: PDFs with at least PARALLEL_MIN_PAGES pages are
+    # split across PARALLEL_WORKERS processes; smaller files stay serial.
+    PARALLEL_WORKERS = int(os.getenv('INGEST_PARALLEL_WORKERS', min(4, os.cpu_count() or 1)))
+    PARALLEL_MIN_PAGES = int(os.getenv('INGEST_PARALLEL_MIN_PAGES', 40))
+
+    # Batch uploads: PDFs of one /ingestion/upload request are processed by up
+    # to UPLOAD_WORKERS processes at once (1 = one after another).
+    UPLOAD_WORKERS = int(os.getenv('INGEST_UPLOAD_WORKERS', min(4, os.cpu_count() or 1)))
+
+    # Each file's detect+parse runs in a child process killed after
+    # SANDBOX_TIMEOUT_S seconds, SANDBOX_PAGE_TIMEOUT_S seconds without
+    # finishing a page, or above SANDBOX_MAX_RSS_MB resident memory (summed
+    # over the child and its prefetch workers).
+    SANDBOX_ENABLED = os.getenv('INGEST_SANDBOX', '1') == '1'
+    SANDBOX_TIMEOUT_S = float(os.getenv('INGEST_SANDBOX_TIMEOUT_S', 600))
+    SANDBOX_PAGE_TIMEOUT_S = float(os.getenv('INGEST_SANDBOX_PAGE_TIMEOUT_S', 60))
+    SANDBOX_MAX_RSS_MB = int(os.getenv('INGEST_SANDBOX_MAX_RSS_MB', 1536))
+
+    # /api/pdf/upload: statements are parsed by JOB_WORKERS background threads
+    # and polled via /api/pdf/status/<id>; 0 processes them inside the request.
+    JOB_WORKERS = int(os.getenv('INGEST_JOB_WORKERS', 2))
+    # Seconds a finished job's live progress is kept for status polls that never come
+    JOB_PROGRESS_TTL_S = int(os.getenv('INGEST_JOB_PROGRESS_TTL_S', 3600))
+
+    # Per-file ingestion telemetry (stage timings, rows/sec, reject rate, peak
+    # memory) appended as JSON lines; served by /api/pdf/telemetry.
+    TELEMETRY_ENABLED = os.getenv('INGEST_TELEMETRY', '1') == '1'
+    TELEMETRY_PATH = os.getenv('INGEST_TELEMETRY_PATH', os.path.join('storage', 'telemetry', 'ingestion.jsonl'))
+    # Profiles allowed to read /api/pdf/telemetry/all: aggregates over every
+    # user's runs and the batch upload page (comma-separated profile ids).
+    TELEMETRY_ADMINS = frozenset(p.strip() for p in os.getenv('INGEST_TELEMETRY_ADMINS', '').split(',') if p.strip())
+
+    # STD/REJECTS file format: 'csv' (UTF-8-BOM) or 'parquet' (typed columns,
+    # needs pyarrow; CSV is still exported on download).
+    OUTPUT_FORMAT = os.getenv('INGEST_OUTPUT_FORMAT', 'csv').lower()
+
+    # Content-addressed extraction cache (page text + tables keyed by PDF SHA-256)
+    EXTRACT_CACHE_ENABLED = os.getenv('INGEST_EXTRACT_CACHE', '1') == '1'
+    EXTRACT_CACHE_DIR = os.getenv('INGEST_EXTRACT_CACHE_DIR', os.path.join('storage', 'cache', 'extraction'))
+    EXTRACT_CACHE_MAX_BYTES = int(os.getenv('INGEST_EXTRACT_CACHE_MAX_MB', 256)) * 1024 * 1024
+
+    # Page checkpoints: parses of PDFs with at least CHECKPOINT_MIN_PAGES pages
+    # log every finished page so a retry of the same file resumes there.
+    CHECKPOINT_ENABLED = os.getenv('INGEST_CHECKPOINTS', '1') == '1'
+    CHECKPOINT_DIR = os.getenv('INGEST_CHECKPOINT_DIR', os.path.join('storage', 'checkpoints'))
+    CHECKPOINT_MIN_PAGES = int(os.getenv('INGEST_CHECKPOINT_MIN_PAGES', 50))
+
+    # PDF engine for text/words/probes: 'pdfplumber' (default) or 'pypdfium2'
+    # (much faster; tables still go through pdfplumber).
+    PDF_BACKEND = os.getenv('INGEST_PDF_BACKEND', 'pdfplumber').lower()
+
+    # Page pre-pass: text in the top PROBE_BAND_PT points of each page plus its
+    # character count decide whether the page is skipped as boilerplate.
+    PROBE_BAND_PT = float(os.getenv('INGEST_PROBE_BAND_PT', 160))
+    BOILERPLATE_MAX_CHARS = int(os.getenv('INGEST_BOILERPLATE_MAX_CHARS', 1500))
+
+    # HDFC parser: 'text' splits extract_text() lines; 'words' assigns
+    # extract_words() tokens to column x-bands learned from the header row.
+    HDFC_PARSER_MODE = os.getenv('INGEST_HDFC_PARSER_MODE', 'text').lower()
@@ -1,25 +1,69 @@
 import os
+import time
 import uuid
-import traceback
-import pandas as pd
+from dataclasses import asdict
+from datetime import date
+from flask import current_app
 from werkzeug.utils import secure_filename
 from app import db
 from app.models.bank_statement import BankStatement
-from app.services.ingestion.detect import detect_bank
-from app.services.ingestion.extract import parse_hdfc_df, parse_kotak_df, parse_sbi_df, parse_icici_df
+from app.services.ingestion.document import StatementDocument
+from app.services.ingestion.extract import iter_transactions
+from app.services.ingestion.jobs import get_job_queue
+from app.services.ingestion.outputs import count_rows, csv_name, format_of
+from app.services.ingestion.sandbox import SandboxError, run_sandboxed
 from app.services.ingestion.standardize import standardize_and_write
+from app.services.ingestion.statement_meta import statement_meta
+from app.services.ingestion.telemetry import IngestTelemetry, failure_entry, record
+
+def _parse_statement(file_path, bank, base, output_dir, report):
+    """
+    Sandbox body: stream one statement into its STD/REJECTS files, reporting
+    the header facts (period, masked account) first, then pages and rows,
+    and finally the file's telemetry record.
+    """
+    rows = {'parsed': 0}
+
+    def on_page(pages_done, page_count):
+        report(pages_done=pages_done, page_count=page_count, rows_parsed=rows['parsed'])
+
+    def counted(batches):
+        for batch in batches:
+            rows['parsed'] += len(batch)
+            yield batch
+
+    telemetry = IngestTelemetry(os.path.basename(file_path), bank)
+
+    # Single open, bounded memory
+    with StatementDocument(file_path) as doc:
+        with telemetry.stage('open'):
+            telemetry.pages = doc.page_count
+        with telemetry.stage('meta'):
+            meta = statement_meta(doc)
+        report(**asdict(meta))
+        batches = counted(iter_transactions(doc, bank, on_page, telemetry))
+        outputs = standardize_and_write(batches, bank, base, output_dir, telemetry)
+    report(telemetry=telemetry.entry())
+    return outputs
+
 
 class PDFController:
-    
+
     @staticmethod
     def process_pdf(pdf_file, profile_id, upload_dir, output_dir, bank):
+        """
+        Save the upload and create its PENDING BankStatement. With a job queue
+        configured, processing is queued and only the statement id and status
+        are returned (poll get_status); otherwise it runs here and the full
+        result is returned.
+        """
         batch_id = str(uuid.uuid4())[:8]
         safe_name = secure_filename(pdf_file.filename)
         file_path = os.path.join(upload_dir, f"{batch_id}_{safe_name}")
-        
+
         pdf_file.save(file_path)
         file_size = os.path.getsize(file_path)
-        
+
         # Create DB record - PENDING
         statement = BankStatement(
             profile_id=profile_id,
@@ -31,50 +75,167 @@ class PDFController:
         )
         db.session.add(statement)
         db.session.commit()
-        
+
+        queue = get_job_queue()
+        if queue is None:
+            return PDFController.run_statement(statement.file_id, output_dir)
+
+        app = current_app._get_current_object()
+        queue.submit(statement.file_id, PDFController.run_job, app, statement.file_id, output_dir)
+        return {
+            'statement_id': str(statement.file_id),
+            'bank_name': bank,
+            'status': 'PENDING',
+        }
+
+    @staticmethod
+    def run_job(app, statement_id, output_dir):
+        """Queue worker entry point: process one statement inside an app context."""
+        with app.app_context():
+            try:
+                PDFController.run_statement(statement_id, output_dir)
+            finally:
+                db.session.remove()
+
+    @staticmethod
+    def fail_interrupted():
+        """
+        Mark statements a previous server process left PENDING/PROCESSING as
+        FAILED: the job queue lives in memory, so nothing would ever finish
+        them. Run once at startup; returns how many were marked.
+        """
+        stale = BankStatement.query.filter(BankStatement.processing_status.in_(('PENDING', 'PROCESSING'))).all()
+        for statement in stale:
+            statement.processing_status = 'FAILED'
+            statement.error_message = 'interrupted: the server restarted before processing finished; upload again'
+        db.session.commit()
+        return len(stale)
+
+    @staticmethod
+    def run_statement(statement_id, output_dir):
+        """Parse and standardize a saved statement, moving it PROCESSING -> COMPLETED/FAILED."""
+        started = time.perf_counter()
+        statement = BankStatement.query.get(statement_id)
+        bank = statement.bank_name
+        queue = get_job_queue()
+
+        def report(**fields):
+            if 'period_start' in fields:
+                PDFController._apply_meta(statement, fields)
+            if 'telemetry' in fields:
+                record(fields.pop('telemetry'), statement.profile_id)
+            if queue is not None:
+                queue.update(statement_id, **fields)
+
         try:
             # Update to PROCESSING
             statement.processing_status = 'PROCESSING'
             db.session.commit()
-            
-            # Extract transactions
-            if bank == "HDFC":
-                df_raw = parse_hdfc_df(file_path)
-            elif bank == "KOTAK":
-                df_raw = parse_kotak_df(file_path)
-            elif bank == "SBI":
-                df_raw = parse_sbi_df(file_path)
-            elif bank == "ICICI":
-                df_raw = parse_icici_df(file_path)
-            else:
-                df_raw = parse_hdfc_df(file_path)
-            
-            # Standardize
-            base = os.path.splitext(os.path.basename(file_path))[0]
-            std_csv, rej_csv = standardize_and_write(df_raw, bank, base, output_dir)
-            
-            # Count transactions
-            transaction_count = 0
-            if os.path.exists(std_csv):
-                df = pd.read_csv(std_csv)
-                transaction_count = len(df)
-            
+
+            # Extract and standardize page by page in a resource-limited child process
+            base = os.path.splitext(os.path.basename(statement.file_path))[0]
+            std_path, rej_path = run_sandboxed(
+                _parse_statement, statement.file_path, bank, base, output_dir,
+                progress=lambda fields: report(**fields)
+            )
+
+            # Count transactions (Parquet: from the footer, no data read)
+            transaction_count = count_rows(std_path) if os.path.exists(std_path) else 0
+
             # Update to COMPLETED
-            statement.extracted_csv_path = std_csv
-            statement.normalized_csv_path = std_csv
+            statement.extracted_csv_path = std_path
+            statement.normalized_csv_path = std_path
+            statement.output_format = format_of(std_path)
             statement.processing_status = 'COMPLETED'
             db.session.commit()
-            
+            overlaps = PDFController._overlaps(statement)
+            report(transaction_count=transaction_count, overlaps=overlaps)
+
             return {
                 'statement_id': str(statement.file_id),
                 'bank_name': bank,
+                'status': 'COMPLETED',
                 'transaction_count': transaction_count,
-                'csv_filename': os.path.basename(std_csv)
+                **PDFController._file_fields(std_path),
+                **PDFController._meta_fields(statement),
+                'overlaps': overlaps,
             }
-            
+
         except Exception as e:
             # Update to FAILED
+            db.session.rollback()
             statement.processing_status = 'FAILED'
-            statement.error_message = str(e)
+            reason = getattr(e, 'reason', SandboxError.reason)
+            statement.error_message = str(e) if reason == SandboxError.reason else f"{reason}: {e}"
             db.session.commit()
+            record(failure_entry(os.path.basename(statement.file_path), bank, reason, str(e), time.perf_counter() - started),
+                   statement.profile_id)
             raise
+
+    @staticmethod
+    def _apply_meta(statement, fields):
+        """Store reported header facts on the statement (committed with its status)."""
+        for name in ('period_start', 'period_end'):
+            if fields.get(name):
+                setattr(statement, name, date.fromisoformat(fields[name]))
+        if fields.get('account_masked'):
+            statement.account_masked = fields['account_masked']
+
+    @staticmethod
+    def _meta_fields(statement):
+        return {
+            'period_start': statement.period_start.isoformat() if statement.period_start else None,
+            'period_end': statement.period_end.isoformat() if statement.period_end else None,
+            'account_masked': statement.account_masked,
+        }
+
+    @staticmethod
+    def _file_fields(std_path):
+        """Download names: the STD file as written, and its CSV export (served on demand)."""
+        return {
+            'output_format': format_of(std_path),
+            'std_filename': os.path.basename(std_path),
+            'csv_filename': csv_name(std_path),
+        }
+
+    @staticmethod
+    def _overlaps(statement):
+        """Earlier uploads of the same account covering part of this statement's period."""
+        return [{
+            'statement_id': str(other.file_id),
+            'file_name': other.file_name,
+            'period_start': other.period_start.isoformat(),
+            'period_end': other.period_end.isoformat(),
+        } for other in statement.overlapping()]
+
+    @staticmethod
+    def get_status(statement_id, profile_id):
+        """Status of one of the user's statements plus live progress, or None when not found."""
+        statement = BankStatement.query.filter_by(file_id=statement_id, profile_id=profile_id).first()
+        if statement is None:
+            return None
+
+        queue = get_job_queue()
+        progress = queue.progress(statement.file_id) if queue is not None else {}
+        result = {
+            'statement_id': str(statement.file_id),
+            'bank_name': statement.bank_name,
+            'status': statement.processing_status,
+            'pages_done': progress.get('pages_done'),
+            'page_count': progress.get('page_count'),
+            'rows_parsed': progress.get('rows_parsed'),
+            **PDFController._meta_fields(statement),
+        }
+        if statement.processing_status == 'COMPLETED':
+            result['overlaps'] = progress['overlaps'] if 'overlaps' in progress else PDFController._overlaps(statement)
+        if statement.processing_status == 'COMPLETED' and statement.normalized_csv_path:
+            count = progress.get('transaction_count')
+            if count is None and os.path.exists(statement.normalized_csv_path):
+                count = count_rows(statement.normalized_csv_path)
+            result['transaction_count'] = count
+            result.update(PDFController._file_fields(statement.normalized_csv_path))
+        elif statement.processing_status == 'FAILED':
+            result['error'] = statement.error_message
+        if queue is not None and 'finished_at' in progress and statement.processing_status in ('COMPLETED', 'FAILED'):
+            queue.forget(statement.file_id)  # final status read; the queue keeps nothing more for this job
+        return result
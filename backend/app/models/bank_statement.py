@@ -3,6 +3,10 @@ from datetime import datetime
 
 class BankStatement(db.Model):
     __tablename__ = 'bank_statements'
+    __table_args__ = (
+        # Date filters prune whole statements by period before touching transactions
+        db.Index('ix_bank_statements_profile_period', 'profile_id', 'period_start', 'period_end'),
+    )
     
     file_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     profile_id = db.Column(db.String(36), db.ForeignKey('users.profile_id'), nullable=False)
@@ -15,5 +19,39 @@ class BankStatement(db.Model):
     error_message = db.Column(db.Text)
     extracted_csv_path = db.Column(db.String(500))
     normalized_csv_path = db.Column(db.String(500))
+    # Format of the files at the *_csv_path columns: 'csv' or 'parquet'
+    output_format = db.Column(db.String(10), default='csv')
+    # Statement header facts (NULL when the header could not be read)
+    period_start = db.Column(db.Date)
+    period_end = db.Column(db.Date)
+    account_masked = db.Column(db.String(32))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @staticmethod
+    def in_period(profile_id, start_date=None, end_date=None):
+        """
+        The user's statements whose period can overlap [start_date, end_date].
+        Statements without a parsed period always qualify.
+        """
+        query = BankStatement.query.filter(BankStatement.profile_id == profile_id)
+        if start_date:
+            query = query.filter(db.or_(BankStatement.period_end.is_(None), BankStatement.period_end >= start_date))
+        if end_date:
+            query = query.filter(db.or_(BankStatement.period_start.is_(None), BankStatement.period_start <= end_date))
+        return query
+
+    def overlapping(self):
+        """Other parsed statements of the same user and account whose period overlaps this one."""
+        if self.period_start is None or self.period_end is None:
+            return []
+        query = BankStatement.query.filter(
+            BankStatement.profile_id == self.profile_id,
+            BankStatement.file_id != self.file_id,
+            BankStatement.period_start <= self.period_end,
+            BankStatement.period_end >= self.period_start,
+        )
+        if self.account_masked:
+            query = query.filter(db.or_(BankStatement.account_masked.is_(None),
+                                        BankStatement.account_masked == self.account_masked))
+        return query.order_by(BankStatement.period_start).all()
@@ -4,6 +4,10 @@ import uuid
 
 class Transaction(db.Model):
     __tablename__ = 'transactions'
+    __table_args__ = (
+        # One row per statement line per user, however often it is uploaded
+        db.Index('ux_transactions_profile_fingerprint', 'profile_id', 'fingerprint', unique=True),
+    )
     
     transaction_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     profile_id = db.Column(db.String(36), db.ForeignKey('users.profile_id'), nullable=False)
@@ -15,4 +19,5 @@ class Transaction(db.Model):
     balance = db.Column(db.Numeric(12, 2))
     merchant_name = db.Column(db.String(255))
     is_repaired = db.Column(db.Boolean, default=False)
+    fingerprint = db.Column(db.String(64))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -1,6 +1,10 @@
 from flask import Blueprint, request, jsonify, send_from_directory, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.controllers.pdf_controller import PDFController
+from app.config import IngestionConfig
+from app.services.ingestion import telemetry
+from app.services.ingestion.outputs import export_csv
+from app.services.ingestion.registry import is_supported, supported_banks
 
 pdf_bp = Blueprint('pdf', __name__, url_prefix='/api/pdf')
 
@@ -18,8 +22,8 @@ def upload_pdf():
     
     # Get manual bank selection (required for now)
     bank = request.form.get('bank', '').strip().upper()
-    if not bank or bank not in ['HDFC', 'KOTAK', 'SBI', 'ICICI', 'AXIS', 'CUB', 'IDFC']:
-        return jsonify({'error': 'Bank required. Valid: HDFC, KOTAK, SBI, ICICI, AXIS, CUB, IDFC'}), 400
+    if not bank or not is_supported(bank):
+        return jsonify({'error': f"Bank required. Valid: {', '.join(supported_banks())}"}), 400
     
     try:
         result = PDFController.process_pdf(
@@ -29,13 +33,43 @@ def upload_pdf():
             current_app.config['OUTPUT_FOLDER'],
             bank
         )
-        return jsonify({'success': True, 'data': result}), 200
+        status = 202 if result.get('status') == 'PENDING' else 200
+        return jsonify({'success': True, 'data': result}), status
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@pdf_bp.get('/status/<int:statement_id>')
+@jwt_required()
+def statement_status(statement_id):
+    profile_id = get_jwt_identity()
+    result = PDFController.get_status(statement_id, profile_id)
+    if result is None:
+        return jsonify({'error': 'Statement not found'}), 404
+    return jsonify({'success': True, 'data': result}), 200
+
+@pdf_bp.get('/telemetry')
+@jwt_required()
+def ingestion_telemetry():
+    """The caller's recent per-file ingestion telemetry (?bank=, ?limit=) with per-parser aggregates."""
+    limit = min(request.args.get('limit', 200, type=int), 5000)
+    runs = telemetry.recent(limit, request.args.get('bank'), profile_id=get_jwt_identity())
+    return jsonify({'success': True, 'data': {'summary': telemetry.summarize(runs), 'runs': runs}}), 200
+
+@pdf_bp.get('/telemetry/all')
+@jwt_required()
+def ingestion_telemetry_all():
+    """Per-bank/parser aggregates over everyone's recent runs (?bank=, ?limit=); telemetry admins only."""
+    if str(get_jwt_identity()) not in IngestionConfig.TELEMETRY_ADMINS:
+        return jsonify({'error': 'Forbidden'}), 403
+    limit = min(request.args.get('limit', 1000, type=int), 20000)
+    runs = telemetry.recent(limit, request.args.get('bank'))
+    return jsonify({'success': True, 'data': {'summary': telemetry.summarize(runs)}}), 200
+
 @pdf_bp.get('/download/<filename>')
 @jwt_required()
 def download_csv(filename):
+    """An output file as written (.csv or .parquet); the .csv of a Parquet output is exported on first request."""
+    export_csv(current_app.config['OUTPUT_FOLDER'], filename)
     return send_from_directory(
         current_app.config['OUTPUT_FOLDER'], 
         filename, 
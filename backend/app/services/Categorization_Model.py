@@ -1,3 +1,4 @@
+import os
 import re
 import sys
 import pandas as pd
@@ -266,10 +267,29 @@ class OptimizedFinalClassifier:
         return rule_cat, rule_conf
 
 
+    # ------------------- Classify Full Parquet -------------------
+    def _classify_parquet(self, file: str):
+        # Only Description is converted; the other columns stay in the
+        # memory-mapped Arrow table and are written back untouched.
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(file, memory_map=True)
+        predictions = [self.predict(d) for d in table.column("Description").to_pylist()]
+        table = table.append_column("Category", pa.array([cat for cat, _ in predictions], pa.string()))
+        table = table.append_column("Confidence", pa.array([conf for _, conf in predictions], pa.float64()))
+
+        outfile = os.path.splitext(file)[0] + "_optimized_final.parquet"
+        pq.write_table(table, outfile)
+        print("Written:", outfile)
+
     # ------------------- Classify Full CSV -------------------
     def classify_files(self, csv_files: List[str]):
         for file in csv_files:
             print("Classifying:", file)
+            if file.endswith(".parquet"):
+                self._classify_parquet(file)
+                continue
             df = pd.read_csv(file)
 
             out_cat = []
@@ -292,8 +312,9 @@ if __name__ == "__main__":
     # Get outputs directory
     outputs_dir = os.path.join("..", "..", "storage", "outputs")
     
-    # List all CSV files
-    csv_files = [f for f in os.listdir(outputs_dir) if f.endswith('.csv') and not f.endswith('_optimized_final.csv')]
+    # List all CSV / Parquet outputs
+    csv_files = [f for f in os.listdir(outputs_dir)
+                 if f.endswith(('.csv', '.parquet')) and not os.path.splitext(f)[0].endswith('_optimized_final')]
     
     if not csv_files:
         print("No CSV files found in storage/outputs/")
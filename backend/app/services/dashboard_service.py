@@ -1,5 +1,6 @@
 from sqlalchemy import func, extract
 from app import db
+from app.models.bank_statement import BankStatement
 from app.models.transaction import Transaction
 from app.models.transaction_category import TransactionCategory
 
@@ -46,6 +47,10 @@ class DashboardService:
             Transaction.debit_amount.isnot(None)
         )
         
+        if start_date or end_date:
+            # Skip statements whose period lies outside the range before touching their rows
+            statements = BankStatement.in_period(profile_id, start_date, end_date).with_entities(BankStatement.file_id)
+            query = query.filter(Transaction.statement_id.in_(statements.scalar_subquery()))
         if start_date:
             query = query.filter(Transaction.transaction_date >= start_date)
         if end_date:
@@ -0,0 +1 @@
+# Bank parser modules; each registers itself with ingestion.registry on import.
@@ -0,0 +1,9 @@
+# modules/ingestion/banks/generic.py
+# Banks without a dedicated layout yet: parsed with the HDFC-like text parser
+# and validated by the HDFC-like splitter under their own bank name.
+from ..registry import register_bank
+from ..validator import split_std_rejects_hdfc_like
+from .hdfc import HdfcPageParser
+
+for _bank in ("AXIS", "CUB", "IDFC"):
+    register_bank(_bank, parser=HdfcPageParser, validator=split_std_rejects_hdfc_like)
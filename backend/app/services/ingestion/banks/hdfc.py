@@ -0,0 +1,197 @@
+# modules/ingestion/banks/hdfc.py
+import re
+from bisect import bisect
+import pandas as pd
+from app.config import IngestionConfig
+from ..extract import DATE_RE, NUM_RE, PageParser
+from ..registry import register_bank
+from ..validator import split_std_rejects_hdfc_like
+
+# ======================================================================
+# HDFC
+# ======================================================================
+
+class HdfcPageParser(PageParser):
+    bank = "HDFC"
+    columns = ["Date", "Narration", "Chq/Ref No", "Debit", "Credit", "Balance"]
+
+    def parse_page(self, doc, index: int) -> list:
+        rows = []
+        # Use extract_text with layout to preserve structure
+        text = doc.page_text(index)
+        if not text:
+            return rows
+
+        lines = text.split('\n')
+        in_transaction_section = False
+
+        for line in lines:
+            # Skip noise; nothing after the end-of-statement marker is parsed
+            rule = self.noise.classify(line)
+            if rule == "end_of_statement":
+                self.ended = True
+                break
+            if rule:
+                continue
+
+            # Check if we're in transaction section
+            if "Date" in line and "Narration" in line and ("Withdrawal" in line or "Deposit" in line):
+                in_transaction_section = True
+                continue
+
+            if not in_transaction_section:
+                continue
+
+            # Match transaction line: starts with date DD/MM/YY
+            if DATE_RE.match(line.strip()):
+                parts = line.split()
+                if len(parts) < 4:
+                    continue
+
+                date = parts[0]
+
+                # Find amounts (last 3 values are typically: withdrawal, deposit, balance)
+                amounts = [p.replace(',', '') for p in parts if NUM_RE.match(p.replace(',', ''))]
+
+                if len(amounts) >= 1:
+                    balance = amounts[-1]
+                    withdrawal = amounts[-3] if len(amounts) >= 3 else ""
+                    deposit = amounts[-2] if len(amounts) >= 2 else ""
+
+                    # Extract narration (everything between date and amounts)
+                    narration_parts = []
+                    for p in parts[1:]:
+                        if not NUM_RE.match(p.replace(',', '')):
+                            narration_parts.append(p)
+                        else:
+                            break
+
+                    narration = " ".join(narration_parts)
+
+                    rows.append([date, narration, "", withdrawal, deposit, balance])
+        return rows
+
+
+# Header words that open each column, in page order. Value Dt is located so
+# its band does not swallow neighbours, but it is not emitted.
+HDFC_WORD_COLUMNS = [
+    ("Date", re.compile(r"^Date$", re.I)),
+    ("Narration", re.compile(r"^Narration", re.I)),
+    ("Chq/Ref No", re.compile(r"^(?:Chq|Ref)", re.I)),
+    ("Value Dt", re.compile(r"^Value", re.I)),
+    ("Debit", re.compile(r"^Withdrawal", re.I)),
+    ("Credit", re.compile(r"^Deposit", re.I)),
+    ("Balance", re.compile(r"^Closing", re.I)),
+]
+HDFC_AMOUNT_COLUMNS = {"Debit", "Credit", "Balance"}
+
+
+def _word_lines(words: list, tolerance: float = 3.0) -> list:
+    """Group extract_words() output into lines (top-to-bottom, words left-to-right)."""
+    lines = []
+    for w in sorted(words, key=lambda w: (round(w["top"]), w["x0"])):
+        if lines and abs(lines[-1][0]["top"] - w["top"]) <= tolerance:
+            lines[-1].append(w)
+        else:
+            lines.append([w])
+    return [sorted(line, key=lambda w: w["x0"]) for line in lines]
+
+
+def _header_bands(line: list):
+    """
+    (column names, boundaries) from a header line, or None if it is not the
+    HDFC header. Boundaries are the midpoints of the gaps between adjacent
+    header cells, so `bisect(boundaries, x)` maps an x-centre to a column.
+    """
+    if not HDFC_WORD_COLUMNS[0][1].match(line[0]["text"]):
+        return None
+    bands, current = {}, None
+    for w in line:
+        for name, pattern in HDFC_WORD_COLUMNS:
+            if name not in bands and pattern.match(w["text"]):
+                current = name
+                bands[name] = [w["x0"], w["x1"]]
+                break
+        else:
+            if current:
+                bands[current][1] = w["x1"]
+    if not ({"Date", "Narration", "Balance"} <= bands.keys() and bands.keys() & {"Debit", "Credit"}):
+        return None
+    names = list(bands)
+    spans = list(bands.values())
+    boundaries = [(left[1] + right[0]) / 2 for left, right in zip(spans, spans[1:])]
+    return names, boundaries
+
+
+class HdfcWordsPageParser(HdfcPageParser):
+    """
+    HDFC parser on `extract_words()` instead of `extract_text()`: tokens go
+    to the column whose header x-band they overlap, so a row with an empty
+    Withdrawal or Deposit cell keeps its amounts in the right columns, and
+    the Chq./Ref.No. cell is kept. Column bands are learned from each page's header
+    row and carried over to pages that do not repeat it. As in text mode,
+    only lines starting with a date are transactions.
+    """
+    prefetch_kind = "words"
+
+    def parse_page(self, doc, index: int) -> list:
+        rows = []
+        bands = self.state.get("bands")
+        for line in _word_lines(doc.page_words(index)):
+            text = " ".join(w["text"] for w in line)
+            rule = self.noise.classify(text)
+            if rule == "end_of_statement":
+                self.ended = True
+                break
+            header = _header_bands(line)
+            if header:
+                bands = self.state["bands"] = header
+                continue
+            if rule or not bands or not DATE_RE.match(line[0]["text"]):
+                continue
+
+            names, boundaries = bands
+            cells = {name: [] for name in names}
+            for w in line[1:]:
+                cells[names[bisect(boundaries, (w["x0"] + w["x1"]) / 2)]].append(w["text"])
+            amounts = {
+                name: " ".join(cells.get(name, [])).replace(",", "")
+                for name in HDFC_AMOUNT_COLUMNS
+            }
+            if not amounts["Balance"]:
+                continue
+            rows.append([
+                line[0]["text"],
+                " ".join(cells["Narration"]),
+                " ".join(cells.get("Chq/Ref No", [])),
+                amounts["Debit"],
+                amounts["Credit"],
+                amounts["Balance"],
+            ])
+        return rows
+
+
+def hdfc_parser() -> HdfcPageParser:
+    """HDFC parser for the configured mode (IngestionConfig.HDFC_PARSER_MODE)."""
+    if IngestionConfig.HDFC_PARSER_MODE == "words":
+        return HdfcWordsPageParser()
+    return HdfcPageParser()
+
+
+def parse_hdfc_df(source, mode: str = None) -> pd.DataFrame:
+    """
+    Extract HDFC transactions from PDF statement.
+    `source` is a PDF path or an open StatementDocument; `mode` ('text' or
+    'words') overrides IngestionConfig.HDFC_PARSER_MODE.
+    Returns: DataFrame with columns [Date, Narration, Chq/Ref No, Debit, Credit, Balance]
+    """
+    if mode is None:
+        parser = hdfc_parser()
+    else:
+        parser = HdfcWordsPageParser() if mode == "words" else HdfcPageParser()
+    df = parser.parse(source)
+    print(f"[HDFC] Extracted {len(df)} transactions")
+    return df
+
+
+register_bank("HDFC", parser=hdfc_parser, validator=split_std_rejects_hdfc_like)
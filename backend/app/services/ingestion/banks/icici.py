@@ -0,0 +1,82 @@
+# modules/ingestion/banks/icici.py
+import pandas as pd
+from ..extract import PageParser
+from ..layout import TableTemplate
+from ..registry import register_bank
+from ..validator import split_std_rejects_icici
+
+# ======================================================================
+# ICICI
+# ======================================================================
+
+ICICI_TABLE_COLUMNS = [
+    "S.No", "Value Date", "Transaction Date", "Cheque Number",
+    "Transaction Remarks", "Withdrawal Amount (INR)",
+    "Deposit Amount (INR)", "Balance (INR)"
+]
+
+# Transaction grid starts at the "S.No ... Balance (INR)" header row
+ICICI_TABLE_TEMPLATE = TableTemplate("ICICI", first_header=r"^S\.?\s*No", last_header=r"^Balance")
+
+
+class IciciPageParser(PageParser):
+    """
+    Robust ICICI Bank PDF parser that handles multi-line grid-based tables.
+    Extracts Value Date, Transaction Date, Remarks, Debit, Credit, Balance.
+    """
+    bank = "ICICI"
+    columns = ["Date", "Narration", "Debit", "Credit", "Balance"]
+    prefetch_kind = "tables"
+    table_template = ICICI_TABLE_TEMPLATE
+
+    def parse_page(self, doc, index: int) -> list:
+        rows = []
+        for table in doc.page_tables(index, self.region):
+            if not table:
+                continue
+            for r in table:
+                row = [str(x).strip().replace("\n", " ") if x else "" for x in r]
+                # Skip header or empty lines
+                joined = " ".join(row).lower()
+                if "transaction remarks" in joined or "value date" in joined or "balance" in joined:
+                    continue
+                if not any(row):
+                    continue
+
+                rows.append(row)
+        return rows
+
+    def to_frame(self, rows: list) -> pd.DataFrame:
+        # Infer layout: first 8 columns of the grid (narrow rows are padded)
+        df = pd.DataFrame(rows).reindex(columns=range(8)).astype(object)
+        df.columns = ICICI_TABLE_COLUMNS
+
+        # Filter valid transaction rows only (contains dates)
+        df = df[df["Transaction Date"].str.match(r"\d{2}/\d{2}/\d{4}", na=False)]
+
+        # Build standardized DataFrame
+        df_std = pd.DataFrame({
+            "Date": df["Transaction Date"].fillna(df["Value Date"]),
+            "Narration": df["Transaction Remarks"],
+            "Debit": df["Withdrawal Amount (INR)"].replace(",", "", regex=True),
+            "Credit": df["Deposit Amount (INR)"].replace(",", "", regex=True),
+            "Balance": df["Balance (INR)"].replace(",", "", regex=True)
+        })
+
+        # Drop invalid or blank rows
+        df_std = df_std[df_std["Date"].notna() & df_std["Narration"].notna()]
+        df_std = df_std[df_std["Date"].str.contains(r"\d{2}/\d{2}/\d{4}")]
+        return df_std
+
+
+def parse_icici_df(source) -> pd.DataFrame:
+    """
+    Extract ICICI transactions from PDF statement.
+    `source` is a PDF path or an open StatementDocument.
+    """
+    df_std = IciciPageParser().parse(source)
+    print(f"[ICICI] Extracted {len(df_std)} valid transactions.")
+    return df_std
+
+
+register_bank("ICICI", parser=IciciPageParser, validator=split_std_rejects_icici)
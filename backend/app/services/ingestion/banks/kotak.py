@@ -0,0 +1,141 @@
+# modules/ingestion/banks/kotak.py
+import re
+import pandas as pd
+from ..extract import DATE_RE, PageParser
+from ..registry import register_bank
+from ..validator import split_std_rejects_kotak
+
+# ======================================================================
+# KOTAK
+# ======================================================================
+
+# Perfect tail core: "<amt>(Dr|Cr) <bal>(Dr|Cr)"
+KOTAK_TAIL_CORE = re.compile(
+    r"(?P<amount>\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)\s*\((?P<ad>Dr|Cr)\)\s+"
+    r"(?P<balance>\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)\s*\((?P<bd>Dr|Cr)\)"
+)
+
+# Stuff that sometimes appears AFTER a valid tail (we strip it)
+POST_TAIL_GARBAGE = re.compile(
+    r"(?:"
+    r"\s+for\s+pin"
+    r"|"
+    r"\s+[A-Z]{3,}\d{6,}(?:/\d{2}[:.]\d{2})?"       # BRKAN020725/17:26
+    r"|"
+    r"\s+/(?:[A-Za-z0-9-]{3,}(?:\s+[A-Za-z0-9-]{2,})*)\b"  # /JIO20PT..., /REFUND TO BEN, /KreditPe
+    r"|"
+    r"\s+FASTAG\b"
+    r")+\s*$",
+    re.I
+)
+
+def _strip_post_tail_garbage(s: str) -> str:
+    if KOTAK_TAIL_CORE.search(s):
+        s = POST_TAIL_GARBAGE.sub("", s)
+    return s.strip()
+
+def _try_match_kotak_tail(s: str):
+    """Return (amount(ad), balance(bd)) or None."""
+    s2 = _strip_post_tail_garbage(s)
+    m = KOTAK_TAIL_CORE.search(s2)
+    if not m:
+        return None
+    amt = f"{m.group('amount')}({m.group('ad')})"
+    bal = f"{m.group('balance')}({m.group('bd')})"
+    return amt, bal
+
+# Characters a KOTAK_TAIL_CORE match can consist of. A tail that straddles a
+# line break can only start inside the trailing run of these characters.
+_KOTAK_TAIL_CHARS = re.compile(r"[\d,.\s()DrC]*\Z")
+
+
+class KotakPageParser(PageParser):
+    """
+    Strategy:
+      - Accumulate lines from a date until a Kotak tail appears in the narration.
+      - If tail found, strip tail+garbage and emit.
+      - On new date without tail, emit incomplete (validator may reject).
+
+    Tail detection is incremental: once the accumulated text is known to be
+    tail-free, each new line is searched together with only the trailing
+    run of tail characters before it (`cur['tail']`), so per-line cost does
+    not grow with narration length. (A tail exists in the joined text iff
+    KOTAK_TAIL_CORE matches it: the post-tail garbage never contains ')'.)
+    The open record (`state['cur']`) carries over page breaks.
+    """
+    bank = "KOTAK"
+    columns = ["Date", "Narration", "Amount (Dr/Cr)", "Balance (Dr/Cr)"]
+
+    def __init__(self):
+        super().__init__()
+        self.state = {"cur": None}
+
+    def _emit(self, recs: list, joined: str, has_tail: bool):
+        cur = self.state["cur"]
+        if has_tail:
+            amt_s, bal_s = _try_match_kotak_tail(joined)
+            narr = KOTAK_TAIL_CORE.sub("", _strip_post_tail_garbage(joined)).strip()
+            recs.append([cur["date"], narr, amt_s, bal_s])
+        else:
+            recs.append([cur["date"], joined, "", ""])
+        self.state["cur"] = None
+
+    def _flush(self, recs: list):
+        """Close the open record at a new date or at the end of the statement."""
+        cur = self.state["cur"]
+        if not cur:
+            return
+        joined = " ".join(cur["narr"]).strip()
+        has_tail = not cur["checked"] and KOTAK_TAIL_CORE.search(joined) is not None
+        self._emit(recs, joined, has_tail)
+
+    def _append(self, recs: list, raw: str):
+        cur = self.state["cur"]
+        if cur["checked"]:
+            window = f"{cur['tail']} {raw}" if cur["tail"] else raw
+        else:
+            window = " ".join(cur["narr"] + [raw]).strip()
+        cur["narr"].append(raw)
+        if KOTAK_TAIL_CORE.search(window):
+            self._emit(recs, " ".join(cur["narr"]).strip(), has_tail=True)
+            return
+        cur["checked"] = True
+        cur["tail"] = _KOTAK_TAIL_CHARS.search(window).group().strip()
+
+    def parse_page(self, doc, index: int) -> list:
+        recs = []
+        for raw in doc.page_lines(index):
+            rule = self.noise.classify(raw)
+            if rule == "end_of_statement":
+                self.ended = True
+                break
+            if rule:
+                continue
+            if DATE_RE.match(raw):
+                self._flush(recs)
+                parts = raw.split(maxsplit=1)
+                date = parts[0]
+                rest = parts[1] if len(parts) > 1 else ""
+                self.state["cur"] = {
+                    "date": date, "narr": [rest] if rest else [], "tail": "", "checked": False,
+                }
+            elif self.state["cur"]:
+                self._append(recs, raw)
+        return recs
+
+    def finish(self) -> list:
+        recs = []
+        self._flush(recs)
+        return recs
+
+
+def parse_kotak_df(source) -> pd.DataFrame:
+    """
+    Extract Kotak transactions from PDF statement.
+    `source` is a PDF path or an open StatementDocument.
+    Returns: DataFrame with columns [Date, Narration, Amount (Dr/Cr), Balance (Dr/Cr)]
+    """
+    return KotakPageParser().parse(source)
+
+
+register_bank("KOTAK", parser=KotakPageParser, validator=split_std_rejects_kotak)
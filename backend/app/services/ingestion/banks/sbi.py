@@ -0,0 +1,114 @@
+# modules/ingestion/banks/sbi.py
+import re
+import pandas as pd
+from ..extract import PageParser
+from ..layout import TableTemplate
+from ..registry import register_bank
+from ..validator import split_std_rejects_sbi
+
+# ======================================================================
+# SBI
+# ======================================================================
+
+SBI_HEADER_RE = re.compile(
+    r"^Txn\s+Date\s+Value\s+Date\s+Description\s+Ref\s*No\./Cheque\s*No\.\s+Debit\s+Credit\s+Balance\s*$",
+    re.I,
+)
+
+SBI_COLUMNS = ["Date", "Narration", "Ref_No", "Debit", "Credit", "Balance"]
+
+# Transaction grid starts at the "Txn Date ... Balance" header row
+SBI_TABLE_TEMPLATE = TableTemplate("SBI", first_header=r"^Txn$", last_header=r"^Balance$")
+
+
+class SbiPageParser(PageParser):
+    """
+    Works for tables with columns:
+      Txn Date | Value Date | Description | Ref No./Cheque No. | Debit | Credit | Balance
+    Rows of a page are the per-table DataFrames found under a header row.
+    """
+    bank = "SBI"
+    columns = SBI_COLUMNS
+    prefetch_kind = "tables"
+    table_template = SBI_TABLE_TEMPLATE
+
+    def parse_page(self, doc, index: int) -> list:
+        page_tables = []
+        try:
+            tables = doc.page_tables(index, self.region)
+            for t in tables:
+                if not t:
+                    continue
+                # Find header row
+                header_row = None
+                for i, row in enumerate(t):
+                    joined = " ".join(str(c or "") for c in row)
+                    if re.search(r"Txn\s*Date", joined, flags=re.I) and re.search(r"Balance", joined, flags=re.I):
+                        header_row = i
+                        break
+                if header_row is not None:
+                    header = [c.strip() if c else "" for c in t[header_row]]
+                    data_rows = t[header_row + 1:]
+                    df = pd.DataFrame(data_rows, columns=header)
+                    page_tables.append(df)
+        except Exception:
+            return []
+        return page_tables
+
+    def to_frame(self, rows: list) -> pd.DataFrame:
+        df_raw = pd.concat(rows, ignore_index=True)
+
+        # --- Relaxed mapping ---
+        col_map = {}
+        for c in df_raw.columns:
+            cname = c.strip().lower().replace(".", "").replace("/", "")
+            if "txn" in cname and "date" in cname:
+                col_map[c] = "Date"
+            elif "desc" in cname:
+                col_map[c] = "Narration"
+            elif "ref" in cname or "cheque" in cname:
+                col_map[c] = "Ref_No"
+            elif "debit" in cname:
+                col_map[c] = "Debit"
+            elif "credit" in cname:
+                col_map[c] = "Credit"
+            elif "balance" in cname:
+                col_map[c] = "Balance"
+
+        df_raw.rename(columns=col_map, inplace=True)
+
+        # --- Ensure all expected columns exist ---
+        for col in SBI_COLUMNS:
+            if col not in df_raw.columns:
+                df_raw[col] = ""
+
+        # --- Clean data ---
+        for col in ["Date", "Narration", "Debit", "Credit", "Balance"]:
+            df_raw[col] = (
+                df_raw[col]
+                .astype(str)
+                .str.replace(",", "", regex=False)
+                .str.replace(r"\s+", " ", regex=True)
+                .str.strip()
+            )
+
+        # --- Drop totals and blank rows ---
+        df_raw = df_raw[~df_raw["Date"].str.contains("Total|Closing|Opening", case=False, na=False)]
+        df_raw = df_raw[df_raw["Date"].str.strip() != ""]
+
+        return df_raw[SBI_COLUMNS]
+
+    def empty_frame(self) -> pd.DataFrame:
+        print("[WARN] No table detected in SBI statement.")
+        return pd.DataFrame()
+
+
+def parse_sbi_df(source) -> pd.DataFrame:
+    """
+    Extract transactions from SBI PDF statements.
+    `source` is a PDF path or an open StatementDocument.
+    """
+    return SbiPageParser().parse(source)
+
+
+register_bank("SBI", parser=SbiPageParser, validator=split_std_rejects_sbi)
@@ -0,0 +1,196 @@
+# modules/ingestion/batch.py
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+import pandas as pd
+from app.config import IngestionConfig
+from .detect import detect_bank_scored
+from .document import StatementDocument
+from .extract import iter_transactions
+from .registry import is_supported
+from .sandbox import SandboxError, pool_context, run_sandboxed
+from .standardize import COMMON_COLS, standardize_and_write
+from .telemetry import IngestTelemetry, failure_entry, record
+
+class AmbiguousBankError(Exception):
+    """Detection found several plausible banks; the file is rejected for review instead of parsed."""
+    reason = "ambiguous_bank"
+
+
+@dataclass
+class PdfJob:
+    """One saved upload: `path` on disk, `name` as uploaded, optional bank hint."""
+    path: str
+    name: str
+    bank_hint: str = None
+
+
+@dataclass
+class PdfResult:
+    """Outcome of one PdfJob; `timings` are seconds per phase (detect, parse, total)."""
+    name: str
+    bank: str = "UNKNOWN"
+    confidence: float = None
+    std_csv: str = None
+    rej_csv: str = None
+    error: str = None
+    timings: dict = field(default_factory=dict)
+
+
+def _write_failure(base: str, bank: str, reason: str, detail: str, trace: str, output_dir: str):
+    """Empty STD CSV plus a one-row REJECTS CSV explaining why the file produced nothing."""
+    err_bank = (bank or "UNKNOWN").upper()
+    std_path = os.path.join(output_dir, f"{base}__STD_{err_bank}.csv")
+    rej_path = os.path.join(output_dir, f"{base}__REJECTS_{err_bank}.csv")
+
+    pd.DataFrame(columns=COMMON_COLS).to_csv(std_path, index=False, encoding="utf-8-sig")
+    pd.DataFrame([{
+        "Bank_Name": err_bank,
+        "Raw_Date": "",
+        "Raw_Narration": "",
+        "Raw_Debit": "",
+        "Raw_Credit": "",
+        "Raw_Balance": "",
+        "Reason": reason,
+        "Detail": detail,
+        "Trace": trace,
+    }]).to_csv(rej_path, index=False, encoding="utf-8-sig")
+    return std_path, rej_path
+
+
+def _detect_and_parse(job: PdfJob, output_dir: str, report) -> tuple:
+    """
+    Sandbox body: detect, parse and standardize one PDF, returning its
+    (std_csv, rej_csv). The bank and detection time are reported as soon as
+    they are known so the parent can label a timeout or crash; the file's
+    telemetry record is reported once it is written.
+    """
+    started = time.perf_counter()
+    base = os.path.splitext(os.path.basename(job.path))[0]
+    telemetry = IngestTelemetry(job.name, job.bank_hint)
+
+    # --- Open once: detection and parsing share the extracted pages ---
+    with StatementDocument(job.path) as doc:
+        with telemetry.stage("open"):
+            telemetry.pages = doc.page_count
+        if job.bank_hint:
+            bank, detection = job.bank_hint, None
+            print(f"[PDF] Processing {job.name} -> Bank (hint): {bank}")
+        else:
+            with telemetry.stage("detect"):
+                detection = detect_bank_scored(doc)
+            bank = telemetry.bank = detection.routed_bank
+            print(f"[PDF] Processing {job.name} -> Detected Bank: {bank} "
+                  f"(confidence {detection.confidence:.2f} after {detection.stage}; {detection.describe()})")
+        report(bank=bank, confidence=detection.confidence if detection else None,
+               detect_s=time.perf_counter() - started)
+
+        if detection is not None and detection.ambiguous:
+            raise AmbiguousBankError(
+                f"Ambiguous bank detection ({detection.describe()}); re-upload with a bank hint"
+            )
+
+        # --- Parse Based on Bank (streamed page by page) ---
+        if not is_supported(bank):
+            print(f"[WARN] Unknown bank for {job.name}. Falling back to HDFC-like parser.")
+        batches = iter_transactions(
+            doc, bank, lambda done, total: report(pages_done=done, page_count=total), telemetry
+        )
+
+        # --- Validate & Standardize ---
+        outputs = standardize_and_write(batches, bank, base, output_dir, telemetry)
+    report(telemetry=telemetry.entry())
+    return outputs
+
+
+def process_pdf(job: PdfJob, output_dir: str) -> PdfResult:
+    """
+    Detect, parse and standardize one uploaded PDF into its STD/REJECTS CSVs,
+    inside a resource-limited child process (sandbox.run_sandboxed).
+    Never raises: failures, timeouts and memory-cap breaches become a
+    REJECTS row (parser_exception / parser_timeout / parser_oom /
+    ambiguous_bank) and `error` on the result. Either way one telemetry
+    record is appended for the file.
+    """
+    started = time.perf_counter()
+    result = PdfResult(name=job.name, bank=job.bank_hint or "UNKNOWN")
+    result.timings["detect"] = 0.0
+    base = os.path.splitext(os.path.basename(job.path))[0]
+
+    def on_report(fields):
+        if "bank" in fields:
+            result.bank, result.confidence = fields["bank"], fields["confidence"]
+            result.timings["detect"] = fields["detect_s"]
+        if "telemetry" in fields:
+            record(fields["telemetry"])
+
+    try:
+        result.std_csv, result.rej_csv = run_sandboxed(_detect_and_parse, job, output_dir, progress=on_report)
+    except Exception as e:
+        reason = getattr(e, "reason", SandboxError.reason)
+        trace = getattr(e, "trace", "") or traceback.format_exc(limit=2)
+        result.std_csv, result.rej_csv = _write_failure(base, result.bank, reason, str(e), trace, output_dir)
+        result.error = str(e)
+        record(failure_entry(job.name, result.bank, reason, str(e), time.perf_counter() - started))
+        print(f"  Parser error for {job.name} ({reason}): {e}")
+
+    result.timings["total"] = time.perf_counter() - started
+    result.timings["parse"] = result.timings["total"] - result.timings["detect"]
+    return result
+
+
+def process_pdfs(jobs: list, output_dir: str, workers: int = None) -> list:
+    """
+    Run process_pdf for every job, at most `workers` files at a time
+    (IngestionConfig.UPLOAD_WORKERS by default). Results come back in job
+    order whatever order files finish in. A single file or a single worker
+    runs inline. Sandboxed files already get a child process each, so the
+    pool is then threads that only supervise; without the sandbox it is a
+    process pool. A file whose worker dies gets a parser_exception REJECTS
+    row like any other failure.
+    """
+    workers = IngestionConfig.UPLOAD_WORKERS if workers is None else workers
+    if workers <= 1 or len(jobs) <= 1:
+        return [process_pdf(job, output_dir) for job in jobs]
+
+    if IngestionConfig.SANDBOX_ENABLED:
+        executor = ThreadPoolExecutor(max_workers=min(workers, len(jobs)))
+    else:
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(jobs)), mp_context=pool_context())
+    results = []
+    started = time.perf_counter()
+    with executor as pool:
+        futures = [pool.submit(process_pdf, job, output_dir) for job in jobs]
+        for job, fut in zip(jobs, futures):
+            try:
+                results.append(fut.result())
+            except Exception as e:
+                base = os.path.splitext(os.path.basename(job.path))[0]
+                std_csv, rej_csv = _write_failure(base, job.bank_hint, "parser_exception", str(e), "", output_dir)
+                elapsed = time.perf_counter() - started  # since submission: the worker's own timings are lost
+                results.append(PdfResult(name=job.name, bank=(job.bank_hint or "UNKNOWN"),
+                                         std_csv=std_csv, rej_csv=rej_csv, error=str(e),
+                                         timings={"detect": 0.0, "parse": elapsed, "total": elapsed}))
+                print(f"  Worker failed for {job.name}: {e}")
+    return results
+
+
+def write_manifest(batch_id: str, results: list, output_dir: str) -> str:
+    """Persist a batch's per-file results (bank, outputs, timings) for the preview page."""
+    path = os.path.join(output_dir, f"{batch_id}__BATCH.json")
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump([asdict(r) for r in results], fh, indent=2)
+    return path
+
+
+def load_manifest(batch_id: str, output_dir: str) -> list:
+    """Per-file result dicts of a batch, or [] when the manifest is missing or unreadable."""
+    path = os.path.join(output_dir, f"{os.path.basename(batch_id)}__BATCH.json")
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return []
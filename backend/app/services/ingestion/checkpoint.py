@@ -0,0 +1,97 @@
+# modules/ingestion/checkpoint.py
+import json
+import os
+from app.config import IngestionConfig
+
+# Bump whenever a page record's meaning changes (parser state layout, ...)
+CHECKPOINT_VERSION = "1"
+
+
+class PageCheckpoint:
+    """
+    Append-only JSONL log of a parse in progress: one header line (learned
+    table region), then one line per finished page with its kind, the raw
+    batch it yielded, the parser's carry-over state (`PageParser.state`),
+    `ended` and the noise counts so far. A retry of the same file replays
+    the logged batches without touching the PDF and continues from the
+    first page that was not logged. A torn last line (worker killed
+    mid-write) is ignored. The file is removed once the parse completes.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = None
+        self._valid_bytes = None
+
+    def records(self):
+        """
+        Yield the header, then page records, in order; stops at the first
+        unreadable line, which later appends overwrite.
+        """
+        self._valid_bytes = 0
+        try:
+            with open(self.path, "rb") as fh:
+                for line in fh:
+                    if not line.endswith(b"\n"):
+                        return
+                    try:
+                        rec = json.loads(line.decode("utf-8"))
+                    except ValueError:
+                        return
+                    self._valid_bytes += len(line)
+                    yield rec
+        except OSError:
+            return
+
+    def _append(self, rec: dict):
+        if self._fh is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._fh = open(self.path, "a", encoding="utf-8")
+            if self._valid_bytes is not None:
+                self._fh.truncate(self._valid_bytes)  # drop a torn tail before resuming
+        self._fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        self._fh.flush()
+
+    def start(self, region):
+        """Begin a fresh log (dropping any torn one) with the learned region (a dict or None)."""
+        self.discard()
+        self._valid_bytes = None
+        self._append({"header": True, "region": region})
+
+    def page(self, index: int, kind: str, batch, state: dict, ended: bool, noise: dict):
+        """Log one finished page; `batch` is the DataFrame it yielded, or None."""
+        frame = None if batch is None else {"columns": list(batch.columns), "data": batch.values.tolist()}
+        self._append({
+            "page": index, "kind": kind, "batch": frame, "state": state, "ended": ended, "noise": noise,
+        })
+
+    def close(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def discard(self):
+        """Delete the log (parse finished, or restarting from scratch)."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def page_checkpoint(doc, parser):
+    """
+    Checkpoint for parsing `doc` with `parser`, keyed by the document's cache
+    key and the parser class, or None when disabled or the document has
+    fewer than IngestionConfig.CHECKPOINT_MIN_PAGES pages.
+    """
+    if not IngestionConfig.CHECKPOINT_ENABLED:
+        return None
+    try:
+        if doc.page_count < IngestionConfig.CHECKPOINT_MIN_PAGES:
+            return None
+        key = doc.cache_key
+    except Exception:
+        return None  # unreadable file: let the parser raise
+    name = f"{key}-{type(parser).__name__}-v{CHECKPOINT_VERSION}.jsonl"
+    return PageCheckpoint(os.path.join(IngestionConfig.CHECKPOINT_DIR, name))
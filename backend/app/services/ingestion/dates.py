@@ -0,0 +1,77 @@
+# modules/ingestion/dates.py
+import re
+from datetime import datetime
+from functools import lru_cache
+import pandas as pd
+
+# Statement date layouts, after normalize_dates ('/', dashes and spaces -> '-').
+# No two of them read the same string differently (year widths and field
+# order differ, %b/%B agree), so the format that parses a value is unique
+# and the dominant-format pass gives the same dates as trying them in order.
+DATE_FORMATS = (
+    "%d-%b-%y", "%d-%b-%Y", "%d-%B-%y", "%d-%B-%Y",
+    "%d-%m-%y", "%d-%m-%Y",
+    "%Y-%m-%d",
+)
+SAMPLE_SIZE = 200  # distinct values looked at to infer the column's format
+
+# datetime64[ns] range: dates outside it (e.g. '01/08/0025') count as unparseable
+_MIN_DATE = (pd.Timestamp.min + pd.Timedelta(days=1)).date()
+_MAX_DATE = pd.Timestamp.max.date()
+
+_DASHES = re.compile(r"[–—/]")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_date(text: str) -> str:
+    """normalize_dates for one string."""
+    return _SPACES.sub("-", _DASHES.sub("-", str(text).strip()))
+
+
+def normalize_dates(values: pd.Series) -> pd.Series:
+    """Stripped strings with '/', en/em dashes and whitespace runs as '-'; missing -> ''."""
+    text = values.astype(object).where(values.notna(), "").astype(str).str.strip()
+    return text.str.replace(_DASHES, "-", regex=True).str.replace(_SPACES, "-", regex=True)
+
+
+@lru_cache(maxsize=4096)
+def parse_date(text: str, formats: tuple = DATE_FORMATS):
+    """One normalized date string -> date via the first format that fits, or None (also outside datetime64 range)."""
+    for fmt in formats:
+        try:
+            parsed = datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+        return parsed if _MIN_DATE <= parsed <= _MAX_DATE else None
+    return None
+
+
+def infer_format(text: pd.Series, formats: tuple = DATE_FORMATS):
+    """The format parsing most of the first SAMPLE_SIZE non-empty values of `text`, or None."""
+    sample = text[text.ne("")][:SAMPLE_SIZE]
+    if sample.empty:
+        return None
+    hits = {fmt: pd.to_datetime(sample, format=fmt, errors="coerce").notna().sum() for fmt in formats}
+    best = max(formats, key=hits.get)  # first of the formats on ties
+    return best if hits[best] else None
+
+
+def parse_date_column(values: pd.Series, formats: tuple = DATE_FORMATS, normalize: bool = True) -> pd.Series:
+    """
+    Date column -> datetime64 (NaT where nothing fits). Work is done on the
+    distinct strings: the dominant format is inferred from a sample of them
+    and applied in one pass, and the few it misses go through parse_date.
+    """
+    text = normalize_dates(values) if normalize else values.astype(object).where(values.notna(), "").astype(str)
+    codes, uniques = pd.factorize(text)
+    uniques = pd.Series(uniques, dtype=object)
+    fmt = infer_format(uniques, formats)
+    if fmt is None:
+        parsed = pd.Series(pd.NaT, index=uniques.index, dtype="datetime64[ns]")
+    else:
+        parsed = pd.to_datetime(uniques, format=fmt, errors="coerce").astype("datetime64[ns]")
+    missed = parsed.isna() & uniques.ne("")
+    if missed.any():
+        stragglers = uniques[missed].map(lambda v: parse_date(v, formats))
+        parsed[missed] = pd.to_datetime(stragglers, errors="coerce").astype("datetime64[ns]")
+    return pd.Series(parsed.to_numpy()[codes], index=text.index, dtype="datetime64[ns]")
@@ -1,51 +1,133 @@
 import re
-import pdfplumber
-
-BANK_PATTERNS = {
-    "HDFC": [
-        r"\bHDFC\s*BANK\b",
-        r"\bHDFC\s*BANK\s*LTD\b",
-        r"\bHDFCBANKLTD\b",
-        r"\bHDFCBANK\b",
-        r"Statement\s*of\s*account.*HDFC",
-    ],
-    "KOTAK": [
-        r"\bKOTAK\s*MAHINDRA\s*BANK\b",
-        r"\bKOTAK\b",
-    ],
-    "SBI": [
-        r"\bSTATE\s*BANK\s*OF\s*INDIA\b",
-        r"\bSBI\b",
-        # Generalized - works with or without dates
-        r"Account\s*Statement.*State\s*Bank\s*of\s*India",
-        r"Account\s*Statement.*SBI",
-    ],
-   "ICICI": [
-        r"\bICICI\s*BANK\b",
-        r"Account\s*Statement.*ICICI",
-        r"ICICIBANK",
-    ],
+from dataclasses import asdict, dataclass, field
+from .document import open_document
+from .registry import DETECT_PATTERNS
+
+# Bump whenever patterns, weights or thresholds change: cached results are
+# keyed by it.
+DETECT_VERSION = "1"
+
+# Evidence stages, cheapest first, with the multiplier applied to pattern
+# weights found in each. Branding in the PDF producer/title or the page-1
+# letterhead is far stronger evidence than a name buried in a narration.
+STAGE_METADATA = "metadata"
+STAGE_HEADER = "header"
+STAGE_TEXT = "text"
+STAGE_WEIGHTS = {STAGE_METADATA: 2.0, STAGE_HEADER: 1.5, STAGE_TEXT: 1.0}
+
+# Stop after a stage once the leader has this much evidence and at least
+# EARLY_EXIT_MARGIN times the runner-up's.
+EARLY_EXIT_SCORE = 3.0
+EARLY_EXIT_MARGIN = 2.0
+
+# Score of one full-name match; weaker leaders get proportionally less confidence
+STRONG_SCORE = 3.0
+# Below this a detected bank is reported as ambiguous instead of routed
+MIN_CONFIDENCE = 0.6
+
+_COMPILED = {
+    bank: [(re.compile(pat, re.I), weight) for pat, weight in patterns]
+    for bank, patterns in DETECT_PATTERNS.items()
 }
 
-def detect_bank(pdf_path: str) -> str:
+
+@dataclass
+class DetectionResult:
+    """
+    Outcome of bank detection. `ranking` is [(bank, score), ...] best first
+    (banks with no evidence omitted); `confidence` is the leader's share of
+    all evidence, scaled down when even the leader has only weak signals.
+    `stage` names the last evidence stage read before deciding.
+    """
+    bank: str
+    confidence: float = 0.0
+    ranking: list = field(default_factory=list)
+    stage: str = ""
+
+    @property
+    def ambiguous(self) -> bool:
+        return self.bank != "UNKNOWN" and self.confidence < MIN_CONFIDENCE
+
+    @property
+    def routed_bank(self) -> str:
+        """Bank to parse with: the leader, or 'UNKNOWN' when there is none or it is ambiguous."""
+        return "UNKNOWN" if self.ambiguous else self.bank
+
+    def describe(self) -> str:
+        return ", ".join(f"{bank}={score:g}" for bank, score in self.ranking) or "no bank signals"
+
+
+def _score_text(text: str, multiplier: float, scores: dict):
+    """Add the weights of every distinct pattern matching `text`, scaled by `multiplier`."""
+    if not text:
+        return
+    for bank, patterns in _COMPILED.items():
+        for rx, weight in patterns:
+            if rx.search(text):
+                scores[bank] = scores.get(bank, 0.0) + weight * multiplier
+
+
+def _decisive(scores: dict) -> bool:
+    ranked = sorted(scores.values(), reverse=True)
+    if not ranked or ranked[0] < EARLY_EXIT_SCORE:
+        return False
+    return len(ranked) == 1 or ranked[0] >= EARLY_EXIT_MARGIN * ranked[1]
+
+
+def _result(scores: dict, stage: str) -> DetectionResult:
+    ranking = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+    if not ranking:
+        return DetectionResult("UNKNOWN", 0.0, [], stage)
+    bank, top = ranking[0]
+    total = sum(score for _, score in ranking)
+    confidence = (top / total) * min(1.0, top / STRONG_SCORE)
+    if len(ranking) > 1 and ranking[1][1] == top:
+        confidence = min(confidence, 0.5)  # a tie is never routed on dict order
+    return DetectionResult(bank, round(confidence, 3), [(b, round(s, 2)) for b, s in ranking], stage)
+
+
+def _stages(doc):
+    """(stage, text) pairs, cheapest first; later ones are only extracted when needed."""
+    yield STAGE_METADATA, " ".join(doc.metadata.values())
+    if not doc.page_count:
+        return
+    yield STAGE_HEADER, doc.page_probe(0)["head"]
+    yield STAGE_TEXT, "\n".join(doc.page_text(i) for i in range(min(2, doc.page_count)))
+
+
+def _detect(doc) -> DetectionResult:
+    scores, stage = {}, ""
+    for stage, text in _stages(doc):
+        _score_text(text, STAGE_WEIGHTS[stage], scores)
+        if _decisive(scores):
+            break
+    return _result(scores, stage)
+
+
+def detect_bank_scored(source) -> DetectionResult:
     """
-    Detects the issuing bank from the first 2 pages of a PDF statement.
-    Returns: 'HDFC', 'KOTAK', 'SBI', or 'UNKNOWN'
+    Scores every registered bank against the statement's cheapest signals
+    first: PDF metadata, then the page-1 header band, then the text of the
+    first 2 pages, stopping as soon as one bank clearly leads.
+    `source` is a PDF path or an open StatementDocument; the result is
+    cached with the document's extraction cache entry (per file hash).
     """
-    text = ""
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for pg in pdf.pages[:2]:  # First two pages usually enough
-                page_text = (pg.extract_text() or "").strip()
-                text += "\n" + page_text
+        with open_document(source) as doc:
+            cached = doc.remember(f"detect-v{DETECT_VERSION}", lambda: asdict(_detect(doc)))
+            return DetectionResult(
+                cached["bank"], cached["confidence"], [tuple(r) for r in cached["ranking"]], cached["stage"]
+            )
     except Exception as e:
         print(f"[WARN] Could not read PDF text: {e}")
+        return DetectionResult("UNKNOWN")
 
-    text_upper = text.upper()
 
-    for bank, patterns in BANK_PATTERNS.items():
-        for pat in patterns:
-            if re.search(pat, text_upper, flags=re.I):
-                return bank
-
-    return "UNKNOWN"
+def detect_bank(source) -> str:
+    """
+    Detects the issuing bank of a PDF statement (see detect_bank_scored).
+    `source` is a PDF path or an open StatementDocument (its page text is reused).
+    Returns: a bank registered in ingestion.registry, or 'UNKNOWN' when no
+    bank (or no single bank with enough confidence) is found
+    """
+    return detect_bank_scored(source).routed_bank
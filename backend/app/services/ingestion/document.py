@@ -0,0 +1,291 @@
+# modules/ingestion/document.py
+import json
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict
+from app.config import IngestionConfig
+from .extraction_cache import file_sha256, get_extraction_cache
+from .layout import TableRegion
+from .pdf_backends import PdfplumberBackend, backend_class
+from .sandbox import pool_context
+
+
+def _table_key(index: int, region=None):
+    """Memo/cache key for a page's tables: the page index, tagged with the region's bank when cropped."""
+    return index if region is None else f"{index}@{region.key}"
+
+
+def _extract_pages(backend_name: str, pdf_path: str, pages: list, kind: str, region=None, band=None) -> list:
+    """
+    Process-pool worker: extract `kind` ('text', 'words', 'tables' or just
+    'probe') for `pages`, as (value, probe) pairs.
+    """
+    backend = backend_class(backend_name)(pdf_path)
+    out = []
+    try:
+        for index in pages:
+            probe = backend.probe(index, band)
+            if kind == "probe":
+                value = probe
+            elif kind == "text":
+                value = backend.text(index)
+            elif kind == "words":
+                value = backend.words(index)
+            else:
+                value = backend.tables(index, region)
+            out.append((value, probe))
+            backend.release(index)
+    finally:
+        backend.close()
+    return out
+
+
+class StatementDocument:
+    """
+    One opened PDF statement shared by detection and parsing.
+    Page text, words and tables are extracted lazily and memoized per page
+    until the page is released, so every consumer of the same upload pays
+    for extraction only once.
+    Extraction goes through a PdfBackend (`backend` name, default
+    IngestionConfig.PDF_BACKEND).
+
+    Text and tables are also persisted in the extraction cache keyed by the
+    file hash (and backend); on a full hit the PDF is never opened. Released
+    pages wait for the cache entry in a temporary spill file. Pass
+    `cache=False` to bypass it, or an ExtractionCache instance to use a
+    specific one.
+    """
+
+    def __init__(self, pdf_path: str, cache=None, backend: str = None):
+        self.pdf_path = pdf_path
+        self.backend = backend_class(backend)
+        self._pdf = None
+        self._sha256 = None
+        self._page_count = None
+        self._text = {}
+        self._words = {}
+        self._tables = {}
+        self._regions = {}
+        self._probes = {}
+        self._meta = {}
+        self._dirty = False
+        self._spill = None
+        self._cache = get_extraction_cache() if cache is None else (cache or None)
+        if self._cache is not None:
+            try:
+                cached = self._cache.load(self.cache_key)
+            except OSError:
+                cached = None  # unreadable file: let the real open raise later
+            if cached:
+                self._page_count = cached["page_count"]
+                self._text.update(cached["text"])
+                self._tables.update(cached["tables"])
+                self._regions.update(cached["regions"])
+                self._probes.update(cached["probes"])
+                self._meta.update(cached["meta"])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _open(self):
+        if self._pdf is None:
+            self._pdf = self.backend(self.pdf_path)
+            # The info dictionary is parsed on open anyway; keep it for cache hits
+            self.remember("info", self._pdf.metadata)
+        return self._pdf
+
+    @property
+    def sha256(self) -> str:
+        if self._sha256 is None:
+            self._sha256 = file_sha256(self.pdf_path)
+        return self._sha256
+
+    @property
+    def cache_key(self) -> str:
+        """Extraction cache key: the file hash, suffixed with the backend unless it is pdfplumber."""
+        if self.backend is PdfplumberBackend:
+            return self.sha256
+        return f"{self.sha256}-{self.backend.name}"
+
+    @property
+    def page_count(self) -> int:
+        if self._page_count is None:
+            self._page_count = self._open().page_count
+        return self._page_count
+
+    @property
+    def metadata(self) -> dict:
+        """PDF document info fields (Title, Author, Creator, Producer, ...)."""
+        if "info" not in self._meta:
+            self._open()
+        return self._meta["info"]
+
+    def remember(self, key: str, compute):
+        """
+        Document-level value memoized under `key` and persisted in the
+        extraction cache with the pages; `compute()` runs only on a miss.
+        Values must be JSON-serializable.
+        """
+        if key not in self._meta:
+            self._meta[key] = compute()
+            self._dirty = True
+        return self._meta[key]
+
+    def page_text(self, index: int) -> str:
+        """Raw `extract_text()` output of a page ('' when the page has no text)."""
+        if index not in self._text:
+            self._text[index] = self._open().text(index)
+            self._dirty = True
+        return self._text[index]
+
+    def page_lines(self, index: int) -> list:
+        """Stripped, non-empty text lines of a page."""
+        return [ln.strip() for ln in self.page_text(index).splitlines() if ln.strip()]
+
+    def page_probe(self, index: int) -> dict:
+        """
+        Cheap pre-pass data for a page: {'chars': character count, 'head':
+        text of the top IngestionConfig.PROBE_BAND_PT points}. Used to skip
+        boilerplate pages before any text or table extraction.
+        """
+        if index not in self._probes:
+            self._probes[index] = self._open().probe(index, IngestionConfig.PROBE_BAND_PT)
+            self._dirty = True
+        return self._probes[index]
+
+    def page_words(self, index: int) -> list:
+        """Words with coordinates as returned by `extract_words()`."""
+        if index not in self._words:
+            self._words[index] = self._open().words(index)
+        return self._words[index]
+
+    def page_tables(self, index: int, region=None) -> list:
+        """
+        Tables of a page as returned by `extract_tables()`; with a TableRegion
+        only the transaction area is searched, using the region's settings.
+        """
+        key = _table_key(index, region)
+        if key not in self._tables:
+            self._tables[key] = self._open().tables(index, region)
+            self._dirty = True
+        return self._tables[key]
+
+    def table_region(self, template):
+        """TableRegion learned by `template` from page 1 (None: use the whole page)."""
+        if template.bank not in self._regions:
+            region = self._open().learn_region(template) if self.page_count else None
+            self._regions[template.bank] = asdict(region) if region else None
+            self._dirty = True
+        learned = self._regions[template.bank]
+        return TableRegion(**learned) if learned else None
+
+    def release_page(self, index: int):
+        """
+        Drop everything held for a page once a parser is done with it: the
+        backend's layout objects and the memoized words, text and tables, so
+        memory stays flat in the page count. With the extraction cache on,
+        the text and tables move to the spill file for the cache entry.
+        """
+        self._words.pop(index, None)
+        text = {index: self._text.pop(index)} if index in self._text else {}
+        keys = [index] + [f"{index}@{bank}" for bank in self._regions]
+        tables = {k: self._tables.pop(k) for k in keys if k in self._tables}
+        if self._cache is not None and (text or tables):
+            if self._spill is None:
+                self._spill = tempfile.TemporaryFile("w+", encoding="utf-8")
+            self._spill.write(json.dumps({"text": text, "tables": tables}, ensure_ascii=False) + "\n")
+        if self._pdf is not None:
+            self._pdf.release(index)
+
+    def prefetch(self, kind: str = "text", workers: int = None, min_pages: int = None, region=None,
+                 start: int = 0, select=None):
+        """
+        Extract `kind` ('text', 'words', 'tables' optionally within `region`,
+        or 'probe') for every page from `start` up front, splitting the pages
+        across a process pool when the document is large enough.
+        With `select`, the probes of those pages are fetched first (in
+        parallel as well) and only the pages `select(pages)` returns are
+        extracted, so skipped pages cost no more than their probe.
+        Results land in the same per-page memo, in page order, so parsers keep
+        iterating pages exactly as in serial mode. Small documents, a single
+        worker, or a failed chunk simply fall back to lazy serial extraction.
+        """
+        workers = IngestionConfig.PARALLEL_WORKERS if workers is None else workers
+        min_pages = max(IngestionConfig.PARALLEL_MIN_PAGES if min_pages is None else min_pages, 2)
+        pages = list(range(start, self.page_count))
+        if workers <= 1 or len(pages) < min_pages:
+            return
+        if select is not None:
+            self._extract_parallel("probe", pages, workers)
+            pages = select(pages)
+            if len(pages) < min_pages:
+                return
+        self._extract_parallel(kind, pages, workers, region)
+
+    def _extract_parallel(self, kind: str, pages: list, workers: int, region=None):
+        if kind == "probe":
+            memo, key = self._probes, (lambda i: i)
+        elif kind == "text":
+            memo, key = self._text, (lambda i: i)
+        elif kind == "words":
+            memo, key = self._words, (lambda i: i)
+        else:
+            memo, key = self._tables, (lambda i: _table_key(i, region))
+        chunk = -(-len(pages) // workers)
+        chunks = [pages[a:a + chunk] for a in range(0, len(pages), chunk)]
+        chunks = [c for c in chunks if any(key(i) not in memo or i not in self._probes for i in c)]
+        if not chunks:
+            return
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=pool_context()) as pool:
+            futures = {
+                pool.submit(
+                    _extract_pages, self.backend.name, self.pdf_path, c, kind, region,
+                    IngestionConfig.PROBE_BAND_PT,
+                ): c
+                for c in chunks
+            }
+            for fut, c in futures.items():
+                try:
+                    results = fut.result()
+                except Exception as e:
+                    print(f"[WARN] Parallel {kind} extraction failed for pages from {c[0] + 1}: {e}")
+                    continue
+                for index, (value, probe) in zip(c, results):
+                    memo.setdefault(key(index), value)
+                    self._probes.setdefault(index, probe)
+                self._dirty = True
+
+    def close(self):
+        if self._dirty and self._cache is not None:
+            self._cache.store(
+                self.cache_key, self.page_count, self._text, self._tables, self._regions, self._probes,
+                self._meta, spilled=self._spill,
+            )
+            self._dirty = False
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+
+
+@contextmanager
+def open_document(source):
+    """
+    Yield a StatementDocument for `source`, which may be a PDF path or an
+    already opened document. Only documents opened here are closed here.
+    """
+    if isinstance(source, StatementDocument):
+        yield source
+        return
+    doc = StatementDocument(source)
+    try:
+        yield doc
+    finally:
+        doc.close()
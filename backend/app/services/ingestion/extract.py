@@ -1,8 +1,15 @@
 # modules/ingestion/extract.py
+import importlib
 import re
+from collections import Counter
+from dataclasses import asdict
 import pandas as pd
-import pdfplumber
-from datetime import datetime
+from app.config import IngestionConfig
+from .checkpoint import page_checkpoint
+from .document import open_document
+from .layout import TableRegion
+from .line_classifier import LineClassifier
+from .registry import get_bank
 
 
 # ---------------- Common primitives ----------------
@@ -10,73 +17,188 @@ DATE_RE = re.compile(r"^\d{2}[-/]\d{2}[-/]\d{2,4}\b")   # 01-07-2025 / 02/02/25
 NUM = r"[+-]?\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?"
 NUM_RE = re.compile(f"^{NUM}$")
 
-# Headers/footers/watermarks to ignore
-NOISE_PATTERNS = [
-    r"^Withdrawal\(Dr\)\s*$",
-    r"^Deposit\(Cr\)\s*$",
-    r"^Date\s+Narration.*Balance\s*$",
-    r"^Date\s+Narration\s+Chq\./Ref\.No\..*Balance",
-    r"^Page\s+\d+\s+of\s+\d+\s*$",
-    r"^Statement Summary",
-    r"^Statement of account",
-    r"^Opening Balance",
-    r"^Closing Balance",
-    r"^Total Withdrawal Amount",
-    r"^Total Deposit Amount",
-    r"^Withdrawal Count",
-    r"^Deposit Count",
-    r"^End of Statement",
-    r"This is system generated report",
-    r"^From\s*:\s*\d{2}/\d{2}/\d{4}.*$",
-    r"^\s*Account\s+Branch\b.*$",
-    r"^\s*JOINTHOLDERS:.*$",
-    r"HDFCBANKLIMITED",
-    r"Closingbalanceincludesfunds"
+# Headers/footers/watermarks to ignore (rule name -> pattern)
+NOISE_RULES = [
+    ("withdrawal_header", r"^Withdrawal\(Dr\)\s*$"),
+    ("deposit_header", r"^Deposit\(Cr\)\s*$"),
+    ("column_header", r"^Date\s+Narration.*Balance\s*$"),
+    ("hdfc_column_header", r"^Date\s+Narration\s+Chq\./Ref\.No\..*Balance"),
+    ("page_number", r"^Page\s+\d+\s+of\s+\d+\s*$"),
+    ("statement_summary", r"^Statement Summary"),
+    ("statement_title", r"^Statement of account"),
+    ("opening_balance", r"^Opening Balance"),
+    ("closing_balance", r"^Closing Balance"),
+    ("total_withdrawal", r"^Total Withdrawal Amount"),
+    ("total_deposit", r"^Total Deposit Amount"),
+    ("withdrawal_count", r"^Withdrawal Count"),
+    ("deposit_count", r"^Deposit Count"),
+    ("end_of_statement", r"^End of Statement"),
+    ("system_generated", r"This is system generated report"),
+    ("statement_period", r"^From\s*:\s*\d{2}/\d{2}/\d{4}.*$"),
+    ("account_branch", r"^\s*Account\s+Branch\b.*$"),
+    ("joint_holders", r"^\s*JOINTHOLDERS:.*$"),
+    ("hdfc_watermark", r"HDFCBANKLIMITED"),
+    ("closing_balance_note", r"Closingbalanceincludesfunds"),
 ]
+NOISE_PATTERNS = [pat for _, pat in NOISE_RULES]
+
+# One combined matcher for all rules; parsers take a .fresh() copy per file
+# so discarded lines are counted per statement.
+NOISE_CLASSIFIER = LineClassifier(NOISE_RULES)
 
 def _is_noise(line: str) -> bool:
     s = (line or "").strip()
-    if not s:
-        return True
-    for pat in NOISE_PATTERNS:
-        if re.search(pat, s, flags=re.I):
-            return True
-    return False
-
-def _lines(pdf_path: str):
-    out = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            txt = page.extract_text() or ""
-            for ln in txt.splitlines():
-                ln = ln.strip()
-                if ln:
-                    out.append(ln)
-    return out
+    return not s or NOISE_CLASSIFIER.search(s) is not None
+
+# ---------------- Page-at-a-time parsing ----------------
+class PageParser:
+    """
+    Base for the bank parsers. `parse_page` turns one page into raw rows and
+    `finish` flushes whatever is still open after the last page; anything
+    carried across pages (e.g. Kotak's pending record) lives in `self.state`.
+    `iter_batches` yields one raw DataFrame per page and releases each page
+    (layout objects, memoized text, words and tables) once its batch has been
+    yielded, so memory does not grow with page count.
+    Table-based parsers set `table_template` (a layout.TableTemplate); the
+    region it learns from page 1 is in `self.region` for `page_tables`.
+
+    Before a page is parsed, `classify_page` looks at its probe: boilerplate
+    pages are skipped and an "End of Statement" page stops the loop. Text
+    parsers also stop mid-page at the marker by setting `self.ended`.
+
+    `progress`, when given to `iter_batches`, is called as
+    progress(pages_done, page_count) after every page.
+
+    Large documents are checkpointed page by page (checkpoint.PageCheckpoint):
+    a retry of the same file resumes after the last finished page, so
+    `self.state` must hold only JSON-serializable values.
+
+    Bump `version` whenever a parser's output changes; it is recorded with
+    every file's telemetry so regressions can be traced to a release.
+    """
+    bank = "UNKNOWN"
+    version = "1"
+    columns = []
+    prefetch_kind = "text"
+    table_template = None
+
+    def __init__(self):
+        self.noise = line_profile(self.bank)
+        self.state = {}
+        self.region = None
+        self.ended = False
+        self.page_kinds = []
+
+    def parse_page(self, doc, index: int) -> list:
+        raise NotImplementedError
+
+    def finish(self) -> list:
+        return []
+
+    def to_frame(self, rows: list) -> pd.DataFrame:
+        return pd.DataFrame(rows, columns=self.columns)
+
+    def empty_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(columns=self.columns)
+
+    def _replay(self, checkpoint, doc, progress):
+        """
+        Restore region, per-page batches and carry-over state from a
+        checkpoint, yielding the logged batches. Returns the first page
+        still to parse, or None when there is nothing to resume.
+        """
+        records = checkpoint.records()
+        header = next(records, None)
+        if not header or not header.get("header"):
+            return None
+        self.region = TableRegion(**header["region"]) if header["region"] else None
+        start = 0
+        for rec in records:
+            self.page_kinds.append(rec["kind"])
+            if rec["batch"] is not None:
+                yield pd.DataFrame(rec["batch"]["data"], columns=rec["batch"]["columns"])
+            self.state, self.ended = rec["state"], rec["ended"]
+            self.noise.counts = Counter(rec["noise"])
+            start = rec["page"] + 1
+            if progress is not None:
+                progress(start, doc.page_count)
+        if start:
+            print(f"[{self.bank}] Resuming from checkpoint after page {start} of {doc.page_count}")
+        return start
+
+    def iter_batches(self, source, progress=None):
+        with open_document(source) as doc:
+            checkpoint = page_checkpoint(doc, self)
+            try:
+                start = None
+                if checkpoint is not None:
+                    start = yield from self._replay(checkpoint, doc, progress)
+                if start is None:
+                    if self.table_template is not None:
+                        self.region = doc.table_region(self.table_template)
+                    if checkpoint is not None:
+                        checkpoint.start(asdict(self.region) if self.region else None)
+                    start = 0
+                if not self.ended:
+                    doc.prefetch(self.prefetch_kind, region=self.region, start=start,
+                                 select=lambda pages: pages_to_parse(doc, pages))
+                for index in range(start, doc.page_count):
+                    if self.ended:
+                        break
+                    kind = classify_page(doc.page_probe(index), index)
+                    self.page_kinds.append(kind)
+                    batch = None
+                    if kind == PAGE_END:
+                        self.ended = True
+                    elif kind != PAGE_BOILERPLATE:
+                        rows = self.parse_page(doc, index)
+                        if rows:
+                            batch = self.to_frame(rows)
+                    if checkpoint is not None:
+                        checkpoint.page(index, kind, batch, self.state, self.ended, dict(self.noise.counts))
+                    if batch is not None:
+                        yield batch
+                    doc.release_page(index)
+                    if progress is not None:
+                        progress(index + 1, doc.page_count)
+                skipped = [i + 1 for i, k in enumerate(self.page_kinds) if k in (PAGE_BOILERPLATE, PAGE_END)]
+                if skipped:
+                    print(f"[{self.bank}] Skipped pages {skipped} of {doc.page_count} (boilerplate / end of statement)")
+                rows = self.finish()
+                if rows:
+                    yield self.to_frame(rows)
+                if checkpoint is not None:
+                    checkpoint.discard()
+            finally:
+                if checkpoint is not None:
+                    checkpoint.close()
+
+    def parse(self, source) -> pd.DataFrame:
+        batches = list(self.iter_batches(source))
+        df = pd.concat(batches, ignore_index=True) if batches else self.empty_frame()
+        df.attrs["discarded_lines"] = dict(self.noise.counts)
+        df.attrs["page_kinds"] = list(self.page_kinds)
+        return df
 
 # ===================== Footer cleaner ====================
+DESC_FOOTER_CLASSIFIER = LineClassifier([
+    ("contents_of_statement", re.escape("Contentsofthisstatement")),
+    ("registered_office", re.escape("RegisteredOfficeAddress")),
+    ("gstin", re.escape("GSTIN")),
+    ("state_account_branch", re.escape("Stateaccountbranch")),
+    ("this_statement", re.escape("Thisstatement")),
+], flags=0)
+
 def clean_description(desc: str) -> str:
-    """Truncate noisy footers from description."""
+    """Truncate noisy footers from description (at the earliest footer marker)."""
     if not isinstance(desc, str):
         return desc
-    patterns = [
-        "Contentsofthisstatement",
-        "RegisteredOfficeAddress",
-        "GSTIN",
-        "Stateaccountbranch",
-        "Thisstatement"
-    ]
-    for p in patterns:
-        if p in desc:
-            return desc.split(p)[0].strip()
+    m = DESC_FOOTER_CLASSIFIER.search(desc)
+    if m:
+        return desc[:m.start()].strip()
     return desc.strip()
 
-# ===================== FINAL HDFC TABLE-BASED PARSER (GENERALIZED SCHEMA) ========================
-
-import pdfplumber
-import pandas as pd
-import uuid
-
+# ===================== Amount helper ====================
 def normalize_amount(v):
     """Convert string amounts like '1,234.56' → float"""
     if not v or str(v).strip() == "":
@@ -87,332 +209,138 @@ def normalize_amount(v):
     except:
         return None
 
-def parse_hdfc_df(pdf_path: str) -> pd.DataFrame:
-    """
-    Extract HDFC transactions from PDF statement.
-    Returns: DataFrame with columns [Date, Narration, Chq/Ref No, Debit, Credit, Balance]
-    """
-    rows = []
-    
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            # Use extract_text with layout to preserve structure
-            text = page.extract_text()
-            if not text:
-                continue
-            
-            lines = text.split('\n')
-            in_transaction_section = False
-            
-            for line in lines:
-                # Skip noise
-                if _is_noise(line):
-                    continue
-                
-                # Check if we're in transaction section
-                if "Date" in line and "Narration" in line and ("Withdrawal" in line or "Deposit" in line):
-                    in_transaction_section = True
-                    continue
-                
-                if not in_transaction_section:
-                    continue
-                
-                # Match transaction line: starts with date DD/MM/YY
-                if DATE_RE.match(line.strip()):
-                    parts = line.split()
-                    if len(parts) < 4:
-                        continue
-                    
-                    date = parts[0]
-                    
-                    # Find amounts (last 3 values are typically: withdrawal, deposit, balance)
-                    amounts = [p.replace(',', '') for p in parts if NUM_RE.match(p.replace(',', ''))]
-                    
-                    if len(amounts) >= 1:
-                        balance = amounts[-1]
-                        withdrawal = amounts[-3] if len(amounts) >= 3 else ""
-                        deposit = amounts[-2] if len(amounts) >= 2 else ""
-                        
-                        # Extract narration (everything between date and amounts)
-                        narration_parts = []
-                        for p in parts[1:]:
-                            if not NUM_RE.match(p.replace(',', '')):
-                                narration_parts.append(p)
-                            else:
-                                break
-                        
-                        narration = " ".join(narration_parts)
-                        
-                        rows.append([date, narration, "", withdrawal, deposit, balance])
-    
-    df = pd.DataFrame(rows, columns=["Date", "Narration", "Chq/Ref No", "Debit", "Credit", "Balance"])
-    print(f"[HDFC] Extracted {len(df)} transactions")
-    return df
-
-
-# KOTAK + GENERIC parsers remain unchanged unless you want footer removal there as well.
-
-# (If needed, you can apply `clean_description()` inside `parse_generic_df()` too)
+
 # ======================================================================
-# KOTAK
+# Per-bank line profiles
 # ======================================================================
 
-# Perfect tail core: "<amt>(Dr|Cr) <bal>(Dr|Cr)"
-KOTAK_TAIL_CORE = re.compile(
-    r"(?P<amount>\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)\s*\((?P<ad>Dr|Cr)\)\s+"
-    r"(?P<balance>\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)\s*\((?P<bd>Dr|Cr)\)"
-)
-
-# Stuff that sometimes appears AFTER a valid tail (we strip it)
-POST_TAIL_GARBAGE = re.compile(
-    r"(?:"
-    r"\s+for\s+pin"
-    r"|"
-    r"\s+[A-Z]{3,}\d{6,}(?:/\d{2}[:.]\d{2})?"       # BRKAN020725/17:26
-    r"|"
-    r"\s+/(?:[A-Za-z0-9-]{3,}(?:\s+[A-Za-z0-9-]{2,})*)\b"  # /JIO20PT..., /REFUND TO BEN, /KreditPe
-    r"|"
-    r"\s+FASTAG\b"
-    r")+\s*$",
-    re.I
-)
-
-def _strip_post_tail_garbage(s: str) -> str:
-    if KOTAK_TAIL_CORE.search(s):
-        s = POST_TAIL_GARBAGE.sub("", s)
-    return s.strip()
-
-def _try_match_kotak_tail(s: str):
-    """Return (amount(ad), balance(bd)) or None."""
-    s2 = _strip_post_tail_garbage(s)
-    m = KOTAK_TAIL_CORE.search(s2)
-    if not m:
-        return None
-    amt = f"{m.group('amount')}({m.group('ad')})"
-    bal = f"{m.group('balance')}({m.group('bd')})"
-    return amt, bal
-
-def parse_kotak_df(pdf_path: str) -> pd.DataFrame:
-    """
-    Strategy:
-      - Accumulate lines from a date until we find a Kotak tail on the joined text.
-      - If tail found, strip tail+garbage and emit.
-      - On new date without tail, emit incomplete (validator may reject).
-      - Also attempt a tighter join of the last two lines (common wrap quirk).
-    """
-    L = [ln for ln in _lines(pdf_path) if not _is_noise(ln)]
-    recs, cur = [], None
-
-    def flush(force=False):
-        nonlocal cur
-        if not cur:
-            return
-        joined = " ".join(cur["narr"]).strip()
-
-        # 1) direct try
-        mb = _try_match_kotak_tail(joined)
-        if mb:
-            amt_s, bal_s = mb
-            narr = KOTAK_TAIL_CORE.sub("", _strip_post_tail_garbage(joined)).strip()
-            recs.append([cur["date"], narr, amt_s, bal_s])
-            cur = None
-            return
-
-        # 2) tight merge last 2 lines
-        if len(cur["narr"]) >= 2:
-            tight = " ".join(cur["narr"][:-2] + [cur["narr"][-2] + " " + cur["narr"][-1]])
-            mb2 = _try_match_kotak_tail(tight)
-            if mb2:
-                amt_s, bal_s = mb2
-                narr = KOTAK_TAIL_CORE.sub("", _strip_post_tail_garbage(tight)).strip()
-                recs.append([cur["date"], narr, amt_s, bal_s])
-                cur = None
-                return
-
-        # 3) if still no tail
-        if force:
-            recs.append([cur["date"], joined, "", ""])
-            cur = None
-
-    for raw in L:
-        if DATE_RE.match(raw):
-            flush(force=True)
-            parts = raw.split(maxsplit=1)
-            date = parts[0]
-            rest = parts[1] if len(parts) > 1 else ""
-            cur = {"date": date, "narr": [rest] if rest else []}
-        else:
-            if cur:
-                cur["narr"].append(raw)
-                if _try_match_kotak_tail(" ".join(cur["narr"]).strip()):
-                    flush(force=False)
-
-    flush(force=True)
-    return pd.DataFrame(recs, columns=["Date", "Narration", "Amount (Dr/Cr)", "Balance (Dr/Cr)"])
+SBI_FOOTER_RULES = [
+    ("sbi_txn_count_limit", r"The count of transactions for the selected date range exceeds 299"),
+    ("sbi_atm_warning", r"Please do not share your ATM"),
+    ("sbi_never_asks", r"Bank never asks for such information"),
+    ("sbi_computer_generated", r"This is a computer generated statement"),
+    ("sbi_pin_notice", r"PIN \(Personal Identification Number\)"),
+    ("sbi_otp_notice", r"OTP \(One Time Password\)"),
+    ("sbi_no_signature", r"does not require a signature"),
+]
+SBI_FOOTER_PATTERNS = [pat for _, pat in SBI_FOOTER_RULES]
+SBI_FOOTER_CLASSIFIER = LineClassifier(SBI_FOOTER_RULES)
 
+# Full SBI line profile: generic noise plus SBI disclaimers in one matcher
+SBI_LINE_CLASSIFIER = NOISE_CLASSIFIER.extend(SBI_FOOTER_RULES)
 
-# ======================================================================
-# SBI
-# ======================================================================
+LINE_PROFILES = {"SBI": SBI_LINE_CLASSIFIER}
 
-SBI_HEADER_RE = re.compile(
-    r"^Txn\s+Date\s+Value\s+Date\s+Description\s+Ref\s*No\./Cheque\s*No\.\s+Debit\s+Credit\s+Balance\s*$",
-    re.I,
-)
-
-SBI_FOOTER_PATTERNS = [
-    r"The count of transactions for the selected date range exceeds 299",
-    r"Please do not share your ATM",
-    r"Bank never asks for such information",
-    r"This is a computer generated statement",
-    r"PIN \(Personal Identification Number\)",
-    r"OTP \(One Time Password\)",
-    r"does not require a signature",
-]
+def line_profile(bank: str) -> LineClassifier:
+    """Fresh per-file line classifier for a bank (generic noise rules by default)."""
+    return LINE_PROFILES.get((bank or "").upper(), NOISE_CLASSIFIER).fresh()
 
 def _is_sbi_footer(line: str) -> bool:
     """Check if a line is SBI footer/disclaimer."""
-    for pat in SBI_FOOTER_PATTERNS:
-        if re.search(pat, line, flags=re.I):
-            return True
-    return False
+    return SBI_FOOTER_CLASSIFIER.search(line) is not None
 
 
-def parse_sbi_df(pdf_path: str) -> pd.DataFrame:
+# ======================================================================
+# Page pre-pass
+# ======================================================================
+
+PAGE_TRANSACTION = "transaction"
+PAGE_SUMMARY = "summary"
+PAGE_BOILERPLATE = "boilerplate"
+PAGE_END = "end"
+
+# Header-band evidence, first match wins per line
+PAGE_RULES = [
+    ("txn_row", DATE_RE.pattern),
+    ("txn_header", r"^Date\s+Narration|\bTxn\s*Date\b|\bValue\s*Date\b|\bTransaction\s*Date\b"),
+    ("end_of_statement", r"^End of Statement"),
+    ("summary", r"^Statement Summary|^Opening Balance|^Closing Balance|^Total (?:Withdrawal|Deposit) Amount"),
+    ("terms", r"Terms\s*(?:and|&)\s*Conditions"),
+    ("gst", r"\bGSTIN\b|\bGST\s+(?:Registration|Details)\b"),
+    ("registered_office", r"Registered\s*Office"),
+] + SBI_FOOTER_RULES
+PAGE_CLASSIFIER = LineClassifier(PAGE_RULES)
+
+_TXN_EVIDENCE = {"txn_row", "txn_header"}
+_BOILERPLATE = {name for name, _ in PAGE_RULES} - _TXN_EVIDENCE - {"end_of_statement", "summary"}
+
+def classify_page(probe: dict, index: int) -> str:
+    """
+    Classify a page from its probe ({'chars', 'head'}) without extracting it:
+    'transaction' (default), 'summary', 'boilerplate' or 'end'.
+    Any date row or column header in the header band makes it a transaction
+    page. Otherwise the first content line of the band (page numbers and
+    other noise ignored) decides: the "End of Statement" marker -> 'end';
+    terms, GST or SBI ATM/OTP disclaimers on a short page -> 'boilerplate'.
+    Pages without text are boilerplate; page 1 is never skipped otherwise,
+    nor is a page opening with a record carried over from the previous one.
+    """
+    if not probe["chars"]:
+        return PAGE_BOILERPLATE
+    fired, first = set(), None
+    for line in probe["head"].splitlines():
+        line = line.strip()
+        m = PAGE_CLASSIFIER.search(line)
+        if m:
+            fired.add(m.lastgroup)
+        if first is None and line and (m or NOISE_CLASSIFIER.search(line) is None):
+            first = m.lastgroup if m else ""
+    if index == 0 or fired & _TXN_EVIDENCE:
+        return PAGE_TRANSACTION
+    if first == "end_of_statement":
+        return PAGE_END
+    if first in _BOILERPLATE and probe["chars"] <= IngestionConfig.BOILERPLATE_MAX_CHARS:
+        return PAGE_BOILERPLATE
+    if "summary" in fired:
+        return PAGE_SUMMARY
+    return PAGE_TRANSACTION
+
+
+def pages_to_parse(doc, pages: list) -> list:
     """
-    Extract transactions from SBI PDF statements.
-    Works for tables with columns:
-      Txn Date | Value Date | Description | Ref No./Cheque No. | Debit | Credit | Balance
+    The `pages` a parser will actually parse, judged from their probes:
+    transaction and summary pages up to the first "End of Statement" page.
     """
-    import pdfplumber
-    import pandas as pd
-    import re
+    out = []
+    for index in pages:
+        kind = classify_page(doc.page_probe(index), index)
+        if kind == PAGE_END:
+            break
+        if kind != PAGE_BOILERPLATE:
+            out.append(index)
+    return out
 
-    all_tables = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            try:
-                tables = page.extract_tables()
-                for t in tables:
-                    if not t:
-                        continue
-                    # Find header row
-                    header_row = None
-                    for i, row in enumerate(t):
-                        joined = " ".join(str(c or "") for c in row)
-                        if re.search(r"Txn\s*Date", joined, flags=re.I) and re.search(r"Balance", joined, flags=re.I):
-                            header_row = i
-                            break
-                    if header_row is not None:
-                        header = [c.strip() if c else "" for c in t[header_row]]
-                        data_rows = t[header_row + 1:]
-                        df = pd.DataFrame(data_rows, columns=header)
-                        all_tables.append(df)
-            except Exception:
-                continue
-
-    if not all_tables:
-        print("[WARN] No table detected in SBI statement.")
-        return pd.DataFrame()
-
-    df_raw = pd.concat(all_tables, ignore_index=True)
-
-    # --- Relaxed mapping ---
-    col_map = {}
-    for c in df_raw.columns:
-        cname = c.strip().lower().replace(".", "").replace("/", "")
-        if "txn" in cname and "date" in cname:
-            col_map[c] = "Date"
-        elif "desc" in cname:
-            col_map[c] = "Narration"
-        elif "ref" in cname or "cheque" in cname:
-            col_map[c] = "Ref_No"
-        elif "debit" in cname:
-            col_map[c] = "Debit"
-        elif "credit" in cname:
-            col_map[c] = "Credit"
-        elif "balance" in cname:
-            col_map[c] = "Balance"
-
-    df_raw.rename(columns=col_map, inplace=True)
-
-    # --- Ensure all expected columns exist ---
-    for col in ["Date", "Narration", "Ref_No", "Debit", "Credit", "Balance"]:
-        if col not in df_raw.columns:
-            df_raw[col] = ""
-
-    # --- Clean data ---
-    for col in ["Date", "Narration", "Debit", "Credit", "Balance"]:
-        df_raw[col] = (
-            df_raw[col]
-            .astype(str)
-            .str.replace(",", "", regex=False)
-            .str.replace(r"\s+", " ", regex=True)
-            .str.strip()
-        )
-
-    # --- Drop totals and blank rows ---
-    df_raw = df_raw[~df_raw["Date"].str.contains("Total|Closing|Opening", case=False, na=False)]
-    df_raw = df_raw[df_raw["Date"].str.strip() != ""]
-
-    return df_raw[["Date", "Narration", "Ref_No", "Debit", "Credit", "Balance"]]
-import pdfplumber
-import pandas as pd
-import re
 
-def parse_icici_df(pdf_path: str) -> pd.DataFrame:
+# ======================================================================
+# Streaming entry point
+# ======================================================================
+
+def iter_transactions(source, bank: str, progress=None, telemetry=None):
     """
-    Robust ICICI Bank PDF parser that handles multi-line grid-based tables.
-    Extracts Value Date, Transaction Date, Remarks, Debit, Credit, Balance.
+    Yield raw transaction batches (one DataFrame per page) for `bank`, using
+    the registered (lazily imported) bank parser. Unknown banks fall back to
+    the HDFC-like parser. Feed the generator to standardize_and_write to
+    validate and write incrementally. `progress(pages_done, page_count)` is
+    called after every page; `telemetry` (telemetry.IngestTelemetry) records
+    which parser ran.
     """
-    rows = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            tables = page.extract_tables()
-            for table in tables:
-                if not table:
-                    continue
-                for r in table:
-                    row = [str(x).strip().replace("\n", " ") if x else "" for x in r]
-                    # Skip header or empty lines
-                    joined = " ".join(row).lower()
-                    if "transaction remarks" in joined or "value date" in joined or "balance" in joined:
-                        continue
-                    if not any(row):
-                        continue
-
-                    rows.append(row)
-
-    # Convert to DataFrame and infer layout
-    df = pd.DataFrame(rows)
-
-    # Try to auto-detect ICICI table structure
-    if df.shape[1] >= 8:
-        df = df.iloc[:, :8]  # first 8 columns
-        df.columns = [
-            "S.No", "Value Date", "Transaction Date", "Cheque Number",
-            "Transaction Remarks", "Withdrawal Amount (INR)",
-            "Deposit Amount (INR)", "Balance (INR)"
-        ]
-    else:
-        # fallback for merged-column PDFs
-        df.columns = ["col" + str(i) for i in range(len(df.columns))]
-
-    # Filter valid transaction rows only (contains dates)
-    df = df[df["Transaction Date"].str.match(r"\d{2}/\d{2}/\d{4}", na=False)]
-
-    # Build standardized DataFrame
-    df_std = pd.DataFrame({
-        "Date": df["Transaction Date"].fillna(df["Value Date"]),
-        "Narration": df["Transaction Remarks"],
-        "Debit": df["Withdrawal Amount (INR)"].replace(",", "", regex=True),
-        "Credit": df["Deposit Amount (INR)"].replace(",", "", regex=True),
-        "Balance": df["Balance (INR)"].replace(",", "", regex=True)
-    })
-
-    # Drop invalid or blank rows
-    df_std = df_std[df_std["Date"].notna() & df_std["Narration"].notna()]
-    df_std = df_std[df_std["Date"].str.contains(r"\d{2}/\d{2}/\d{4}")]
-
-    print(f"[ICICI] Extracted {len(df_std)} valid transactions.")
-    return df_std
\ No newline at end of file
+    parser = get_bank(bank).parser()
+    if telemetry is not None:
+        telemetry.use_parser(parser)
+    yield from parser.iter_batches(source, progress)
+
+
+# Bank parsers live in ingestion/banks/* and are imported on first use;
+# these names stay importable from here for existing callers.
+_LAZY_EXPORTS = {
+    "parse_hdfc_df": "hdfc", "HdfcPageParser": "hdfc", "HdfcWordsPageParser": "hdfc",
+    "parse_kotak_df": "kotak", "KotakPageParser": "kotak",
+    "parse_sbi_df": "sbi", "SbiPageParser": "sbi",
+    "parse_icici_df": "icici", "IciciPageParser": "icici",
+}
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(f".banks.{_LAZY_EXPORTS[name]}", __package__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
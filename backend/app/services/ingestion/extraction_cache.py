@@ -0,0 +1,157 @@
+# modules/ingestion/extraction_cache.py
+import hashlib
+import json
+import os
+import threading
+from app.config import IngestionConfig
+
+# Bump whenever extraction output for the same PDF bytes would change
+# (pdfplumber upgrade, different extract_text/extract_tables settings, ...).
+EXTRACTOR_VERSION = "1"
+
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(chunk_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class ExtractionCache:
+    """
+    On-disk cache of per-page text and tables, keyed by the SHA-256 of the PDF
+    bytes plus EXTRACTOR_VERSION. Entries are JSON files; the directory is kept
+    under `max_bytes` by evicting least-recently-used entries (mtime is bumped
+    on every hit).
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def _path(self, sha256: str) -> str:
+        return os.path.join(self.cache_dir, f"{sha256}-v{EXTRACTOR_VERSION}.json")
+
+    def load(self, sha256: str):
+        """
+        Return {'page_count', 'text', 'tables', 'regions', 'probes', 'meta'} or
+        None on a miss. Text and probe keys are page ints; table keys are page ints, or '<page>@<bank>'
+        for tables extracted within a learned TableRegion. 'meta' holds
+        document-level values (PDF info fields, detection results).
+        """
+        path = self._path(sha256)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                payload = json.load(fh)
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return {
+            "page_count": payload.get("page_count"),
+            "text": {int(k): v for k, v in payload.get("text", {}).items()},
+            "tables": {int(k) if k.isdigit() else k: v for k, v in payload.get("tables", {}).items()},
+            "regions": payload.get("regions", {}),
+            "probes": {int(k): v for k, v in payload.get("probes", {}).items()},
+            "meta": payload.get("meta", {}),
+        }
+
+    def store(self, sha256: str, page_count: int, text: dict, tables: dict,
+              regions: dict = None, probes: dict = None, meta: dict = None, spilled=None):
+        """
+        Write one entry. `spilled` is an optional open file of JSON lines
+        {"text": {...}, "tables": {...}} holding pages already dropped from
+        `text`/`tables`; it is streamed into the entry, not loaded.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(sha256)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as fh:
+                fh.write(f'{{"page_count": {json.dumps(page_count)}, "text": ')
+                _write_pages(fh, text, spilled, "text")
+                fh.write(', "tables": ')
+                _write_pages(fh, tables, spilled, "tables")
+                rest = {
+                    "regions": regions or {},
+                    "probes": {str(k): v for k, v in (probes or {}).items()},
+                    "meta": meta or {},
+                }
+                fh.write(", " + json.dumps(rest, ensure_ascii=False)[1:])
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[WARN] Could not write extraction cache entry: {e}")
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+        self._evict()
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(".json"):
+                    continue
+                full = os.path.join(self.cache_dir, name)
+                try:
+                    st = os.stat(full)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, full))
+            total = sum(size for _, size, _ in entries)
+            for _, size, full in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(full)
+                except OSError:
+                    continue
+                total -= size
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+
+def _write_pages(fh, memo: dict, spilled, section: str):
+    """Write `section` of the spilled lines, then `memo`, as one JSON object (later keys win on load)."""
+    fh.write("{")
+    sep = ""
+    if spilled is not None:
+        spilled.seek(0)
+        for line in spilled:
+            for k, v in json.loads(line)[section].items():
+                fh.write(f"{sep}{json.dumps(str(k))}: {json.dumps(v, ensure_ascii=False)}")
+                sep = ", "
+    for k, v in memo.items():
+        fh.write(f"{sep}{json.dumps(str(k))}: {json.dumps(v, ensure_ascii=False)}")
+        sep = ", "
+    fh.write("}")
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+def get_extraction_cache():
+    """Process-wide cache for the configured directory, or None when disabled."""
+    if not IngestionConfig.EXTRACT_CACHE_ENABLED:
+        return None
+    cache_dir = IngestionConfig.EXTRACT_CACHE_DIR
+    with _caches_lock:
+        if cache_dir not in _caches:
+            _caches[cache_dir] = ExtractionCache(cache_dir, IngestionConfig.EXTRACT_CACHE_MAX_BYTES)
+        return _caches[cache_dir]
@@ -0,0 +1,90 @@
+# modules/ingestion/fingerprint.py
+import hashlib
+import re
+from collections import Counter
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_integer_dtype
+from .schema import format_dates, format_money
+
+# Bump when normalization changes: fingerprints of already imported rows
+# would no longer match re-imports of the same statement.
+FINGERPRINT_VERSION = "1"
+
+_NON_ALNUM = re.compile(r"[^A-Z0-9]+")
+
+
+def normalize_description(desc) -> str:
+    """Upper-cased description with every run of punctuation/whitespace collapsed to one space."""
+    if desc is None or (not isinstance(desc, str) and pd.isna(desc)):
+        return ""
+    return _NON_ALNUM.sub(" ", str(desc).upper()).strip()
+
+
+def _norm_amount(col: pd.Series) -> pd.Series:
+    if is_integer_dtype(col.dtype):  # typed minor units
+        return format_money(col)
+    values = pd.to_numeric(col.astype(str).str.replace(",", "", regex=False).str.strip(), errors="coerce")
+    return values.map(lambda v: "" if pd.isna(v) else f"{v:.2f}")
+
+
+def _norm_date(col: pd.Series) -> pd.Series:
+    if is_datetime64_any_dtype(col.dtype):
+        return format_dates(col)
+    raw = col.fillna("").astype(str).str.strip()
+    iso = pd.to_datetime(raw, format="%Y-%m-%d", errors="coerce").dt.strftime("%Y-%m-%d")
+    return iso.fillna(raw)
+
+
+def _field(df: pd.DataFrame, name: str) -> pd.Series:
+    return df[name] if name in df.columns else pd.Series("", index=df.index)
+
+
+class Fingerprinter:
+    """
+    Deterministic per-row fingerprints for STD transactions:
+    SHA-256 over (bank, date, debit, credit, balance, normalized description,
+    ordinal), where the ordinal numbers rows that are otherwise identical
+    within the same day. The same statement row therefore gets the same
+    fingerprint in every upload, including overlapping statements.
+
+    One instance covers one statement: ordinals carry across batches, so a
+    duplicate split over a page break still gets ordinal 1.
+    """
+
+    def __init__(self):
+        self.seen = Counter()
+
+    def keys(self, df: pd.DataFrame) -> pd.Series:
+        parts = [
+            _field(df, "Bank_Name").astype(object).fillna("").astype(str).str.strip().str.upper(),
+            _norm_date(_field(df, "Transaction_Date")),
+            _norm_amount(_field(df, "Debit_Amount")),
+            _norm_amount(_field(df, "Credit_Amount")),
+            _norm_amount(_field(df, "Balance")),
+            _field(df, "Description").map(normalize_description),
+        ]
+        key = parts[0]
+        for part in parts[1:]:
+            key = key + "|" + part
+        return key
+
+    def assign(self, df: pd.DataFrame) -> pd.Series:
+        """Fingerprints (64 hex chars) for the rows of `df`, in row order."""
+        if df is None or df.empty:
+            return pd.Series([], dtype=object)
+        key = self.keys(df)
+        ordinal = key.groupby(key, sort=False).cumcount() + key.map(lambda k: self.seen[k])
+        self.seen.update(key.tolist())
+        return pd.Series(
+            [
+                hashlib.sha256(f"v{FINGERPRINT_VERSION}|{k}|{n}".encode("utf-8")).hexdigest()
+                for k, n in zip(key.tolist(), ordinal.tolist())
+            ],
+            index=df.index,
+            dtype=object,
+        )
+
+
+def transaction_fingerprints(df: pd.DataFrame) -> pd.Series:
+    """Fingerprints for one complete statement's STD rows."""
+    return Fingerprinter().assign(df)
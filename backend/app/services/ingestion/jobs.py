@@ -0,0 +1,81 @@
+# modules/ingestion/jobs.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from app.config import IngestionConfig
+
+
+class JobQueue:
+    """
+    In-process background queue for statement processing: jobs run on a
+    bounded thread pool so uploads return immediately. Durable state
+    (PENDING/PROCESSING/COMPLETED/FAILED) stays on BankStatement; the queue
+    only keeps live progress per job id (pages done, rows parsed, ...),
+    which is lost on restart like the queued work itself; statements left
+    unfinished are marked FAILED at startup (PDFController.fail_interrupted).
+    Progress of a finished job is dropped once its final status has been
+    read (forget), or JOB_PROGRESS_TTL_S after it finished.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest-job")
+        self._progress = {}
+        self._lock = threading.Lock()
+
+    def submit(self, job_id, fn, *args, **kwargs):
+        """Queue fn(*args, **kwargs); its exceptions are recorded, never raised."""
+        self.prune()
+        self.update(job_id, state="queued", queued_at=time.time())
+
+        def run():
+            self.update(job_id, state="running", started_at=time.time())
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                self.update(job_id, state="failed", error=str(e))
+                print(f"[JOB] {job_id} failed: {e}")
+            else:
+                self.update(job_id, state="done")
+            finally:
+                self.update(job_id, finished_at=time.time())
+
+        return self._pool.submit(run)
+
+    def update(self, job_id, **fields):
+        with self._lock:
+            self._progress.setdefault(job_id, {}).update(fields)
+
+    def progress(self, job_id) -> dict:
+        """Copy of the live progress of `job_id` ({} when unknown to this process)."""
+        with self._lock:
+            return dict(self._progress.get(job_id, {}))
+
+    def forget(self, job_id):
+        with self._lock:
+            self._progress.pop(job_id, None)
+
+    def prune(self, ttl_s: float = None):
+        """Drop progress of jobs that finished more than `ttl_s` (default JOB_PROGRESS_TTL_S) ago."""
+        ttl_s = IngestionConfig.JOB_PROGRESS_TTL_S if ttl_s is None else ttl_s
+        cutoff = time.time() - ttl_s
+        with self._lock:
+            for job_id in [k for k, v in self._progress.items() if v.get("finished_at", cutoff) < cutoff]:
+                del self._progress[job_id]
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait)
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+def get_job_queue():
+    """Process-wide job queue, or None when IngestionConfig.JOB_WORKERS is 0 (process inline)."""
+    global _queue
+    if IngestionConfig.JOB_WORKERS <= 0:
+        return None
+    with _queue_lock:
+        if _queue is None:
+            _queue = JobQueue(IngestionConfig.JOB_WORKERS)
+        return _queue
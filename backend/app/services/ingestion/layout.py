@@ -0,0 +1,116 @@
+# modules/ingestion/layout.py
+import re
+from dataclasses import dataclass, field
+
+# pdfplumber's own defaults, spelled out so a pdfplumber upgrade cannot
+# silently change how statement grids are found.
+RULED_TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 3,
+    "join_tolerance": 3,
+    "edge_min_length": 3,
+    "intersection_tolerance": 3,
+}
+
+
+@dataclass
+class TableRegion:
+    """
+    Transaction-table area of one document, learned from page 1.
+    Every page is cropped to the horizontal extent of page 1's grid and
+    vertically to the ruling lines spanning it (page 1 starts just above its
+    header row), so letterheads, logos, summary boxes and disclaimers around
+    the grid are never searched for tables.
+    """
+    key: str
+    x0: float
+    x1: float
+    first_top: float
+    table_settings: dict = field(default_factory=dict)
+    slack: float = 5.0
+
+    def _grid_span(self, page):
+        """(top, bottom) of the ruling lines / boxes spanning the region's width, or None."""
+        tops = [
+            y
+            for obj in page.lines + page.rects
+            if obj["x0"] <= self.x0 + self.slack and obj["x1"] >= self.x1 - self.slack
+            for y in (obj["top"], obj["bottom"])
+        ]
+        return (min(tops), max(tops)) if tops else None
+
+    def bbox(self, page, index: int) -> tuple:
+        span = self._grid_span(page)
+        top, bottom = (span[0] - 2, span[1] + 2) if span else (0, page.height)
+        if index == 0:
+            top = self.first_top
+        if bottom <= top:
+            bottom = page.height
+        return (max(self.x0, 0), max(min(top, page.height), 0), min(self.x1, page.width), min(bottom, page.height))
+
+    def extract_tables(self, page, index: int) -> list:
+        x0, top, x1, bottom = self.bbox(page, index)
+
+        # Keep whole objects inside the box; unlike page.crop() nothing is clipped or copied
+        def inside(obj):
+            return obj["x0"] >= x0 and obj["x1"] <= x1 and obj["top"] >= top and obj["bottom"] <= bottom
+
+        return page.filter(inside).extract_tables(self.table_settings)
+
+
+@dataclass
+class TableTemplate:
+    """
+    Per-bank layout template for table-based statements.
+    `first_header` / `last_header` match the first and last words of the
+    transaction header row. The region's edges come from the ruling line
+    drawn just above that row; unruled headers fall back to the full page
+    width starting `pad` points above the header text.
+    """
+    bank: str
+    first_header: str
+    last_header: str
+    table_settings: dict = field(default_factory=lambda: dict(RULED_TABLE_SETTINGS))
+    pad: float = 20.0
+    line_tolerance: float = 3.0
+
+    def find_header(self, words: list):
+        """Words of the first line that starts with `first_header` and later has `last_header`."""
+        first_re = re.compile(self.first_header, re.I)
+        last_re = re.compile(self.last_header, re.I)
+        for start in words:
+            if not first_re.match(start["text"]):
+                continue
+            line = [w for w in words if abs(w["top"] - start["top"]) <= self.line_tolerance]
+            if any(w["x0"] > start["x0"] and last_re.match(w["text"]) for w in line):
+                return line
+        return None
+
+    def learn(self, page):
+        """TableRegion from a pdfplumber page 1, or None when it has no header row (full-page fallback)."""
+        header = self.find_header(page.extract_words())
+        if not header:
+            return None
+        top = min(w["top"] for w in header)
+        left = min(w["x0"] for w in header)
+        right = max(w["x1"] for w in header)
+        rules = [
+            e for e in page.horizontal_edges
+            if top - self.pad <= e["top"] <= top and e["x0"] <= left and e["x1"] >= right
+        ]
+        if rules:
+            x0 = min(e["x0"] for e in rules)
+            x1 = max(e["x1"] for e in rules)
+            first_top = min(e["top"] for e in rules)
+            # Keep a little slack so the outer rules survive the crop intact
+            x0, x1, first_top = x0 - 2, x1 + 2, first_top - 2
+        else:
+            x0, x1, first_top = 0, page.width, top - self.pad
+        return TableRegion(
+            key=self.bank,
+            x0=max(x0, 0),
+            x1=min(x1, page.width),
+            first_top=max(first_top, 0),
+            table_settings=dict(self.table_settings),
+        )
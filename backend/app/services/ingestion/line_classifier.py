@@ -0,0 +1,50 @@
+# modules/ingestion/line_classifier.py
+import re
+from collections import Counter
+
+
+class LineClassifier:
+    """
+    Compiles an ordered set of named line rules (header/footer/watermark
+    patterns) into a single alternation, so classifying a line costs one
+    regex search instead of one per rule. `classify` returns the name of the
+    rule that fired and keeps a per-rule counter of discarded lines.
+    """
+
+    BLANK = "blank"
+
+    def __init__(self, rules, flags=re.I, _matcher=None):
+        self.rules = dict(rules)
+        self._matcher = _matcher or re.compile(
+            "|".join(f"(?P<{name}>{pat})" for name, pat in self.rules.items()),
+            flags,
+        )
+        self.counts = Counter()
+
+    def classify(self, line: str):
+        """Return the firing rule name, 'blank' for empty lines, or None for data lines."""
+        s = (line or "").strip()
+        if not s:
+            self.counts[self.BLANK] += 1
+            return self.BLANK
+        m = self._matcher.search(s)
+        if m is None:
+            return None
+        self.counts[m.lastgroup] += 1
+        return m.lastgroup
+
+    def is_noise(self, line: str) -> bool:
+        return self.classify(line) is not None
+
+    def search(self, text: str):
+        """Raw combined search (no stripping, no counting), e.g. for truncation."""
+        return self._matcher.search(text)
+
+    def fresh(self) -> "LineClassifier":
+        """Same compiled matcher, zeroed counters (one per parsed file)."""
+        return LineClassifier(self.rules, _matcher=self._matcher)
+
+    def extend(self, rules) -> "LineClassifier":
+        """New classifier with extra rules appended (e.g. a bank-specific profile)."""
+        return LineClassifier(list(self.rules.items()) + list(dict(rules).items()),
+                              self._matcher.flags)
@@ -0,0 +1,186 @@
+# modules/ingestion/outputs.py
+import os
+import threading
+import pandas as pd
+from werkzeug.utils import safe_join
+from app.config import IngestionConfig
+from .schema import TYPED_COLS, coerce_std, read_std_csv, to_export
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: only needed for INGEST_OUTPUT_FORMAT=parquet
+    pa = pq = None
+
+# STD/REJECTS files are written as UTF-8-BOM CSV (strings, the export format)
+# or Parquet (the typed STD frame as is: int64 minor units, timestamps,
+# dictionary-encoded bank). Readers pick the format from the extension.
+OUTPUT_FORMATS = ("csv", "parquet")
+
+
+def output_format(fmt: str = None) -> str:
+    """`fmt` (default IngestionConfig.OUTPUT_FORMAT) if it can be written here, else 'csv'."""
+    fmt = (fmt or IngestionConfig.OUTPUT_FORMAT or "csv").lower()
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {fmt}")
+    if fmt == "parquet" and pq is None:
+        print("[INGEST] pyarrow is not installed; writing CSV instead of Parquet")
+        return "csv"
+    return fmt
+
+
+def format_of(path: str) -> str:
+    return "parquet" if (path or "").lower().endswith(".parquet") else "csv"
+
+
+def csv_name(path: str) -> str:
+    """Name of the CSV export of an output file (the file itself when it is a CSV)."""
+    return os.path.splitext(os.path.basename(path))[0] + ".csv"
+
+
+def _std_schema():
+    return pa.schema([
+        ("Transaction_ID", pa.string()),
+        ("Transaction_Date", pa.timestamp("ns")),
+        ("Description", pa.string()),
+        ("Debit_Amount", pa.int64()),
+        ("Credit_Amount", pa.int64()),
+        ("Balance", pa.int64()),
+        ("Bank_Name", pa.dictionary(pa.int32(), pa.string())),
+    ])
+
+
+# =====================================================
+# Writers (one batch at a time)
+# =====================================================
+class CsvOutput:
+    """
+    CSV written batch by batch from typed frames (to_export at the boundary).
+    With `columns` the header is written up front; otherwise it comes from
+    the first non-empty batch, and a file that got none stays empty.
+    """
+
+    def __init__(self, path: str, columns: list = None):
+        self.path = path
+        self.rows = 0
+        self._fh = open(path, "w", encoding="utf-8-sig", newline="")
+        self._header = columns is None
+        if columns is not None:
+            pd.DataFrame(columns=columns).to_csv(self._fh, index=False)
+
+    def write(self, df: pd.DataFrame):
+        if df is None or df.empty:
+            return
+        to_export(df).to_csv(self._fh, index=False, header=self._header and self.rows == 0)
+        self.rows += len(df)
+
+    def close(self):
+        if self._header and self.rows == 0:
+            pd.DataFrame().to_csv(self._fh, index=False)
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ParquetOutput:
+    """
+    Parquet written one row group per batch. With `schema` the file is
+    created (and typed) up front; otherwise the first non-empty batch fixes
+    it, and a file that got none is written without columns.
+    """
+
+    def __init__(self, path: str, schema=None):
+        self.path = path
+        self.rows = 0
+        self._schema = schema
+        self._writer = pq.ParquetWriter(path, schema) if schema is not None else None
+
+    def write(self, df: pd.DataFrame):
+        if df is None or df.empty:
+            return
+        table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+        if self._writer is None:
+            self._schema = table.schema
+            self._writer = pq.ParquetWriter(self.path, self._schema)
+        self._writer.write_table(table)
+        self.rows += len(df)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        else:
+            pq.write_table(pa.table({}), self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_std(path: str, columns: list):
+    return ParquetOutput(path, _std_schema()) if format_of(path) == "parquet" else CsvOutput(path, columns)
+
+
+def open_rejects(path: str):
+    return ParquetOutput(path) if format_of(path) == "parquet" else CsvOutput(path)
+
+
+# =====================================================
+# Readers
+# =====================================================
+def _read_parquet(path: str, columns: list = None) -> pd.DataFrame:
+    """Memory-mapped Parquet read of the `columns` present (all when None); int64 -> Int64."""
+    if columns is not None:
+        available = set(pq.read_schema(path).names)
+        columns = [c for c in columns if c in available]
+    table = pq.read_table(path, columns=columns, memory_map=True)
+    return table.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+
+
+def read_std(path: str, columns: list = None) -> pd.DataFrame:
+    """
+    Typed STD frame from an output file of either format. With `columns`
+    only those are read (missing ones come back empty) and typed.
+    """
+    if format_of(path) == "parquet":
+        df = _read_parquet(path, columns)
+    else:
+        df = read_std_csv(path, columns)
+    for col in columns or []:
+        if col not in df.columns:
+            df[col] = None
+    return coerce_std(df, [c for c in TYPED_COLS if columns is None or c in columns])
+
+
+def count_rows(path: str) -> int:
+    """Rows in an output file: Parquet metadata only, or one projected CSV column."""
+    if format_of(path) == "parquet":
+        return pq.ParquetFile(path).metadata.num_rows
+    try:
+        return len(pd.read_csv(path, usecols=[0]))
+    except pd.errors.EmptyDataError:
+        return 0
+
+
+def export_csv(output_dir: str, filename: str):
+    """
+    Make sure `filename` (a .csv in `output_dir`) exists, writing it from
+    the Parquet output of the same name on first request. Returns its path,
+    or None when neither file exists.
+    """
+    path = safe_join(output_dir, filename)
+    if path is None or os.path.exists(path):
+        return path
+    source = os.path.splitext(path)[0] + ".parquet"
+    if format_of(path) != "csv" or not os.path.exists(source):
+        return None
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with CsvOutput(tmp, pq.read_schema(source).names or None) as out:
+        out.write(_read_parquet(source))
+    os.replace(tmp, path)
+    return path
@@ -0,0 +1,234 @@
+# modules/ingestion/pdf_backends.py
+from app.config import IngestionConfig
+
+
+class PdfBackend:
+    """
+    One open PDF as seen by ingestion: page text, words with coordinates,
+    tables, header-band probes and table-region learning. StatementDocument
+    memoizes and caches what these return; backends only extract.
+
+    Words are dicts with at least text, x0, x1, top, bottom (pdfplumber's
+    top-down coordinates). Text is words joined by spaces, one line per
+    visual line, as pdfplumber's `extract_text()` returns it.
+    """
+    name = ""
+
+    def __init__(self, pdf_path: str):
+        self.pdf_path = pdf_path
+
+    @property
+    def page_count(self) -> int:
+        raise NotImplementedError
+
+    def text(self, index: int) -> str:
+        raise NotImplementedError
+
+    def words(self, index: int) -> list:
+        raise NotImplementedError
+
+    def tables(self, index: int, region=None) -> list:
+        raise NotImplementedError
+
+    def probe(self, index: int, band: float) -> dict:
+        """{'chars': character count, 'head': text of the top `band` points}."""
+        raise NotImplementedError
+
+    def learn_region(self, template):
+        """TableRegion learned by `template` from page 1, or None."""
+        raise NotImplementedError
+
+    def metadata(self) -> dict:
+        """Document info fields (Title, Author, Creator, Producer, ...) as strings."""
+        raise NotImplementedError
+
+    def release(self, index: int):
+        """Drop per-page layout objects once a page is done."""
+
+    def close(self):
+        raise NotImplementedError
+
+
+class PdfplumberBackend(PdfBackend):
+    """Default backend: pdfplumber (pdfminer.six) for everything."""
+    name = "pdfplumber"
+
+    def __init__(self, pdf_path: str):
+        super().__init__(pdf_path)
+        import pdfplumber  # deferred: only paid when a page really needs extracting
+
+        self._pdf = pdfplumber.open(pdf_path)
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pdf.pages)
+
+    def _page(self, index: int):
+        return self._pdf.pages[index]
+
+    def text(self, index: int) -> str:
+        return self._page(index).extract_text() or ""
+
+    def words(self, index: int) -> list:
+        return self._page(index).extract_words()
+
+    def tables(self, index: int, region=None) -> list:
+        page = self._page(index)
+        if region is None:
+            return page.extract_tables()
+        return region.extract_tables(page, index)
+
+    def probe(self, index: int, band: float) -> dict:
+        page = self._page(index)
+        head = page.filter(lambda obj: obj.get("bottom", 0) <= band)
+        return {"chars": len(page.chars), "head": head.extract_text() or ""}
+
+    def learn_region(self, template):
+        return template.learn(self._page(0))
+
+    def metadata(self) -> dict:
+        return _info_fields(self._pdf.metadata)
+
+    def release(self, index: int):
+        self._pdf.pages[index].close()
+
+    def close(self):
+        self._pdf.close()
+
+
+INFO_FIELDS = ("Title", "Author", "Subject", "Keywords", "Creator", "Producer")
+
+
+def _info_fields(info: dict) -> dict:
+    """Text-valued document info fields, undecodable values dropped."""
+    out = {}
+    for key in INFO_FIELDS:
+        value = (info or {}).get(key)
+        if isinstance(value, bytes):
+            value = value.decode("utf-8", "ignore")
+        if isinstance(value, str) and value.strip():
+            out[key] = value.strip()
+    return out
+
+
+def _words_to_text(words: list, y_tolerance: float = 3.0) -> str:
+    """Join words into lines the way pdfplumber's extract_text() does (layout=False)."""
+    lines = []
+    for w in sorted(words, key=lambda w: (w["top"], w["x0"])):
+        if lines and w["top"] - lines[-1][0]["top"] <= y_tolerance:
+            lines[-1].append(w)
+        else:
+            lines.append([w])
+    return "\n".join(" ".join(w["text"] for w in sorted(line, key=lambda w: w["x0"])) for line in lines)
+
+
+class PdfiumBackend(PdfBackend):
+    """
+    pypdfium2 (PDFium, native code) for text, words and probes, typically an
+    order of magnitude faster than pdfminer's layout analysis. Words are
+    built from PDFium's character boxes with pdfplumber's default tolerances.
+    PDFium has no table finder, so tables and table regions are delegated to
+    a pdfplumber backend opened on first use.
+    """
+    name = "pypdfium2"
+    x_tolerance = 3.0
+    y_tolerance = 3.0
+
+    def __init__(self, pdf_path: str):
+        super().__init__(pdf_path)
+        import pypdfium2
+
+        self._pdf = pypdfium2.PdfDocument(pdf_path)
+        self._words = {}
+        self._plumber = None
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pdf)
+
+    def _tables_backend(self) -> PdfplumberBackend:
+        if self._plumber is None:
+            self._plumber = PdfplumberBackend(self.pdf_path)
+        return self._plumber
+
+    def _page_words(self, index: int) -> list:
+        if index in self._words:
+            return self._words[index]
+        page = self._pdf[index]
+        height = page.get_height()
+        textpage = page.get_textpage()
+        try:
+            text = textpage.get_text_range()
+            words, cur = [], None
+            for i, ch in enumerate(text):
+                if ch.isspace():
+                    cur = None
+                    continue
+                left, bottom, right, top = textpage.get_charbox(i, loose=True)
+                top, bottom = height - top, height - bottom
+                if (cur is not None and left - cur["x1"] <= self.x_tolerance
+                        and abs(top - cur["top"]) <= self.y_tolerance):
+                    cur["text"] += ch
+                    cur["x1"] = max(cur["x1"], right)
+                    cur["bottom"] = max(cur["bottom"], bottom)
+                else:
+                    cur = {"text": ch, "x0": left, "x1": right, "top": top, "bottom": bottom}
+                    words.append(cur)
+        finally:
+            textpage.close()
+            page.close()
+        self._words[index] = words
+        return words
+
+    def text(self, index: int) -> str:
+        return _words_to_text(self._page_words(index), self.y_tolerance)
+
+    def words(self, index: int) -> list:
+        return [dict(w) for w in self._page_words(index)]
+
+    def tables(self, index: int, region=None) -> list:
+        return self._tables_backend().tables(index, region)
+
+    def probe(self, index: int, band: float) -> dict:
+        words = self._page_words(index)
+        head = [w for w in words if w["bottom"] <= band]
+        return {"chars": sum(len(w["text"]) for w in words), "head": _words_to_text(head, self.y_tolerance)}
+
+    def learn_region(self, template):
+        return self._tables_backend().learn_region(template)
+
+    def metadata(self) -> dict:
+        return _info_fields(self._pdf.get_metadata_dict())
+
+    def release(self, index: int):
+        self._words.pop(index, None)
+        if self._plumber is not None:
+            self._plumber.release(index)
+
+    def close(self):
+        self._words.clear()
+        if self._plumber is not None:
+            self._plumber.close()
+            self._plumber = None
+        self._pdf.close()
+
+
+PDF_BACKENDS = {
+    PdfplumberBackend.name: PdfplumberBackend,
+    PdfiumBackend.name: PdfiumBackend,
+}
+
+
+def backend_class(name: str = None) -> type:
+    """Backend class for `name` (IngestionConfig.PDF_BACKEND by default); unknown names fall back to pdfplumber."""
+    name = (name or IngestionConfig.PDF_BACKEND or PdfplumberBackend.name).lower()
+    if name not in PDF_BACKENDS:
+        print(f"[WARN] Unknown PDF backend {name!r}; using {PdfplumberBackend.name}")
+        return PdfplumberBackend
+    if name == PdfiumBackend.name:
+        try:
+            import pypdfium2  # noqa: F401 (optional dependency)
+        except ImportError:
+            print(f"[WARN] pypdfium2 is not installed; using {PdfplumberBackend.name}")
+            return PdfplumberBackend
+    return PDF_BACKENDS[name]
@@ -0,0 +1,92 @@
+# modules/ingestion/registry.py
+import importlib
+import threading
+from dataclasses import dataclass
+
+# Bank manifest: the module that registers the bank's parser/validator when
+# first imported, plus the cheap text patterns detection scores for every
+# bank. Nothing here imports parser code or pdfplumber.
+BANK_MODULES = {
+    "HDFC": "app.services.ingestion.banks.hdfc",
+    "KOTAK": "app.services.ingestion.banks.kotak",
+    "SBI": "app.services.ingestion.banks.sbi",
+    "ICICI": "app.services.ingestion.banks.icici",
+    # No dedicated layout yet: HDFC-like text parser and validator
+    "AXIS": "app.services.ingestion.banks.generic",
+    "CUB": "app.services.ingestion.banks.generic",
+    "IDFC": "app.services.ingestion.banks.generic",
+}
+
+# Detection signals per bank as (pattern, weight): 3 = the bank's full name
+# or statement branding, 1 = a bare short name that may also appear in
+# narrations (e.g. a transfer to a Kotak account on an HDFC statement).
+DETECT_PATTERNS = {
+    "HDFC": [
+        (r"\bHDFC\s*BANK\b", 3),
+        (r"\bHDFC\s*BANK\s*LTD\b", 3),
+        (r"\bHDFCBANKLTD\b", 3),
+        (r"\bHDFCBANK\b", 3),
+        (r"Statement\s*of\s*account.*HDFC", 3),
+    ],
+    "KOTAK": [
+        (r"\bKOTAK\s*MAHINDRA\s*BANK\b", 3),
+        (r"\bKOTAK\b", 1),
+    ],
+    "SBI": [
+        (r"\bSTATE\s*BANK\s*OF\s*INDIA\b", 3),
+        (r"\bSBI\b", 1),
+        # Generalized - works with or without dates
+        (r"Account\s*Statement.*State\s*Bank\s*of\s*India", 3),
+        (r"Account\s*Statement.*SBI", 3),
+    ],
+    "ICICI": [
+        (r"\bICICI\s*BANK\b", 3),
+        (r"Account\s*Statement.*ICICI", 3),
+        (r"ICICIBANK", 3),
+    ],
+    "AXIS": [(r"\bAXIS\s*BANK\b", 3)],
+    "CUB": [(r"\bCITY\s*UNION\s*BANK\b", 3)],
+    "IDFC": [(r"\bIDFC\s*FIRST\s*BANK\b", 3)],
+}
+
+# Parser used for banks we cannot identify
+FALLBACK_BANK = "HDFC"
+
+
+@dataclass
+class BankSpec:
+    bank: str
+    parser: type            # PageParser subclass or factory returning a PageParser
+    validator: object       # split_std_rejects_* callable: (df_raw, bank, continuity=None) -> (std_df, rej_df)
+
+
+_registry = {}
+_lock = threading.Lock()
+
+
+def register_bank(bank: str, parser, validator):
+    """Called by a bank module at import time."""
+    _registry[bank.upper()] = BankSpec(bank.upper(), parser, validator)
+
+
+def supported_banks() -> list:
+    return list(BANK_MODULES)
+
+
+def is_supported(bank: str) -> bool:
+    return (bank or "").upper() in BANK_MODULES
+
+
+def get_bank(bank: str) -> BankSpec:
+    """
+    Spec for `bank`, importing its module on first use. Unknown banks get the
+    fallback (HDFC-like) spec.
+    """
+    key = (bank or "").upper()
+    if key not in BANK_MODULES:
+        key = FALLBACK_BANK
+    if key not in _registry:
+        with _lock:
+            if key not in _registry:
+                importlib.import_module(BANK_MODULES[key])
+    return _registry[key]
@@ -1,6 +1,5 @@
 import os
 import uuid
-import traceback
 import pandas as pd
 from flask import (
     current_app, render_template, request, send_from_directory,
@@ -8,22 +7,11 @@ from flask import (
 )
 from werkzeug.utils import secure_filename
 from . import ingestion_bp
-from .detect import detect_bank
-from .extract import parse_kotak_df, parse_hdfc_df, parse_sbi_df, parse_icici_df
-from .standardize import standardize_and_write
+from .batch import PdfJob, load_manifest, process_pdfs, write_manifest
+from .outputs import csv_name, export_csv
+from .registry import supported_banks
 from app.services.repair.repair_rejects import repair_reject_file
 
-# Golden STD schema
-STD_COLS = [
-    "Transaction_ID",
-    "Transaction_Date",
-    "Description",
-    "Debit_Amount",
-    "Credit_Amount",
-    "Balance",
-    "Bank_Name",
-]
-
 def _is_pdf_filename(name: str) -> bool:
     return (name or "").lower().endswith(".pdf")
 
@@ -66,64 +54,27 @@ def upload():
     # =====================================================
     # Process PDF Statements
     # =====================================================
+    # Uploads are saved here (request streams are not shareable), then
+    # detected, parsed and standardized concurrently; results keep upload order.
+    # The per-file index keeps same-named uploads, and so their outputs, apart.
+    jobs = []
     for f in pdf_files:
         raw_name = (f.filename or "").strip()
         if not raw_name or not _is_pdf_filename(raw_name):
             continue
 
         safe = secure_filename(raw_name)
-        in_path = os.path.join(upload_dir, f"{batch_id}_{safe}")
+        in_path = os.path.join(upload_dir, f"{batch_id}_{len(jobs)}_{safe}")
         f.save(in_path)
+        jobs.append(PdfJob(path=in_path, name=raw_name, bank_hint=bank_hint))
 
-        # --- Detect Bank ---
-        bank = bank_hint or detect_bank(in_path)
-        base = os.path.splitext(os.path.basename(in_path))[0]
-        print(f"[PDF] Processing {raw_name} -> Detected Bank: {bank}")
-
-        try:
-            # --- Parse Based on Bank ---
-            if bank == "KOTAK":
-                df_raw = parse_kotak_df(in_path)
-            elif bank == "HDFC":
-                df_raw = parse_hdfc_df(in_path)
-            elif bank == "ICICI":
-                df_raw = parse_icici_df(in_path)
-            elif bank == "SBI":
-                df_raw = parse_sbi_df(in_path)
-            else:
-                print(f"[WARN] Unknown bank for {raw_name}. Falling back to HDFC-like parser.")
-                df_raw = parse_hdfc_df(in_path)
-
-            # --- Validate & Standardize ---
-            std_csv, rej_csv = standardize_and_write(df_raw, bank, base, output_dir)
-            std_csvs.append(os.path.basename(std_csv))
-            rej_csvs.append(os.path.basename(rej_csv))
-
-        except Exception as e:
-            # --- Error Handling ---
-            err_bank = (bank or "UNKNOWN").upper()
-            std_path = os.path.join(output_dir, f"{base}__STD_{err_bank}.csv")
-            rej_path = os.path.join(output_dir, f"{base}__REJECTS_{err_bank}.csv")
-
-            pd.DataFrame(columns=STD_COLS).to_csv(std_path, index=False, encoding="utf-8-sig")
-
-            tb = traceback.format_exc(limit=2)
-            rej_df = pd.DataFrame([{
-                "Bank_Name": err_bank,
-                "Raw_Date": "",
-                "Raw_Narration": "",
-                "Raw_Debit": "",
-                "Raw_Credit": "",
-                "Raw_Balance": "",
-                "Reason": "parser_exception",
-                "Detail": str(e),
-                "Trace": tb,
-            }])
-            rej_df.to_csv(rej_path, index=False, encoding="utf-8-sig")
-
-            std_csvs.append(os.path.basename(std_path))
-            rej_csvs.append(os.path.basename(rej_path))
-            print(f"  Parser error for {raw_name}: {e}")
+    results = process_pdfs(jobs, output_dir)
+    for r in results:
+        # The preview pages show CSV; Parquet outputs are exported on download
+        std_csvs.append(csv_name(r.std_csv))
+        rej_csvs.append(csv_name(r.rej_csv))
+        print(f"[PDF] {r.name}: {r.bank} in {r.timings['total']:.2f}s"
+              f" (detect {r.timings['detect']:.2f}s, parse {r.timings['parse']:.2f}s)")
 
     # =====================================================
     # Process Uploaded CSV Files
@@ -151,11 +102,15 @@ def upload():
     if not std_csvs:
         return "No valid files processed.", 400
 
+    if results:
+        write_manifest(batch_id, results, output_dir)
+
     return redirect(url_for(
         "ingestion.preview",
         primary=std_csvs[0],
         others=",".join(std_csvs[1:]),
-        rejects=",".join(rej_csvs)
+        rejects=",".join(rej_csvs),
+        batch=batch_id if results else None,
     ))
 
 
@@ -168,12 +123,16 @@ def preview():
     primary = request.args.get("primary")
     others  = [x for x in (request.args.get("others") or "").split(",") if x]
     rejects = [x for x in (request.args.get("rejects") or "").split(",") if x]
-    return render_template("ingestion/preview.html", primary=primary, others=others, rejects=rejects)
+    batch_id = request.args.get("batch")
+    output_dir = current_app.config.get("OUTPUT_FOLDER", "storage/outputs")
+    files = load_manifest(batch_id, output_dir) if batch_id else []
+    return render_template("ingestion/preview.html", primary=primary, others=others, rejects=rejects, files=files)
 
 
 @ingestion_bp.get("/ingestion/download/<path:fname>")
 def download(fname):
     output_dir = current_app.config.get("OUTPUT_FOLDER", "storage/outputs")
+    export_csv(output_dir, fname)
     return send_from_directory(output_dir, fname, as_attachment=True)
 
 
@@ -183,8 +142,6 @@ def download(fname):
 
 @ingestion_bp.route("/repair", methods=["GET", "POST"])
 def repair():
-    supported_banks = ["HDFC", "KOTAK", "SBI", "ICICI", "CUB", "AXIS", "IDFC"]
-
     if request.method == "POST":
         file = request.files.get("reject_file")
         bank = request.form.get("bank")
@@ -215,4 +172,4 @@ def repair():
             flash("Repair failed or file was empty or incorrect format.")
             return redirect(request.url)
 
-    return render_template("repair.html", banks=supported_banks)
+    return render_template("repair.html", banks=supported_banks())
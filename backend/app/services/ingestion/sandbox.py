@@ -0,0 +1,223 @@
+# modules/ingestion/sandbox.py
+import multiprocessing
+import os
+import signal
+import threading
+import time
+import traceback
+from app.config import IngestionConfig
+
+try:
+    import resource  # POSIX only
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+# How often the parent checks the child's clocks and memory
+POLL_SECONDS = 0.2
+
+# Imported once by the fork server, so each sandboxed child starts warm
+FORKSERVER_PRELOAD = ["app.services.ingestion.batch"]
+
+
+def _forkserver_context():
+    """Fork-server context (spawn where there is none): children never inherit other threads' locks."""
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(FORKSERVER_PRELOAD)
+    return ctx
+
+
+def pool_context():
+    """
+    multiprocessing context for process pools: plain fork while this process
+    runs a single thread (the sandboxed child), the fork server otherwise
+    (a web worker with job and supervisor threads).
+    """
+    if threading.active_count() == 1 and "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return _forkserver_context()
+
+
+class SandboxError(Exception):
+    """A sandboxed parse failed; `reason` is the REJECTS reason code, `trace` the child's traceback."""
+    reason = "parser_exception"
+
+    def __init__(self, message: str, trace: str = "", reason: str = None):
+        super().__init__(message)
+        self.trace = trace
+        if reason:
+            self.reason = reason
+
+
+class ParserTimeout(SandboxError):
+    reason = "parser_timeout"
+
+
+class ParserOOM(SandboxError):
+    reason = "parser_oom"
+
+
+def _status_kb(pid, field: str):
+    """A kB field (VmRSS, VmSize) of /proc/<pid>/status, or None where /proc is unavailable."""
+    try:
+        with open(f"/proc/{pid}/status", "r") as fh:
+            for line in fh:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
+def _descendants(pid) -> list:
+    """Child pids of every thread of `pid`, recursively ([] where /proc is unavailable)."""
+    found = []
+    try:
+        tasks = os.listdir(f"/proc/{pid}/task")
+    except OSError:
+        return found
+    for tid in tasks:
+        try:
+            with open(f"/proc/{pid}/task/{tid}/children", "r") as fh:
+                children = [int(c) for c in fh.read().split()]
+        except (OSError, ValueError):
+            continue
+        for child in children:
+            found += [child] + _descendants(child)
+    return found
+
+
+def _tree_rss_kb(pid):
+    """VmRSS of `pid` plus all its descendants (prefetch pool workers), or None without /proc."""
+    sizes = [_status_kb(p, "VmRSS") for p in [pid] + _descendants(pid)]
+    sizes = [kb for kb in sizes if kb is not None]
+    return sum(sizes) if sizes else None
+
+
+def _kill_tree(proc):
+    for pid in _descendants(proc.pid):
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except OSError:
+            pass
+    proc.kill()
+
+
+def _limit_memory(max_rss_mb: int):
+    """Cap the child's address space at its current size plus `max_rss_mb` (Linux rlimit backstop)."""
+    if resource is None or not max_rss_mb:
+        return
+    current_kb = _status_kb("self", "VmSize") or 0
+    limit = current_kb * 1024 + max_rss_mb * 1024 * 1024
+    try:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def _child(fn, args, conn, max_rss_mb, config):
+    # Runtime changes to IngestionConfig (tests, admin overrides) do not
+    # survive a fresh interpreter; re-apply the parent's values
+    for name, value in config.items():
+        setattr(IngestionConfig, name, value)
+    _limit_memory(max_rss_mb)
+
+    def report(**fields):
+        conn.send(("report", fields))
+
+    try:
+        conn.send(("result", fn(*args, report)))
+    except MemoryError:
+        conn.send(("error", ParserOOM.reason, f"parser exceeded its {max_rss_mb} MB memory cap", ""))
+    except Exception as e:
+        conn.send(("error", getattr(e, "reason", SandboxError.reason), str(e), traceback.format_exc(limit=2)))
+    finally:
+        conn.close()
+
+
+def run_sandboxed(fn, *args, progress=None, timeout: float = None, page_timeout: float = None,
+                  max_rss_mb: int = None):
+    """
+    Run fn(*args, report) in a child process and return its result. The
+    child comes from the fork server, never from a fork of this (possibly
+    multithreaded) process, so `fn` and `args` must pickle.
+    `report(**fields)` streams progress to the parent, where `progress(fields)`
+    receives it; a report with `pages_done` restarts the per-page clock.
+
+    Limits (IngestionConfig.SANDBOX_* by default):
+    - `timeout`: wall-clock seconds for the whole call -> ParserTimeout
+    - `page_timeout`: seconds between page reports, once the first page
+      was reported (setup and prefetch only count against `timeout`)
+      -> ParserTimeout
+    - `max_rss_mb`: resident memory of the child and its own children
+      (prefetch pool workers), polled from /proc and summed, with a
+      per-process address space rlimit as backstop -> ParserOOM
+    Exceptions raised by `fn` come back as SandboxError carrying their
+    `reason` attribute (default parser_exception) and traceback.
+
+    With IngestionConfig.SANDBOX_ENABLED off, fn runs inline.
+    """
+    timeout = IngestionConfig.SANDBOX_TIMEOUT_S if timeout is None else timeout
+    page_timeout = IngestionConfig.SANDBOX_PAGE_TIMEOUT_S if page_timeout is None else page_timeout
+    max_rss_mb = IngestionConfig.SANDBOX_MAX_RSS_MB if max_rss_mb is None else max_rss_mb
+    progress = progress or (lambda fields: None)
+
+    if not IngestionConfig.SANDBOX_ENABLED:
+        return fn(*args, lambda **fields: progress(fields))
+
+    ctx = _forkserver_context()
+    config = {k: v for k, v in vars(IngestionConfig).items() if k.isupper()}
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_child, args=(fn, args, send_conn, max_rss_mb, config))
+    proc.start()
+    send_conn.close()
+
+    started = time.monotonic()
+    last_page = None
+    pages_done = 0
+    outcome = None
+    try:
+        while outcome is None:
+            if recv_conn.poll(POLL_SECONDS):
+                try:
+                    msg = recv_conn.recv()
+                except EOFError:
+                    break  # child exited without a result
+                if msg[0] == "report":
+                    if "pages_done" in msg[1]:
+                        last_page, pages_done = time.monotonic(), msg[1]["pages_done"]
+                    progress(msg[1])
+                else:
+                    outcome = msg
+                    break
+
+            now = time.monotonic()
+            if timeout and now - started > timeout:
+                raise ParserTimeout(f"parse exceeded {timeout:g}s wall-clock limit after {pages_done} pages")
+            if page_timeout and last_page is not None and now - last_page > page_timeout:
+                raise ParserTimeout(f"page {pages_done + 1} exceeded {page_timeout:g}s per-page limit")
+            rss_kb = _tree_rss_kb(proc.pid)
+            if max_rss_mb and rss_kb and rss_kb > max_rss_mb * 1024:
+                raise ParserOOM(f"parser used {rss_kb // 1024} MB, over its {max_rss_mb} MB cap")
+            if not proc.is_alive() and not recv_conn.poll():
+                break
+    finally:
+        if outcome is None and proc.is_alive():
+            _kill_tree(proc)
+        proc.join()
+        recv_conn.close()
+
+    if outcome is None:
+        if proc.exitcode == -signal.SIGKILL:
+            raise ParserOOM(f"parser process was killed (likely out of memory) after {pages_done} pages")
+        raise SandboxError(f"parser process exited with code {proc.exitcode} after {pages_done} pages")
+    if outcome[0] == "result":
+        return outcome[1]
+    _, reason, message, trace = outcome
+    if reason == ParserOOM.reason:
+        raise ParserOOM(message, trace)
+    raise SandboxError(message, trace, reason)
@@ -0,0 +1,124 @@
+# modules/ingestion/schema.py
+import re
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_float_dtype, is_integer_dtype
+
+# Typed STD intermediate: what validators emit and standardize consumes.
+# Money is int64 minor units (paise) so amounts are never reparsed or
+# rounded on the way through; strings only appear at the CSV boundary.
+MONEY_COLS = ["Debit_Amount", "Credit_Amount", "Balance"]
+STD_DTYPES = {
+    "Transaction_Date": "datetime64[ns]",
+    "Description": object,
+    "Debit_Amount": "Int64",
+    "Credit_Amount": "Int64",
+    "Balance": "Int64",
+    "Bank_Name": "category",
+}
+TYPED_COLS = list(STD_DTYPES)
+
+_MONEY_NOISE = re.compile(r"[,\s₹]")
+
+
+def parse_money(values) -> pd.Series:
+    """Amount column (strings, floats or ints) -> Int64 minor units; missing/unparseable -> <NA>."""
+    s = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    if is_integer_dtype(s.dtype):
+        return s.astype("Int64")
+    if is_float_dtype(s.dtype):
+        numbers = s.astype("float64")
+    else:
+        text = s.astype(object).where(s.notna(), "").astype(str)
+        numbers = pd.to_numeric(text.str.replace(_MONEY_NOISE, "", regex=True), errors="coerce")
+    numbers = numbers.where(np.isfinite(numbers))
+    return (numbers * 100).round().astype("Int64")
+
+
+def parse_dates(values) -> pd.Series:
+    """ISO (or day-first) date column -> datetime64; unparseable -> NaT."""
+    s = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    if is_datetime64_any_dtype(s.dtype):
+        return s.astype("datetime64[ns]")
+    text = s.astype(object).where(s.notna(), "").astype(str).str.strip()
+    dates = pd.to_datetime(text, format="%Y-%m-%d", errors="coerce")
+    missed = dates.isna() & text.ne("")
+    if missed.any():
+        dates[missed] = pd.to_datetime(text[missed], dayfirst=True, errors="coerce", format="mixed")
+    return dates.astype("datetime64[ns]")
+
+
+def std_frame(rows: list) -> pd.DataFrame:
+    """Typed STD frame from validator row dicts (dates as date/datetime, money as minor units)."""
+    df = pd.DataFrame(rows, columns=TYPED_COLS)
+    df["Transaction_Date"] = pd.to_datetime(df["Transaction_Date"]).astype("datetime64[ns]")
+    for col in MONEY_COLS:
+        df[col] = df[col].astype("Int64")
+    df["Bank_Name"] = df["Bank_Name"].astype("category")
+    return df
+
+
+def coerce_std(df: pd.DataFrame, columns: list = TYPED_COLS) -> pd.DataFrame:
+    """
+    `df` with the typed STD `columns` (default: all) present and in their
+    STD_DTYPES dtype. Columns already typed are left alone, so validator
+    output passes through without conversion; string frames (legacy
+    validators, CSVs) are parsed once.
+    """
+    for col in columns:
+        if col not in df.columns:
+            df[col] = pd.Series(pd.NA if col in MONEY_COLS else None, index=df.index, dtype=object)
+    if "Transaction_Date" in columns and not is_datetime64_any_dtype(df["Transaction_Date"].dtype):
+        df["Transaction_Date"] = parse_dates(df["Transaction_Date"])
+    for col in MONEY_COLS:
+        if col in columns and str(df[col].dtype) != "Int64":
+            df[col] = parse_money(df[col])
+    if "Bank_Name" in columns and not isinstance(df["Bank_Name"].dtype, pd.CategoricalDtype):
+        df["Bank_Name"] = df["Bank_Name"].astype("category")
+    return df
+
+
+def format_money(minor: pd.Series) -> pd.Series:
+    """Int64 minor units -> '%.2f' strings; <NA> -> ''."""
+    values = minor.astype("float64") / 100
+    return values.map("{:.2f}".format).where(minor.notna(), "")
+
+
+def format_dates(dates: pd.Series) -> pd.Series:
+    """datetime64 -> 'YYYY-MM-DD'; NaT -> ''."""
+    return dates.dt.strftime("%Y-%m-%d").fillna("")
+
+
+def to_export(df: pd.DataFrame) -> pd.DataFrame:
+    """String view of a typed STD frame for CSV export (the only place amounts become text)."""
+    out = df.copy()
+    if "Transaction_Date" in out.columns and is_datetime64_any_dtype(out["Transaction_Date"].dtype):
+        out["Transaction_Date"] = format_dates(out["Transaction_Date"])
+    for col in MONEY_COLS:
+        if col in out.columns and is_integer_dtype(out[col].dtype):
+            out[col] = format_money(out[col])
+    if "Bank_Name" in out.columns:
+        out["Bank_Name"] = out["Bank_Name"].astype(str)
+    return out
+
+
+def read_std_csv(path: str, columns: list = None) -> pd.DataFrame:
+    """
+    Typed STD frame from an exported STD CSV; extra columns (is_repaired,
+    ...) are kept as read. With `columns` only those are parsed and typed.
+    """
+    usecols = (lambda c: c in columns) if columns is not None else None
+    df = pd.read_csv(path, usecols=usecols, dtype={c: str for c in ["Transaction_ID", "Description", "Bank_Name"]})
+    typed = [c for c in TYPED_COLS if columns is None or c in columns]
+    for col in typed:
+        if col not in df.columns:
+            df[col] = None
+    return coerce_std(df, typed)
+
+
+def minor_to_decimal(value):
+    """Minor units -> Decimal with 2 places (for Numeric columns), or None for <NA>."""
+    if value is None or pd.isna(value):
+        return None
+    return Decimal(int(value)).scaleb(-2)
@@ -0,0 +1,71 @@
+# modules/ingestion/statement_meta.py
+import re
+from dataclasses import asdict, dataclass
+from .dates import normalize_date, parse_date
+
+# Bump when the patterns change: results are memoized in the extraction cache
+META_VERSION = "1"
+
+_DATE = r"\d{1,2}[-/ ](?:\d{1,2}|[A-Za-z]{3,9})[-/ ]\d{2,4}"
+
+# "From : 01/07/2025 To : 31/07/2025", "Period 01/04/2024 - 30/04/2024",
+# "for the period 01-Apr-2024 to 30-Apr-2024", "01 Jul 2025 - 31 Jul 2025"
+PERIOD_RE = re.compile(
+    rf"(?:(?:From|Period|Statement\s+Period)\s*:?\s*)?({_DATE})\s*(?:To|-|–)\s*:?\s*({_DATE})",
+    re.I,
+)
+ACCOUNT_RE = re.compile(
+    r"\b(?:A/?C|Account)\s*(?:No\.?|Number|#)?\s*:?\s*([0-9Xx*]{6,20})\b",
+    re.I,
+)
+
+
+@dataclass
+class StatementMeta:
+    """Statement header facts: ISO period bounds and the masked account number (each may be None)."""
+    period_start: str = None
+    period_end: str = None
+    account_masked: str = None
+
+
+def _iso_date(text: str):
+    parsed = parse_date(normalize_date(text))
+    return parsed.isoformat() if parsed else None
+
+
+def mask_account(number: str) -> str:
+    """All but the last 4 digits replaced by X (already masked digits stay masked)."""
+    digits = re.sub(r"[^0-9Xx*]", "", number or "")
+    if len(digits) <= 4:
+        return digits.upper()
+    return "X" * (len(digits) - 4) + digits[-4:].upper()
+
+
+def parse_statement_meta(lines: list) -> StatementMeta:
+    """Period and account from header lines; the first plausible match of each wins."""
+    meta = StatementMeta()
+    for line in lines:
+        if meta.period_start is None:
+            m = PERIOD_RE.search(line)
+            if m:
+                start, end = _iso_date(m.group(1)), _iso_date(m.group(2))
+                if start and end and start <= end:
+                    meta.period_start, meta.period_end = start, end
+        if meta.account_masked is None:
+            m = ACCOUNT_RE.search(line)
+            if m and sum(ch.isdigit() for ch in m.group(1)) >= 4:
+                meta.account_masked = mask_account(m.group(1))
+        if meta.period_start and meta.account_masked:
+            break
+    return meta
+
+
+def statement_meta(doc) -> StatementMeta:
+    """
+    StatementMeta of an open StatementDocument, read from page 1 and
+    memoized with the document's extraction cache entry.
+    """
+    def compute():
+        return asdict(parse_statement_meta(doc.page_lines(0) if doc.page_count else []))
+
+    return StatementMeta(**doc.remember(f"statement-meta-v{META_VERSION}", compute))
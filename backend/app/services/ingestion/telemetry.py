@@ -0,0 +1,163 @@
+# modules/ingestion/telemetry.py
+import json
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from app.config import IngestionConfig
+
+try:
+    import resource  # POSIX only
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+STAGES = ("open", "detect", "meta", "extract", "validate", "write")
+
+_write_lock = threading.Lock()
+
+
+def _peak_rss_mb():
+    """Peak resident memory of this process in MB (VmHWM, else getrusage), or None."""
+    try:
+        with open("/proc/self/status", "r") as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is not None:
+        return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    return None
+
+
+class IngestTelemetry:
+    """
+    Per-file ingestion metrics, filled in while one PDF is parsed: wall time
+    per stage (STAGES), pages, STD/REJECTS row counts and the parser used.
+    `entry()` turns them into one JSON-serializable telemetry record with
+    rows/sec, reject rate and peak memory of the measuring process.
+    """
+
+    def __init__(self, name: str, bank: str = None):
+        self.name = name
+        self.bank = bank
+        self.parser = None
+        self.pages = None
+        self.rows_std = 0
+        self.rows_rej = 0
+        self.stages = dict.fromkeys(STAGES, 0.0)
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Add the wall time of the enclosed block to stage `name`."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - started
+
+    def use_parser(self, parser):
+        self.parser = f"{type(parser).__name__}/v{parser.version}"
+
+    def entry(self, status: str = "ok", error: str = None) -> dict:
+        total = time.perf_counter() - self._started
+        rows = self.rows_std + self.rows_rej
+        return {
+            "at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "file": self.name,
+            "bank": (self.bank or "UNKNOWN").upper(),
+            "parser": self.parser,
+            "status": status,
+            "error": error,
+            "pages": self.pages,
+            "rows_std": self.rows_std,
+            "rows_rej": self.rows_rej,
+            "reject_rate": round(self.rows_rej / rows, 4) if rows else 0.0,
+            "rows_per_s": round(rows / total, 1) if total > 0 else None,
+            "stages_s": {k: round(v, 4) for k, v in self.stages.items()},
+            "total_s": round(total, 4),
+            "peak_rss_mb": _peak_rss_mb(),
+        }
+
+
+def failure_entry(name: str, bank: str, reason: str, error: str, seconds: float) -> dict:
+    """Record for a file whose parse produced no telemetry (timeout, OOM, crash)."""
+    entry = IngestTelemetry(name, bank).entry(status=reason, error=error)
+    entry.update(total_s=round(seconds, 4), rows_per_s=None, peak_rss_mb=None)
+    return entry
+
+
+def record(entry: dict, profile_id: str = None):
+    """
+    Append one record to IngestionConfig.TELEMETRY_PATH (JSONL); never raises.
+    `profile_id` tags it with the owner of the file, for per-user reads.
+    """
+    if not IngestionConfig.TELEMETRY_ENABLED or not entry:
+        return
+    if profile_id is not None:
+        entry = dict(entry, profile_id=str(profile_id))
+    path = IngestionConfig.TELEMETRY_PATH
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with _write_lock, open(path, "a", encoding="utf-8") as fh:
+            fh.write(line)
+    except OSError as e:
+        print(f"[TELEMETRY] Could not write {path}: {e}")
+
+
+def recent(limit: int = 200, bank: str = None, profile_id: str = None) -> list:
+    """
+    The last `limit` records, oldest first, optionally for one bank. With
+    `profile_id` only that user's records are returned (untagged ones never).
+    """
+    bank = (bank or "").upper() or None
+    profile_id = str(profile_id) if profile_id is not None else None
+    runs = deque(maxlen=max(limit, 0))
+    try:
+        with open(IngestionConfig.TELEMETRY_PATH, "r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if profile_id is not None and entry.get("profile_id") != profile_id:
+                    continue
+                if bank is None or entry.get("bank") == bank:
+                    runs.append(entry)
+    except OSError:
+        return []
+    return list(runs)
+
+
+def summarize(runs: list) -> list:
+    """
+    Per (bank, parser) aggregates of `runs`: file and failure counts, median
+    rows/sec and seconds per page, overall reject rate and max peak memory.
+    """
+    groups = {}
+    for run in runs:
+        groups.setdefault((run.get("bank"), run.get("parser")), []).append(run)
+
+    summary = []
+    for (bank, parser), group in sorted(groups.items(), key=lambda kv: (kv[0][0] or "", kv[0][1] or "")):
+        ok = [r for r in group if r.get("status") == "ok"]
+        speeds = [r["rows_per_s"] for r in ok if r.get("rows_per_s") is not None]
+        per_page = [r["total_s"] / r["pages"] for r in ok if r.get("pages")]
+        rows = sum(r["rows_std"] + r["rows_rej"] for r in ok)
+        peaks = [r["peak_rss_mb"] for r in ok if r.get("peak_rss_mb") is not None]
+        summary.append({
+            "bank": bank,
+            "parser": parser,
+            "files": len(group),
+            "failures": len(group) - len(ok),
+            "median_rows_per_s": statistics.median(speeds) if speeds else None,
+            "median_s_per_page": round(statistics.median(per_page), 4) if per_page else None,
+            "reject_rate": round(sum(r["rows_rej"] for r in ok) / rows, 4) if rows else None,
+            "max_peak_rss_mb": max(peaks) if peaks else None,
+        })
+    return summary
@@ -1,12 +1,12 @@
 import re
+import numpy as np
 import pandas as pd
-from datetime import datetime
+from .continuity import BalanceContinuity
+from .dates import DATE_FORMATS, parse_date_column
+from .schema import TYPED_COLS, format_dates, format_money, parse_money, std_frame
 
 
 # -------- Numbers --------
-_NUM_BODY = r"[+-]?\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?"
-NUM_RE = re.compile(rf"^{_NUM_BODY}$")
-
 def _to_float_or_none(x):
     if x is None:
         return None
@@ -18,309 +18,264 @@ def _to_float_or_none(x):
     except Exception:
         return None
 
-def _fmt2(x) -> str:
-    try:
-        return f"{float(x):.2f}"
-    except Exception:
-        return ""
-
-def _norm_num_2d(x: str) -> str:
-    v = _to_float_or_none(x)
-    return _fmt2(v) if v is not None else ""
-
-# -------- Dates --------
-_DATE_FORMATS = (
-    "%d-%m-%Y", "%d-%m-%y",
-    "%d/%m/%Y", "%d/%m/%y",
-    "%d-%b-%Y", "%d-%b-%y",
-    "%d-%B-%Y", "%d-%B-%y",
-)
-
-def _parse_date_iso(d: str) -> str:
-    """Parse various date formats like 01-Apr-23, 1 Apr 2023, 01/04/23, etc."""
-    if d is None:
-        return ""
-    s = str(d).strip().replace("–", "-").replace("—", "-")  # normalize dash
-    s = re.sub(r"\s+", "-", s)  # replace spaces with dash to standardize
-    if not s:
-        return ""
-    s_try = s.replace("/", "-").title()  # make 'apr' → 'Apr'
-
-    for fmt in (
-        "%d-%b-%y", "%d-%b-%Y", "%d-%B-%y", "%d-%B-%Y",
-        "%d-%m-%y", "%d-%m-%Y",
-        "%d/%b/%y", "%d/%b/%Y",
-        "%d/%m/%y", "%d/%m/%Y",
-    ):
-        try:
-            dt = datetime.strptime(s_try, fmt)
-            return dt.strftime("%Y-%m-%d")
-        except Exception:
-            continue
-    return ""
-
 # -------- Kotak helpers --------
 _DR_CR_TAG = re.compile(r"\((Dr|Cr)\)", re.I)
 
-def _split_kotak_amount(amt_drcr: str) -> tuple[str, str]:
-    if not amt_drcr:
-        return "", ""
-    s = str(amt_drcr).strip()
-    tag = None
-    m = _DR_CR_TAG.search(s)
-    if m:
-        tag = m.group(1).lower()
-        s = _DR_CR_TAG.sub("", s).strip()
-    val = _norm_num_2d(s)
-    if val == "":
-        return "", ""
-    if tag == "dr":
-        return val, ""
-    if tag == "cr":
-        return "", val
-    return val, ""  # default debit
-
-def _strip_kotak_balance_tag(bal_drcr: str) -> str:
-    if not bal_drcr:
-        return ""
-    s = _DR_CR_TAG.sub("", str(bal_drcr)).strip()
-    return _norm_num_2d(s)
+# -------- Column-wise validation engine --------
+# Every splitter parses its columns once, derives one boolean mask per reject
+# reason and splits the frame with them; no per-row Python dicts.
+
+def _text(df: pd.DataFrame, col: str, falsy_empty: bool = False) -> pd.Series:
+    """str(cell).strip() for a raw column ('' when missing); falsy_empty maps None/''/0 to ''."""
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    values = df[col].astype(object)
+    if falsy_empty:
+        values = values.where(values.astype(bool), "")
+    return values.astype(str).str.strip()
+
+
+def _norm_amounts(text: pd.Series) -> pd.Series:
+    """Amounts as '%.2f' strings, '' for missing, unparseable or non-finite ones (commas ignored)."""
+    body = text.str.strip().str.replace(",", "", regex=False)
+    values = pd.to_numeric(body.where(~body.isin(["", "+", "-"])), errors="coerce")
+    retry = values.isna() & ~body.isin(["", "+", "-"])
+    if retry.any():  # float() accepts a few spellings to_numeric does not (e.g. '1_000')
+        values[retry] = body[retry].map(_to_float_or_none).astype("float64")
+    ok = np.isfinite(values)
+    norm = pd.Series("", index=text.index, dtype=object)
+    norm[ok] = values[ok].map("{:.2f}".format)
+    return norm
+
+
+def _present(norm: pd.Series) -> pd.Series:
+    """Amount given and not '0.00' ('-0.00' counts as given)."""
+    return norm.ne("") & norm.ne("0.00")
+
+
+def _dates(raw: pd.Series, formats: tuple = DATE_FORMATS, normalize: bool = True) -> tuple:
+    """(ISO string per row, '' where unparseable; datetime64) via dates.parse_date_column."""
+    txn_date = parse_date_column(raw, formats, normalize)
+    return format_dates(txn_date), txn_date
+
+
+def _balance_check(continuity, debit: pd.Series, credit: pd.Series, balance: pd.Series) -> tuple:
+    """
+    (mismatch mask, suggested debit, suggested credit) from a
+    BalanceContinuity over the typed amounts. Suggestions are the balance
+    delta as '%.2f' text on mismatched rows and '' elsewhere.
+    """
+    mismatch, delta = (continuity or BalanceContinuity()).check(debit, credit, balance)
+    sug_debit = pd.Series("", index=balance.index, dtype=object)
+    sug_credit = sug_debit.copy()
+    if mismatch.any():
+        delta = delta[mismatch]
+        text = format_money(delta.abs())
+        sug_debit[text.index[delta.lt(0)]] = text[delta.lt(0)]
+        sug_credit[text.index[delta.ge(0)]] = text[delta.ge(0)]
+    return mismatch, sug_debit, sug_credit
+
+
+def _zero_if_no_amount(debit: pd.Series, credit: pd.Series) -> tuple:
+    """STD amounts: 0.00 on both sides for rows that have neither (after the continuity check saw <NA>)."""
+    no_amount = debit.isna() & credit.isna()
+    return debit.mask(no_amount, 0), credit.mask(no_amount, 0)
+
+
+def _reason_text(reasons: list) -> pd.Series:
+    """';'-joined names of the reasons whose mask is set, per row."""
+    index = reasons[0][1].index
+    text = pd.Series("", index=index, dtype=object)
+    for name, mask in reasons:
+        text = text.where(~mask, text + np.where(text.ne(""), ";", "") + name)
+    return text
+
+
+def _split(reasons: list, std_cols: dict, rej_cols: dict) -> tuple:
+    """
+    STD frame (typed, rows with no reason) and REJECTS frame (rows with at
+    least one) from per-row column Series and (name, mask) reasons. The
+    REJECTS "Reason" column is filled in here; scalars are broadcast.
+    """
+    reason = _reason_text(reasons)
+    rejected = reason.ne("")
+
+    std = std_frame([])
+    if not rejected.all():
+        keep = ~rejected
+        std = pd.DataFrame({c: std_cols[c][keep] for c in TYPED_COLS}).reset_index(drop=True)
+        std = std.astype({"Bank_Name": "category"})
+
+    if not rejected.any():
+        return std, pd.DataFrame()
+    rej_cols = dict(rej_cols, Reason=reason)
+    rej = pd.DataFrame({c: v[rejected] if isinstance(v, pd.Series) else v for c, v in rej_cols.items()})
+    return std, rej.reset_index(drop=True)
+
 
 # -------- Splitters --------
-def split_std_rejects_kotak(df_raw: pd.DataFrame, bank_name: str = "KOTAK"):
-    std_rows, rej_rows = [], []
+def split_std_rejects_kotak(df_raw: pd.DataFrame, bank_name: str = "KOTAK", continuity: BalanceContinuity = None):
     bank = (bank_name or "KOTAK").upper()
     if df_raw is None or df_raw.empty:
-        return pd.DataFrame(std_rows), pd.DataFrame(rej_rows)
-
-    for _, r in df_raw.iterrows():
-        raw_date = str(r.get("Date", "")).strip()
-        narr = str(r.get("Narration", "")).strip()
-        amt = str(r.get("Amount (Dr/Cr)", "")).strip()
-        bal = str(r.get("Balance (Dr/Cr)", "")).strip()
-
-        iso = _parse_date_iso(raw_date)
-        debit, credit = _split_kotak_amount(amt)
-        bal_clean = _strip_kotak_balance_tag(bal)
-
-        reasons = []
-        if iso == "":
-            reasons.append("bad_date")
-        if bal_clean == "":
-            reasons.append("bad_balance")
-
-        if reasons:
-            rej_rows.append({
-                "Bank_Name": bank,
-                "Raw_Date": raw_date,
-                "Raw_Narration": narr,
-                "Raw_Amount": amt,
-                "Raw_Balance": bal,
-                "Reason": ";".join(reasons),
-                "Suggest_Date": iso,
-                "Suggest_Debit": debit,
-                "Suggest_Credit": credit,
-                "Suggest_Balance": bal_clean
-            })
-            continue
-
-        if debit == "" and credit == "":
-            debit, credit = "0.00", "0.00"
-
-        std_rows.append({
-            "Transaction_Date": iso,
+        return std_frame([]), pd.DataFrame()
+
+    raw_date = _text(df_raw, "Date")
+    narr = _text(df_raw, "Narration")
+    amt = _text(df_raw, "Amount (Dr/Cr)")
+    bal = _text(df_raw, "Balance (Dr/Cr)")
+
+    iso, txn_date = _dates(raw_date)
+    # Amount: first (Dr)/(Cr) tag decides the side; untagged amounts are debits
+    tag = amt.str.extract(_DR_CR_TAG, expand=False).str.lower()
+    amount = _norm_amounts(amt.str.replace(_DR_CR_TAG, "", regex=True))
+    debit = amount.where(tag.ne("cr"), "")
+    credit = amount.where(tag.eq("cr"), "")
+    bal_clean = _norm_amounts(bal.str.replace(_DR_CR_TAG, "", regex=True))
+
+    debit_m = parse_money(debit)
+    credit_m = parse_money(credit)
+    bal_m = parse_money(bal_clean)
+    # Balances are printed unsigned with a (Dr) tag when overdrawn
+    overdrawn = bal.str.extract(_DR_CR_TAG, expand=False).str.lower().eq("dr")
+    mismatch, sug_debit, sug_credit = _balance_check(continuity, debit_m, credit_m, bal_m.mask(overdrawn, -bal_m))
+    debit_m, credit_m = _zero_if_no_amount(debit_m, credit_m)
+    return _split(
+        [("bad_date", txn_date.isna()), ("bad_balance", bal_clean.eq("")), ("balance_mismatch", mismatch)],
+        {
+            "Transaction_Date": txn_date,
             "Description": narr,
-            "Debit_Amount": debit,
-            "Credit_Amount": credit,
-            "Balance": bal_clean,
+            "Debit_Amount": debit_m,
+            "Credit_Amount": credit_m,
+            "Balance": bal_m,
+            "Bank_Name": pd.Series(bank, index=df_raw.index),
+        },
+        {
             "Bank_Name": bank,
-        })
-
-    return pd.DataFrame(std_rows), pd.DataFrame(rej_rows)
-
-def split_std_rejects_hdfc_like(df_raw: pd.DataFrame, bank_name: str = "HDFC"):
-    std_rows, rej_rows = [], []
-    bank = (bank_name or "HDFC").upper()
-    if df_raw is None or df_raw.empty:
-        return pd.DataFrame(std_rows), pd.DataFrame(rej_rows)
-
-    for _, r in df_raw.iterrows():
-        raw_date = str(r.get("Date", "")).strip()
-        narr = " ".join([
-            str(r.get("Narration", "")).strip(),
-            str(r.get("Chq/Ref No", "")).strip()
-        ]).strip()
-
-        raw_debit = str(r.get("Debit", "") or "").strip()
-        raw_credit = str(r.get("Credit", "") or "").strip()
-        raw_balance = str(r.get("Balance", "") or "").strip()
-
-        iso = _parse_date_iso(raw_date)
-        debit_n = _norm_num_2d(raw_debit)
-        credit_n = _norm_num_2d(raw_credit)
-        bal_n = _norm_num_2d(raw_balance)
-
-        reasons = []
-        if iso == "":
-            reasons.append("bad_date")
-        if bal_n == "":
-            reasons.append("bad_balance")
-
-        # NEW: if both debit and credit are > 0 → reject as ambiguous
-        if debit_n not in ("", "0.00") and credit_n not in ("", "0.00"):
-            reasons.append("both_amounts_present")
-
-        if reasons:
-            rej_rows.append({
-                "Bank_Name": bank,
-                "Raw_Date": raw_date,
-                "Raw_Narration": narr,
-                "Raw_Debit": raw_debit,
-                "Raw_Credit": raw_credit,
-                "Raw_Balance": raw_balance,
-                "Reason": ";".join(reasons),
-                "Suggest_Date": iso,
-                "Suggest_Debit": debit_n,
-                "Suggest_Credit": credit_n,
-                "Suggest_Balance": bal_n
-            })
-            continue
-
-        if debit_n == "" and credit_n == "":
-            debit_n, credit_n = "0.00", "0.00"
-
-        std_rows.append({
-            "Transaction_Date": iso,
+            "Raw_Date": raw_date,
+            "Raw_Narration": narr,
+            "Raw_Amount": amt,
+            "Raw_Balance": bal,
+            "Reason": None,
+            "Suggest_Date": iso,
+            "Suggest_Debit": debit.mask(mismatch, sug_debit),
+            "Suggest_Credit": credit.mask(mismatch, sug_credit),
+            "Suggest_Balance": bal_clean,
+        },
+    )
+
+
+def _split_debit_credit(df_raw: pd.DataFrame, bank: str, narr: pd.Series, falsy_empty: bool, continuity=None):
+    """Shared HDFC-like / SBI rules: date, balance, not both amounts, and balance continuity."""
+    raw_date = _text(df_raw, "Date")
+    raw_debit = _text(df_raw, "Debit", falsy_empty)
+    raw_credit = _text(df_raw, "Credit", falsy_empty)
+    raw_balance = _text(df_raw, "Balance", falsy_empty)
+
+    iso, txn_date = _dates(raw_date)
+    debit_n = _norm_amounts(raw_debit)
+    credit_n = _norm_amounts(raw_credit)
+    bal_n = _norm_amounts(raw_balance)
+
+    debit_m = parse_money(debit_n)
+    credit_m = parse_money(credit_n)
+    bal_m = parse_money(bal_n)
+    mismatch, sug_debit, sug_credit = _balance_check(continuity, debit_m, credit_m, bal_m)
+    debit_m, credit_m = _zero_if_no_amount(debit_m, credit_m)
+    return _split(
+        [
+            ("bad_date", txn_date.isna()),
+            ("bad_balance", bal_n.eq("")),
+            ("both_amounts_present", _present(debit_n) & _present(credit_n)),
+            ("balance_mismatch", mismatch),
+        ],
+        {
+            "Transaction_Date": txn_date,
             "Description": narr,
-            "Debit_Amount": debit_n,
-            "Credit_Amount": credit_n,
-            "Balance": bal_n,
+            "Debit_Amount": debit_m,
+            "Credit_Amount": credit_m,
+            "Balance": bal_m,
+            "Bank_Name": pd.Series(bank, index=df_raw.index),
+        },
+        {
             "Bank_Name": bank,
-        })
-
-    return pd.DataFrame(std_rows), pd.DataFrame(rej_rows)
+            "Raw_Date": raw_date,
+            "Raw_Narration": narr,
+            "Raw_Debit": raw_debit,
+            "Raw_Credit": raw_credit,
+            "Raw_Balance": raw_balance,
+            "Reason": None,
+            "Suggest_Date": iso,
+            "Suggest_Debit": debit_n.mask(mismatch, sug_debit),
+            "Suggest_Credit": credit_n.mask(mismatch, sug_credit),
+            "Suggest_Balance": bal_n,
+        },
+    )
+
+
+def split_std_rejects_hdfc_like(df_raw: pd.DataFrame, bank_name: str = "HDFC", continuity: BalanceContinuity = None):
+    bank = (bank_name or "HDFC").upper()
+    if df_raw is None or df_raw.empty:
+        return std_frame([]), pd.DataFrame()
+    narr = (_text(df_raw, "Narration") + " " + _text(df_raw, "Chq/Ref No")).str.strip()
+    return _split_debit_credit(df_raw, bank, narr, falsy_empty=True, continuity=continuity)
 # =======================================================
 #  SBI (State Bank of India)
 # =======================================================
 # ================================================================
 # SBI Splitter (follows HDFC-like pattern)
 # ================================================================
-def split_std_rejects_sbi(df_raw: pd.DataFrame, bank_name: str = "SBI"):
-    std_rows, rej_rows = [], []
+def split_std_rejects_sbi(df_raw: pd.DataFrame, bank_name: str = "SBI", continuity: BalanceContinuity = None):
     bank = (bank_name or "SBI").upper()
 
     if df_raw is None or df_raw.empty:
-        return pd.DataFrame(std_rows), pd.DataFrame(rej_rows)
-
-    for _, r in df_raw.iterrows():
-        raw_date = str(r.get("Date", "")).strip()
-        narr = str(r.get("Narration", "")).strip()
-        raw_debit = str(r.get("Debit", "")).strip()
-        raw_credit = str(r.get("Credit", "")).strip()
-        raw_balance = str(r.get("Balance", "")).strip()
-
-        iso = _parse_date_iso(raw_date)
-        debit_n = _norm_num_2d(raw_debit)
-        credit_n = _norm_num_2d(raw_credit)
-        bal_n = _norm_num_2d(raw_balance)
-
-        reasons = []
-        if iso == "":
-            reasons.append("bad_date")
-        if bal_n == "":
-            reasons.append("bad_balance")
-
-        # if both debit & credit populated → ambiguous
-        if debit_n not in ("", "0.00") and credit_n not in ("", "0.00"):
-            reasons.append("both_amounts_present")
-
-        if reasons:
-            rej_rows.append({
-                "Bank_Name": bank,
-                "Raw_Date": raw_date,
-                "Raw_Narration": narr,
-                "Raw_Debit": raw_debit,
-                "Raw_Credit": raw_credit,
-                "Raw_Balance": raw_balance,
-                "Reason": ";".join(reasons),
-                "Suggest_Date": iso,
-                "Suggest_Debit": debit_n,
-                "Suggest_Credit": credit_n,
-                "Suggest_Balance": bal_n
-            })
-            continue
-
-        if debit_n == "" and credit_n == "":
-            debit_n, credit_n = "0.00", "0.00"
-
-        std_rows.append({
-            "Transaction_Date": iso,
-            "Description": narr,
-            "Debit_Amount": debit_n,
-            "Credit_Amount": credit_n,
-            "Balance": bal_n,
-            "Bank_Name": bank,
-        })
-
-    return pd.DataFrame(std_rows), pd.DataFrame(rej_rows)
-import pandas as pd
-import re
-from datetime import datetime
-
-def _parse_date_iso(date_str):
-    """Normalize any date format like 16/10/2025 → 2025-10-16."""
-    try:
-        date_str = str(date_str).strip()
-        if not date_str or date_str.lower() in ["nan", "none"]:
-            return ""
-        for fmt in ("%d/%m/%Y", "%d-%b-%y", "%d-%b-%Y", "%d-%m-%Y", "%d/%m/%y"):
-            try:
-                return datetime.strptime(date_str, fmt).strftime("%Y-%m-%d")
-            except Exception:
-                continue
-        return date_str  # return as-is if format unknown
-    except Exception:
-        return ""
+        return std_frame([]), pd.DataFrame()
+    return _split_debit_credit(df_raw, bank, _text(df_raw, "Narration"), falsy_empty=False, continuity=continuity)
 
 # ============================================================
 # ICICI BANK VALIDATOR
 # ============================================================
 
-def split_std_rejects_icici(df_raw: pd.DataFrame, bank_name: str = "ICICI"):
-    std_rows, rej_rows = [], []
-    for _, row in df_raw.iterrows():
-        date = row.get("Date", "").strip()
-        narr = row.get("Narration", "").strip()
-        debit = row.get("Debit", "").strip()
-        credit = row.get("Credit", "").strip()
-        bal = row.get("Balance", "").strip()
-
-        reason = []
-        if not re.match(r"\d{2}/\d{2}/\d{4}", date):
-            reason.append("bad_date")
-        if bal in ["", "0", None]:
-            reason.append("bad_balance")
-        if debit in ["", "0"] and credit in ["", "0"]:
-            reason.append("missing_amounts")
-
-        if reason:
-            rej_rows.append({
-                "Bank_Name": bank_name,
-                "Raw_Date": date,
-                "Raw_Narration": narr,
-                "Raw_Debit": debit,
-                "Raw_Credit": credit,
-                "Raw_Balance": bal,
-                "Reason": ";".join(reason)
-            })
-        else:
-            std_rows.append({
-                "Bank_Name": bank_name,
-                "Transaction_Date": date,
-                "Description": narr,
-                "Debit_Amount": debit,
-                "Credit_Amount": credit,
-                "Balance": bal
-            })
-
-    return pd.DataFrame(std_rows), pd.DataFrame(rej_rows)
\ No newline at end of file
+_ICICI_DATE = re.compile(r"^(\d{2}/\d{2}/\d{4})")  # dd/mm/yyyy prefix; a time may follow
+
+def split_std_rejects_icici(df_raw: pd.DataFrame, bank_name: str = "ICICI", continuity: BalanceContinuity = None):
+    if df_raw is None or df_raw.empty:
+        return std_frame([]), pd.DataFrame()
+
+    date = _text(df_raw, "Date")
+    narr = _text(df_raw, "Narration")
+    debit = _text(df_raw, "Debit")
+    credit = _text(df_raw, "Credit")
+    bal = _text(df_raw, "Balance")
+
+    _, txn_date = _dates(date.str.extract(_ICICI_DATE, expand=False), ("%d/%m/%Y",), normalize=False)
+    debit_m = parse_money(debit)
+    credit_m = parse_money(credit)
+    bal_m = parse_money(bal)
+    mismatch, sug_debit, sug_credit = _balance_check(continuity, debit_m, credit_m, bal_m)
+    return _split(
+        [
+            ("bad_date", txn_date.isna()),
+            ("bad_balance", bal.isin(["", "0"])),
+            ("missing_amounts", debit.isin(["", "0"]) & credit.isin(["", "0"])),
+            ("balance_mismatch", mismatch),
+        ],
+        {
+            "Transaction_Date": txn_date,
+            "Description": narr,
+            "Debit_Amount": debit_m,
+            "Credit_Amount": credit_m,
+            "Balance": bal_m,
+            "Bank_Name": pd.Series(bank_name, index=df_raw.index),
+        },
+        {
+            "Bank_Name": bank_name,
+            "Raw_Date": date,
+            "Raw_Narration": narr,
+            "Raw_Debit": debit,
+            "Raw_Credit": credit,
+            "Raw_Balance": bal,
+            "Reason": None,
+            "Suggest_Debit": sug_debit,
+            "Suggest_Credit": sug_credit,
+        },
+    )
@@ -3,13 +3,16 @@ from datetime import datetime
 from app.models.transaction import Transaction
 from app.models.bank_statement import BankStatement
 from app import db
+from app.services.ingestion.fingerprint import transaction_fingerprints
+from app.services.ingestion.outputs import read_std
+from app.services.ingestion.schema import TYPED_COLS, format_dates, minor_to_decimal
 import os
 
 class TransactionService:
     
     @staticmethod
     def preview_csv(statement_id: int, limit: int = 10):
-        """Preview transactions from CSV before import"""
+        """Preview transactions from the STD file (CSV or Parquet) before import"""
         statement = BankStatement.query.get(statement_id)
         if not statement:
             raise ValueError("Statement not found")
@@ -21,7 +24,12 @@ class TransactionService:
         if not os.path.exists(csv_path):
             raise ValueError(f"CSV file not found at path: {csv_path}")
         
-        df = pd.read_csv(csv_path)
+        # Only the previewed columns are read; amounts come back in minor units
+        df = read_std(csv_path, columns=[c for c in TYPED_COLS if c != 'Bank_Name'])
+        dates = df['Transaction_Date']
+        df['Transaction_Date'] = format_dates(dates).where(dates.notna(), None)
+        for col in ('Debit_Amount', 'Credit_Amount', 'Balance'):
+            df[col] = df[col].astype('float64') / 100
         
         # Validation
         valid_rows = []
@@ -61,7 +69,11 @@ class TransactionService:
     
     @staticmethod
     def import_from_csv(statement_id: int):
-        """Import transactions from CSV into database"""
+        """
+        Import transactions from the STD file (CSV or Parquet) into database. Rows whose fingerprint the
+        user already has are skipped, so re-imports are idempotent and
+        overlapping statements only add their new rows.
+        """
         statement = BankStatement.query.get(statement_id)
         if not statement:
             raise ValueError("Statement not found")
@@ -73,30 +85,37 @@ class TransactionService:
         if not os.path.exists(csv_path):
             raise ValueError(f"CSV file not found at path: {csv_path}")
         
-        df = pd.read_csv(csv_path)
+        # Typed read of the imported columns: dates as datetime64, amounts as exact minor units
+        df = read_std(csv_path, columns=TYPED_COLS + ['is_repaired'])
+        if df['Bank_Name'].isna().all():
+            df['Bank_Name'] = pd.Series(statement.bank_name, index=df.index, dtype='category')
         
-        # Check if transactions already imported
-        existing_count = Transaction.query.filter_by(statement_id=statement_id).count()
-        if existing_count > 0:
-            raise ValueError(f"Transactions already imported for this statement ({existing_count} records)")
+        # Fingerprint every STD row (same ordinals as at standardization time)
+        df['fingerprint'] = transaction_fingerprints(df)
+        
+        # Skip invalid rows
+        valid = df['Transaction_Date'].notna() & df['Description'].notna()
+        valid &= df['Debit_Amount'].notna() | df['Credit_Amount'].notna()
+        df = df[valid]
+        
+        # Anti-join: drop rows this user already has (re-uploads, overlapping statements)
+        known = TransactionService._known_fingerprints(statement.profile_id, df['fingerprint'].tolist())
+        new_rows = df[~df['fingerprint'].isin(known)]
+        if len(new_rows) < len(df):
+            print(f"[IMPORT] Statement {statement_id}: skipped {len(df) - len(new_rows)} already imported rows")
         
         transactions = []
-        for _, row in df.iterrows():
-            # Skip invalid rows
-            if pd.isna(row.get('Transaction_Date')) or pd.isna(row.get('Description')):
-                continue
-            if pd.isna(row.get('Debit_Amount')) and pd.isna(row.get('Credit_Amount')):
-                continue
-                
+        for _, row in new_rows.iterrows():
             transaction = Transaction(
                 profile_id=statement.profile_id,
                 statement_id=statement_id,
-                transaction_date=pd.to_datetime(row['Transaction_Date']).date(),
+                transaction_date=row['Transaction_Date'].date(),
                 description=str(row['Description']),
-                debit_amount=row.get('Debit_Amount') if pd.notna(row.get('Debit_Amount')) else None,
-                credit_amount=row.get('Credit_Amount') if pd.notna(row.get('Credit_Amount')) else None,
-                balance=row.get('Balance') if pd.notna(row.get('Balance')) else None,
-                is_repaired=bool(row.get('is_repaired', False))
+                debit_amount=minor_to_decimal(row['Debit_Amount']),
+                credit_amount=minor_to_decimal(row['Credit_Amount']),
+                balance=minor_to_decimal(row['Balance']),
+                is_repaired=bool(row.get('is_repaired', False)),
+                fingerprint=row['fingerprint']
             )
             transactions.append(transaction)
         
@@ -104,3 +123,16 @@ class TransactionService:
         db.session.commit()
         
         return len(transactions)
+    
+    @staticmethod
+    def _known_fingerprints(profile_id, fingerprints, chunk_size: int = 1000) -> set:
+        """Subset of `fingerprints` already stored for the profile, one IN query per chunk."""
+        known = set()
+        for i in range(0, len(fingerprints), chunk_size):
+            chunk = fingerprints[i:i + chunk_size]
+            rows = db.session.query(Transaction.fingerprint).filter(
+                Transaction.profile_id == profile_id,
+                Transaction.fingerprint.in_(chunk)
+            ).all()
+            known.update(fp for (fp,) in rows)
+        return known
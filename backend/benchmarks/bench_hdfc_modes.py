@@ -0,0 +1,77 @@
+"""
+HDFC parser: extract_text() lines vs. extract_words() column bands.
+
+    python -m benchmarks.bench_hdfc_modes [pages] [rows_per_page] [repeats]
+
+Builds a synthetic column-aligned HDFC statement and parses it in both modes
+(extraction cache off, serial), reporting the best wall time of
+  * the parser step alone, on pages whose layout objects are already parsed
+    (extract_text + split vs. extract_words + bands);
+  * the end-to-end parse, which also pays pdfminer's page parsing;
+and row parity against the fixture's expected rows. Amounts stay below 1,000
+because text mode's NUM_RE only accepts comma-grouped thousands, which
+extract_text() keeps but the parser strips before matching. Text mode files
+every single-amount row under Credit, so its Debit/Credit only agree on
+deposits. Fails if words mode does not reproduce the expected rows.
+"""
+import os
+import sys
+import tempfile
+import time
+from app.config import IngestionConfig
+from app.services.ingestion.banks.hdfc import parse_hdfc_df
+from app.services.ingestion.document import StatementDocument
+from tests.fixtures.statements import hdfc_statement
+
+
+def _timed_parse(pdf_path, mode, preparsed):
+    with StatementDocument(pdf_path, cache=False) as doc:
+        if preparsed:
+            for index in range(doc.page_count):
+                doc.page_probe(index)  # parses the page's layout objects
+        start = time.perf_counter()
+        df = parse_hdfc_df(doc, mode=mode)
+        return time.perf_counter() - start, df
+
+
+def _agreement(df, expected, columns) -> int:
+    idx = {"Date": 0, "Narration": 1, "Chq/Ref No": 2, "Debit": 3, "Credit": 4, "Balance": 5}
+    rows = df[columns].values.tolist()
+    return sum(r == [e[idx[c]] for c in columns] for r, e in zip(rows, expected))
+
+
+def main(pages=20, rows_per_page=45, repeats=3):
+    IngestionConfig.PARALLEL_WORKERS = 1
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path, expected = hdfc_statement(
+            os.path.join(tmp, "hdfc.pdf"), pages, rows_per_page, opening_balance=500.0, amount_unit=10,
+        )
+        timings = {}
+        frames = {}
+        for preparsed in (True, False):
+            for mode in ("text", "words"):
+                timings[preparsed, mode] = float("inf")
+            # Interleave the two modes so drift (thermal, GC) hits both alike
+            for _ in range(repeats):
+                for mode in ("text", "words"):
+                    elapsed, frames[mode] = _timed_parse(pdf_path, mode, preparsed)
+                    timings[preparsed, mode] = min(timings[preparsed, mode], elapsed)
+
+    print(f"[BENCH] HDFC {pages} pages x {rows_per_page} rows")
+    for preparsed, label in ((True, "parser step"), (False, "end-to-end parse")):
+        text_s, words_s = timings[preparsed, "text"], timings[preparsed, "words"]
+        print(f"[BENCH] {label}")
+        print(f"[BENCH]   text  : {text_s:.3f}s ({text_s / pages * 1000:.1f} ms/page)")
+        print(f"[BENCH]   words : {words_s:.3f}s ({words_s / pages * 1000:.1f} ms/page)")
+        print(f"[BENCH]   speedup: {text_s / words_s:.2f}x")
+    for mode, df in frames.items():
+        print(f"[BENCH] {mode:<5} rows {len(df)}/{len(expected)}, "
+              f"date+balance {_agreement(df, expected, ['Date', 'Balance'])}, "
+              f"debit+credit {_agreement(df, expected, ['Debit', 'Credit'])}, "
+              f"all columns {_agreement(df, expected, list(df.columns))}")
+    if frames["words"].values.tolist() != expected:
+        sys.exit("[BENCH] words mode does not reproduce the statement rows")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:4]))
@@ -0,0 +1,84 @@
+"""
+PDF backends: pdfplumber vs. pypdfium2 on the same statements.
+
+    python -m benchmarks.bench_pdf_backends [pages] [repeats]
+
+Builds synthetic HDFC, Kotak and SBI statements, runs detection plus the
+bank parser with each backend (extraction cache off, serial) and prints the
+best wall time per statement together with parity: the parsed frame must be
+identical to pdfplumber's, and so must every page's text. SBI tables always
+come from pdfplumber, so only its probes and detection change backend.
+Fails on any parity mismatch.
+"""
+import os
+import sys
+import tempfile
+import time
+from app.config import IngestionConfig
+from app.services.ingestion.detect import detect_bank
+from app.services.ingestion.document import StatementDocument
+from app.services.ingestion.extract import parse_hdfc_df, parse_kotak_df, parse_sbi_df
+from app.services.ingestion.pdf_backends import PDF_BACKENDS
+from tests.fixtures.pdf_builder import build_pdf
+from tests.fixtures.statements import hdfc_statement, sbi_statement
+
+
+def _kotak_statement(path, n_pages, rows_per_page=40):
+    pages = []
+    for p in range(n_pages):
+        lines = [f"Page {p + 1} of {n_pages}"]
+        for r in range(rows_per_page):
+            n = p * rows_per_page + r
+            day = f"{n % 28 + 1:02d}-07-2025"
+            if n % 3:
+                lines.append(f"{day} UPI/MERCHANT/{n} {n % 9 + 1}00.00(Dr) 9,{n % 900 + 100}.00(Cr)")
+            else:
+                lines += [f"{day} NEFT TRANSFER {n}", f"ACME CORP {n} 5,000.00(Cr) 14,{n % 900 + 100}.00(Cr)"]
+        pages.append(lines)
+    return build_pdf(path, pages)
+
+
+def _run(pdf_path, backend, parse):
+    start = time.perf_counter()
+    with StatementDocument(pdf_path, cache=False, backend=backend) as doc:
+        bank = detect_bank(doc)
+        df = parse(doc)
+        text = [doc.page_text(i) for i in range(doc.page_count)]
+    return time.perf_counter() - start, bank, df, text
+
+
+def main(pages=20, repeats=3):
+    IngestionConfig.PARALLEL_WORKERS = 1
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        statements = [
+            ("HDFC text", hdfc_statement(os.path.join(tmp, "hdfc.pdf"), pages, 45)[0],
+             lambda doc: parse_hdfc_df(doc, mode="text")),
+            ("HDFC words", os.path.join(tmp, "hdfc.pdf"), lambda doc: parse_hdfc_df(doc, mode="words")),
+            ("KOTAK", _kotak_statement(os.path.join(tmp, "kotak.pdf"), pages), parse_kotak_df),
+            ("SBI", sbi_statement(os.path.join(tmp, "sbi.pdf"), pages, 35), parse_sbi_df),
+        ]
+        for label, pdf_path, parse in statements:
+            best, results = {}, {}
+            # Interleave backends so drift (thermal, GC) hits all alike
+            for _ in range(repeats):
+                for backend in PDF_BACKENDS:
+                    elapsed, *results[backend] = _run(pdf_path, backend, parse)
+                    best[backend] = min(best.get(backend, float("inf")), elapsed)
+
+            base_bank, base_df, base_text = results["pdfplumber"]
+            print(f"[BENCH] {label}: {pages} pages, {len(base_df)} rows")
+            for backend, seconds in best.items():
+                bank, df, text = results[backend]
+                same_lines = sum(a == b for a, b in zip(text, base_text))
+                parity = bank == base_bank and df.equals(base_df) and same_lines == len(base_text)
+                failed |= not parity
+                print(f"[BENCH]   {backend:<10}: {seconds:.3f}s ({seconds / pages * 1000:.1f} ms/page), "
+                      f"x{best['pdfplumber'] / seconds:.2f}, pages with identical text "
+                      f"{same_lines}/{len(base_text)}, frame {'identical' if df.equals(base_df) else 'DIFFERS'}")
+    if failed:
+        sys.exit("[BENCH] backend parity FAILED")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,88 @@
+"""
+Table extraction: whole page vs. per-bank table region.
+
+    python -m benchmarks.bench_table_regions [pages] [rows_per_page] [logo_strokes] [repeats]
+
+Builds a synthetic SBI statement (vector letterhead logo on every page) and
+reports the best wall time of
+  * table finding alone: `extract_tables()` on pages whose layout objects
+    are already parsed, i.e. the work the region actually cuts;
+  * the end-to-end SBI parse (extraction cache off, serial), which also
+    pays pdfminer's page parsing and is the same for both variants.
+Fails if the region and full-page parses differ.
+"""
+import os
+import sys
+import tempfile
+import time
+import pandas as pd
+import pdfplumber
+from app.config import IngestionConfig
+from app.services.ingestion.banks.sbi import SBI_TABLE_TEMPLATE, SbiPageParser
+from app.services.ingestion.document import StatementDocument
+from app.services.ingestion.layout import RULED_TABLE_SETTINGS
+from tests.fixtures.statements import sbi_statement
+
+
+class FullPageSbiParser(SbiPageParser):
+    table_template = None
+
+
+def _timed_parse(parser_cls, pdf_path):
+    start = time.perf_counter()
+    with StatementDocument(pdf_path, cache=False) as doc:
+        df = parser_cls().parse(doc)
+    return time.perf_counter() - start, df
+
+
+def _table_finding(pdf_path, region, repeats):
+    """Best (full page, region) seconds for extract_tables() over every page."""
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            page.objects  # parse layout up front; only table finding is timed
+        full_s = region_s = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for page in pdf.pages:
+                page.extract_tables(RULED_TABLE_SETTINGS)
+            full_s = min(full_s, time.perf_counter() - start)
+            start = time.perf_counter()
+            for index, page in enumerate(pdf.pages):
+                region.extract_tables(page, index)
+            region_s = min(region_s, time.perf_counter() - start)
+    return full_s, region_s
+
+
+def _report(label, pages, full_s, region_s):
+    print(f"[BENCH] {label}")
+    print(f"[BENCH]   full page : {full_s:.3f}s ({full_s / pages * 1000:.1f} ms/page)")
+    print(f"[BENCH]   region    : {region_s:.3f}s ({region_s / pages * 1000:.1f} ms/page)")
+    print(f"[BENCH]   speedup   : {full_s / region_s:.2f}x")
+
+
+def main(pages=20, rows_per_page=35, logo_strokes=200, repeats=3):
+    IngestionConfig.PARALLEL_WORKERS = 1
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = sbi_statement(os.path.join(tmp, "sbi.pdf"), pages, rows_per_page, logo_strokes)
+        with StatementDocument(pdf_path, cache=False) as doc:
+            region = doc.table_region(SBI_TABLE_TEMPLATE)
+        find_full_s, find_region_s = _table_finding(pdf_path, region, repeats)
+
+        parse_full_s = parse_region_s = float("inf")
+        # Interleave the two variants so drift (thermal, GC) hits both alike
+        for _ in range(repeats):
+            elapsed, full_df = _timed_parse(FullPageSbiParser, pdf_path)
+            parse_full_s = min(parse_full_s, elapsed)
+            elapsed, region_df = _timed_parse(SbiPageParser, pdf_path)
+            parse_region_s = min(parse_region_s, elapsed)
+
+    pd.testing.assert_frame_equal(region_df, full_df)
+    print(f"[BENCH] SBI {pages} pages x {rows_per_page} rows, {logo_strokes} logo strokes/page, "
+          f"{len(region_df)} transactions")
+    print(f"[BENCH] region x={region.x0:.0f}..{region.x1:.0f}, page-1 top={region.first_top:.0f}")
+    _report("table finding", pages, find_full_s, find_region_s)
+    _report("end-to-end parse", pages, parse_full_s, parse_region_s)
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:5]))
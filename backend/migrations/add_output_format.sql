@@ -0,0 +1,11 @@
+"""
+Migration script to record the STD/REJECTS file format per statement
+Run this in PostgreSQL before enabling INGEST_OUTPUT_FORMAT=parquet
+"""
+
+-- Step 1: Format of extracted_csv_path / normalized_csv_path (earlier uploads are CSV)
+ALTER TABLE bank_statements
+ADD COLUMN IF NOT EXISTS output_format VARCHAR(10) DEFAULT 'csv';
+
+-- Step 2: Backfill rows created before the column had a default
+UPDATE bank_statements SET output_format = 'csv' WHERE output_format IS NULL;
@@ -0,0 +1,14 @@
+"""
+Migration script to add statement period and masked account number
+Run this in PostgreSQL before uploading with period extraction
+"""
+
+-- Step 1: Header facts (statements uploaded earlier keep NULL)
+ALTER TABLE bank_statements
+ADD COLUMN IF NOT EXISTS period_start DATE,
+ADD COLUMN IF NOT EXISTS period_end DATE,
+ADD COLUMN IF NOT EXISTS account_masked VARCHAR(32);
+
+-- Step 2: Date filters prune statements by period before scanning transactions
+CREATE INDEX IF NOT EXISTS ix_bank_statements_profile_period
+ON bank_statements (profile_id, period_start, period_end);
@@ -0,0 +1,12 @@
+"""
+Migration script to add deterministic transaction fingerprints
+Run this in PostgreSQL before importing with the new de-duplication
+"""
+
+-- Step 1: Add the fingerprint column (rows imported earlier keep NULL)
+ALTER TABLE transactions
+ADD COLUMN IF NOT EXISTS fingerprint VARCHAR(64);
+
+-- Step 2: One row per statement line per user; NULLs do not conflict
+CREATE UNIQUE INDEX IF NOT EXISTS ux_transactions_profile_fingerprint
+ON transactions (profile_id, fingerprint);
@@ -84,6 +84,17 @@ def create_app():
     from app.routes.preference_routes import preference_bp
     app.register_blueprint(preference_bp)
 
+    # Statements queued or running when the last process stopped will never finish
+    from app.controllers.pdf_controller import PDFController
+    with app.app_context():
+        try:
+            interrupted = PDFController.fail_interrupted()
+            if interrupted:
+                print(f"[JOB] Marked {interrupted} interrupted statement(s) FAILED")
+        except Exception as e:
+            db.session.rollback()
+            print(f"[JOB] Could not check for interrupted statements: {e}")
+
     # Default route
     @app.get("/")
     def home():
@@ -11,6 +11,13 @@ from app.models.bank_statement import BankStatement
 from app.models.transaction import Transaction
 from app.models.transaction_category import TransactionCategory
 from app.models.budget import Budget
+from app.config import IngestionConfig
+
+@pytest.fixture(autouse=True)
+def isolated_extraction_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(IngestionConfig, 'EXTRACT_CACHE_DIR', str(tmp_path / 'extraction_cache'))
+    monkeypatch.setattr(IngestionConfig, 'CHECKPOINT_DIR', str(tmp_path / 'checkpoints'))
+    monkeypatch.setattr(IngestionConfig, 'TELEMETRY_PATH', str(tmp_path / 'telemetry' / 'ingestion.jsonl'))
 
 @pytest.fixture(scope='session')
 def app():
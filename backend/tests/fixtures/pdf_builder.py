@@ -0,0 +1,75 @@
+"""Tiny dependency-free PDF writer for ingestion tests."""
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def line_top(k: int, font_size=9) -> float:
+    """Top coordinate (pdfplumber's `top`) of the gap above text line `k`."""
+    return 40 + k * (font_size + 5) - font_size - 2
+
+
+def grid_rules(x_edges, first_line: int, n_lines: int, font_size=9) -> list:
+    """Ruling segments for a grid whose rows are text lines [first_line, first_line + n_lines)."""
+    y_edges = [line_top(k, font_size) for k in range(first_line, first_line + n_lines + 1)]
+    rules = [(x_edges[0], y, x_edges[-1], y) for y in y_edges]
+    rules += [(x, y_edges[0], x, y_edges[-1]) for x in x_edges]
+    return rules
+
+
+def build_pdf(path, pages, font_size=9, page_size=(595, 842), rules=None, metadata=None):
+    """
+    Write a PDF of text and optional ruling lines.
+    `pages` is a list of pages; each page is a list of lines, where a line is
+    either a string (laid out top-down) or a list of (x, text) cells sharing
+    one baseline. `rules`, when given, holds one list of (x0, top0, x1, top1)
+    segments per page (top-down coordinates, as pdfplumber reports them).
+    `metadata` is an optional dict of document info fields (Title, Producer, ...).
+    """
+    width, height = page_size
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Pages, filled in below
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for page_no, lines in enumerate(pages):
+        ops = []
+        for x0, t0, x1, t1 in (rules[page_no] if rules else []):
+            ops.append(f"{x0} {height - t0} m {x1} {height - t1} l S")
+        ops += ["BT", f"/F1 {font_size} Tf"]
+        y = height - 40
+        for line in lines:
+            cells = [(40, line)] if isinstance(line, str) else line
+            for x, text in cells:
+                ops.append(f"1 0 0 1 {x} {y} Tm ({_escape(text)}) Tj")
+            y -= font_size + 5
+        ops.append("ET")
+        stream = "\n".join(ops)
+        objects.append(f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream")
+        content_ref = len(objects)
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width} {height}] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_ref} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+    info = ""
+    if metadata:
+        objects.append("<< " + " ".join(f"/{k} ({_escape(v)})" for k, v in metadata.items()) + " >>")
+        info = f" /Info {len(objects)} 0 R"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{num} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    for off in offsets:
+        out += f"{off:010d} 00000 n \n".encode("latin-1")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R{info} >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    with open(path, "wb") as fh:
+        fh.write(bytes(out))
+    return str(path)
@@ -0,0 +1,100 @@
+"""Synthetic statement layouts built with pdf_builder (tests and benchmarks)."""
+from .pdf_builder import build_pdf, grid_rules
+
+SBI_X_EDGES = [30, 90, 150, 300, 380, 440, 500, 570]
+SBI_HEADER = ["Txn Date", "Value Date", "Description", "Ref No.", "Debit", "Credit", "Balance"]
+
+
+def _cells(values):
+    return [(x + 2, v) for x, v in zip(SBI_X_EDGES, values)]
+
+
+def _logo(strokes: int) -> list:
+    """A cross-hatched vector letterhead logo of `strokes` ruling segments in the top margin."""
+    half = strokes // 2
+    step = 60 / max(half, 1)
+    rules = [(440, 4 + i * step, 500, 4 + i * step) for i in range(half)]
+    rules += [(440 + i * step, 4, 440 + i * step, 64) for i in range(strokes - half)]
+    return rules
+
+
+def sbi_statement(path, n_pages=2, rows_per_page=20, logo_strokes=0):
+    """
+    SBI-like statement: every page opens with a letterhead (plus a vector
+    logo of `logo_strokes` segments), repeats the grid's header row and ends
+    with a disclaimer paragraph; page 1 also has a ruled account-summary box
+    above the transaction grid. Keep `rows_per_page` <= 35 so everything
+    fits on an A4 page.
+    """
+    pages, rules = [], []
+    balance = 100000.0
+    for p in range(n_pages):
+        lines = ["STATE BANK OF INDIA", "Branch: MAIN ROAD, CHENNAI", f"Page {p + 1} of {n_pages}", "", ""]
+        page_rules = _logo(logo_strokes)
+        if p == 0:
+            summary_at = len(lines)
+            lines += [[(32, "Account No"), (152, "00000012345")], [(32, "Period"), (152, "01/04/2024 - 30/04/2024")]]
+            page_rules += grid_rules([30, 150, 300], summary_at, 2)
+            lines += ["", "Customer address, nomination and KYC details as registered with the branch.",
+                      "Interest rate, MICR and IFSC codes are printed on the passbook.", ""]
+        header_at = len(lines)
+        lines.append(_cells(SBI_HEADER))
+        for r in range(rows_per_page):
+            n = p * rows_per_page + r
+            balance -= 10
+            day = n % 28 + 1
+            lines.append(_cells([f"{day:02d}/04/2024", f"{day:02d}/04/2024", f"UPI PAY {n}", f"R{n}", "10.00", "", f"{balance:.2f}"]))
+        page_rules += grid_rules(SBI_X_EDGES, header_at, rows_per_page + 1)
+        lines += ["", "This is a computer generated statement and does not require a signature.",
+                  "Please report discrepancies within 15 days of receipt of this statement.",
+                  "Never share your OTP, PIN or password with anyone, including bank staff.",
+                  "Deposits are insured by DICGC up to the limits notified from time to time.",
+                  "For grievances contact the branch manager or the nodal officer of the bank."]
+        pages.append(lines)
+        rules.append(page_rules)
+    return build_pdf(path, pages, rules=rules)
+
+
+HDFC_COLUMNS_X = [30, 80, 250, 330, 380, 450, 520]
+# "Closing Bal." keeps the header out of the generic column-header noise rule,
+# which the text-mode parser needs in order to find the transaction section.
+HDFC_HEADER = ["Date", "Narration", "Chq./Ref.No.", "Value Dt", "Withdrawal Amt.", "Deposit Amt.", "Closing Bal."]
+
+
+def _right(x_right: int, text: str, font_size=9) -> tuple:
+    """Cell right-aligned at `x_right` (Helvetica digits are ~0.556 em wide)."""
+    return (x_right - len(text) * font_size * 0.556, text)
+
+
+def hdfc_statement(path, n_pages=2, rows_per_page=30, header=HDFC_HEADER,
+                   opening_balance=50000.0, amount_unit=125):
+    """
+    HDFC-like statement laid out in columns, amounts right-aligned under
+    their headers. Each row has either a withdrawal or a deposit, never both,
+    so a whitespace split cannot tell which one is present. Returns the path
+    and the expected [Date, Narration, Chq/Ref No, Debit, Credit, Balance]
+    rows (amounts without thousands separators).
+    """
+    pages, expected = [], []
+    balance = opening_balance
+    for p in range(n_pages):
+        lines = ["HDFC BANK LTD", f"Page {p + 1} of {n_pages}",
+                 [(x, h) for x, h in zip(HDFC_COLUMNS_X, header)]]
+        for r in range(rows_per_page):
+            n = p * rows_per_page + r
+            day = f"{n % 28 + 1:02d}/07/25"
+            amount = f"{(n % 9 + 1) * amount_unit:,.2f}"
+            withdrawal, deposit = (amount, "") if n % 2 else ("", amount)
+            balance += float(amount.replace(",", "")) * (-1 if withdrawal else 1)
+            ref = f"{400000 + n:010d}"
+            cells = [(30, day), (80, f"UPI-MERCHANT{n}"), (250, ref), (330, day)]
+            if withdrawal:
+                cells.append(_right(440, withdrawal))
+            if deposit:
+                cells.append(_right(510, deposit))
+            cells.append(_right(575, f"{balance:,.2f}"))
+            lines.append(cells)
+            expected.append([day, f"UPI-MERCHANT{n}", ref, withdrawal.replace(",", ""),
+                             deposit.replace(",", ""), f"{balance:.2f}"])
+        pages.append(lines)
+    return build_pdf(path, pages, font_size=8), expected
@@ -1,6 +1,10 @@
 import pytest
 import os
-from app.services.ingestion.detect import detect_bank
+from app.services.ingestion import detect
+from app.services.ingestion.detect import detect_bank, detect_bank_scored
+from app.services.ingestion.document import StatementDocument
+from app.services.ingestion.extraction_cache import ExtractionCache
+from tests.fixtures.pdf_builder import build_pdf
 
 class TestBankDetection:
     
@@ -21,3 +25,52 @@ class TestBankDetection:
         # Test with non-existent file should return UNKNOWN
         result = detect_bank('/nonexistent/path.pdf')
         assert result == 'UNKNOWN'
+
+
+class TestScoredDetection:
+
+    def _pdf(self, tmp_path, pages, **kwargs):
+        return build_pdf(tmp_path / "stmt.pdf", pages, **kwargs)
+
+    def _doc(self, path, tmp_path):
+        return StatementDocument(path, cache=ExtractionCache(str(tmp_path / "cache"), 1 << 20))
+
+    def test_header_branding_beats_narration_mention(self, tmp_path):
+        path = self._pdf(tmp_path, [[
+            "HDFC BANK LTD",
+            "Date Narration Ref Value Dt Withdrawal Amt. Deposit Amt. Closing Bal.",
+            "01/07/25 IMPS-KOTAK-SAVINGS 0000123 01/07/25 250.00 0.00 10,000.00",
+        ]])
+        with self._doc(path, tmp_path) as doc:
+            result = detect_bank_scored(doc)
+            assert doc._text == {}  # decided on the header band alone
+        assert result.bank == "HDFC"
+        assert result.stage == "header"
+        assert not result.ambiguous
+
+    def test_metadata_decides_before_any_page(self, tmp_path):
+        path = self._pdf(tmp_path, [["Account statement"]], metadata={"Producer": "ICICI Bank eStatement"})
+        with self._doc(path, tmp_path) as doc:
+            result = detect_bank_scored(doc)
+            assert doc._probes == {}
+        assert (result.bank, result.stage) == ("ICICI", "metadata")
+
+    def test_competing_banks_are_ambiguous(self, tmp_path):
+        path = self._pdf(tmp_path, [["Kotak Mahindra Bank", "State Bank of India"]])
+        result = detect_bank_scored(path)
+        assert result.ambiguous
+        assert {bank for bank, _ in result.ranking} == {"KOTAK", "SBI"}
+        assert detect_bank(path) == "UNKNOWN"
+
+    def test_result_is_cached_per_file(self, tmp_path, monkeypatch):
+        path = self._pdf(tmp_path, [["Kotak Mahindra Bank", "01-07-2025 UPI/SWIGGY 250.00(Dr) 9,750.00(Cr)"]])
+        with self._doc(path, tmp_path) as doc:
+            first = detect.detect_bank_scored(doc)
+
+        def no_detect(doc):
+            raise AssertionError("detection must come from the cache")
+
+        monkeypatch.setattr(detect, "_detect", no_detect)
+        with self._doc(path, tmp_path) as doc:
+            assert detect.detect_bank_scored(doc) == first
+        assert first.bank == "KOTAK"
@@ -0,0 +1,58 @@
+import pandas as pd
+from app.services.ingestion.fingerprint import Fingerprinter, normalize_description, transaction_fingerprints
+from app.services.ingestion.standardize import standardize_and_write
+
+
+def _std(rows):
+    return pd.DataFrame(rows, columns=["Transaction_Date", "Description", "Debit_Amount", "Credit_Amount",
+                                       "Balance", "Bank_Name"])
+
+
+JAN_MAR = [
+    ("2025-01-05", "UPI/SWIGGY/123", "250.00", "", "9750.00", "HDFC"),
+    ("2025-03-01", "NEFT SALARY", "", "50000.00", "59750.00", "HDFC"),
+    ("2025-03-02", "UPI/METRO", "40.00", "", "59710.00", "HDFC"),
+]
+MAR_MAY = [
+    ("2025-03-01", "NEFT  salary", "", "50,000", "59750.00", "HDFC"),
+    ("2025-03-02", "UPI/METRO", "40.00", "", "59710.00", "HDFC"),
+    ("2025-05-10", "ATM WDL", "2000.00", "", "57710.00", "HDFC"),
+]
+
+
+class TestFingerprints:
+
+    def test_overlapping_statements_share_fingerprints(self):
+        a = set(transaction_fingerprints(_std(JAN_MAR)))
+        b = transaction_fingerprints(_std(MAR_MAY))
+        assert b.isin(a).tolist() == [True, True, False]
+        assert transaction_fingerprints(_std(JAN_MAR)).tolist() == transaction_fingerprints(_std(JAN_MAR)).tolist()
+
+    def test_identical_rows_get_ordinals_across_batches(self):
+        row = ("2025-03-02", "UPI/METRO", "40.00", "", "59710.00", "HDFC")
+        whole = transaction_fingerprints(_std([row, row, row]))
+        assert whole.nunique() == 3
+        fp = Fingerprinter()
+        split = pd.concat([fp.assign(_std([row])), fp.assign(_std([row, row]))])
+        assert split.tolist() == whole.tolist()
+
+    def test_normalize_description(self):
+        assert normalize_description(" upi/Swiggy--123 ") == "UPI SWIGGY 123"
+        assert normalize_description(None) == ""
+
+    def test_std_ids_match_fingerprints_of_written_csv(self, tmp_path):
+        raw = pd.DataFrame({
+            "Date": ["01/07/25", "01/07/25"],
+            "Narration": ["UPI-METRO", "UPI-METRO"],
+            "Ref": ["1", "2"],
+            "Debit": ["40.00", "40.00"],
+            "Credit": ["", ""],
+            "Balance": ["960.00", "920.00"],
+        })
+        std_csv, _ = standardize_and_write(raw, "HDFC", "fp", str(tmp_path))
+        first = pd.read_csv(std_csv)
+        std_csv, _ = standardize_and_write(raw, "HDFC", "fp", str(tmp_path))
+        second = pd.read_csv(std_csv)
+        assert len(first) == 2
+        assert first["Transaction_ID"].tolist() == second["Transaction_ID"].tolist()
+        assert (transaction_fingerprints(first).str[:12] == first["Transaction_ID"]).all()
@@ -0,0 +1,105 @@
+import os
+import pandas as pd
+import pytest
+from flask import Flask
+from app.config import IngestionConfig
+from app.services.ingestion import batch
+from app.services.ingestion.batch import PdfJob, load_manifest, process_pdfs, write_manifest
+from tests.fixtures.statements import hdfc_statement
+
+
+@pytest.fixture(autouse=True)
+def hdfc_words_mode(monkeypatch):
+    # hdfc_statement rows can only be split into debit/credit by x position
+    monkeypatch.setattr(IngestionConfig, "HDFC_PARSER_MODE", "words")
+
+
+def _jobs(tmp_path):
+    jobs = []
+    for i in range(3):
+        path, _ = hdfc_statement(tmp_path / f"b{i}_hdfc_{i}.pdf", n_pages=1, rows_per_page=4,
+                                 opening_balance=1000.0 + i)
+        jobs.append(PdfJob(path=str(path), name=f"statement_{i}.pdf"))
+    broken = tmp_path / "b9_broken.pdf"
+    broken.write_bytes(b"%PDF-1.4 not really a pdf")
+    jobs.insert(1, PdfJob(path=str(broken), name="broken.pdf", bank_hint="HDFC"))
+    return jobs
+
+
+class TestBatchUpload:
+
+    def test_pool_keeps_upload_order_and_isolates_failures(self, tmp_path):
+        out = str(tmp_path / "out")
+        os.makedirs(out)
+        results = process_pdfs(_jobs(tmp_path), out, workers=2)
+
+        assert [r.name for r in results] == ["statement_0.pdf", "broken.pdf", "statement_1.pdf", "statement_2.pdf"]
+        assert [r.error is None for r in results] == [True, False, True, True]
+        assert pd.read_csv(results[1].rej_csv)["Reason"].tolist() == ["parser_exception"]
+        for r in (results[0], results[2], results[3]):
+            assert r.bank == "HDFC"
+            assert len(pd.read_csv(r.std_csv)) == 4
+            assert r.timings["total"] >= r.timings["detect"] >= 0
+
+    def test_dead_worker_still_gets_a_full_result(self, tmp_path, monkeypatch):
+        real = batch.process_pdf
+
+        def flaky(job, output_dir):
+            if job.name == "broken.pdf":
+                raise RuntimeError("worker died")
+            return real(job, output_dir)
+
+        monkeypatch.setattr(IngestionConfig, "SANDBOX_ENABLED", True)  # thread pool: the patch is seen by workers
+        monkeypatch.setattr(batch, "process_pdf", flaky)
+        out = str(tmp_path / "out")
+        os.makedirs(out)
+        results = process_pdfs(_jobs(tmp_path), out, workers=2)
+
+        failed = results[1]
+        assert failed.error == "worker died"
+        assert pd.read_csv(failed.rej_csv)["Reason"].tolist() == ["parser_exception"]
+        assert set(failed.timings) == {"detect", "parse", "total"}
+        assert failed.timings["total"] >= failed.timings["detect"] == 0.0
+        write_manifest("dead", results, out)
+        assert all(set(f["timings"]) == {"detect", "parse", "total"} for f in load_manifest("dead", out))
+
+    def test_serial_and_pooled_outputs_match(self, tmp_path):
+        serial_dir, pooled_dir = str(tmp_path / "serial"), str(tmp_path / "pooled")
+        os.makedirs(serial_dir)
+        os.makedirs(pooled_dir)
+        jobs = _jobs(tmp_path)
+        serial = process_pdfs(jobs, serial_dir, workers=1)
+        pooled = process_pdfs(jobs, pooled_dir, workers=3)
+        for a, b in zip(serial, pooled):
+            assert os.path.basename(a.std_csv) == os.path.basename(b.std_csv)
+            sa = pd.read_csv(a.std_csv).drop(columns="Transaction_ID")
+            sb = pd.read_csv(b.std_csv).drop(columns="Transaction_ID")
+            assert sa.equals(sb)
+
+    def test_manifest_round_trip(self, tmp_path):
+        results = process_pdfs(_jobs(tmp_path)[:1], str(tmp_path), workers=1)
+        write_manifest("abc123", results, str(tmp_path))
+        files = load_manifest("abc123", str(tmp_path))
+        assert files[0]["name"] == "statement_0.pdf"
+        assert set(files[0]["timings"]) == {"detect", "parse", "total"}
+        assert load_manifest("missing", str(tmp_path)) == []
+
+
+class TestUploadRoute:
+
+    def test_same_named_uploads_do_not_collide(self, tmp_path):
+        from app.services.ingestion import ingestion_bp
+
+        app = Flask(__name__)
+        app.config.update(UPLOAD_FOLDER=str(tmp_path / "up"), OUTPUT_FOLDER=str(tmp_path / "out"))
+        app.register_blueprint(ingestion_bp)
+        pdfs = [hdfc_statement(tmp_path / f"src_{i}.pdf", n_pages=1, rows_per_page=2 + i)[0] for i in range(2)]
+        resp = app.test_client().post("/ingestion/upload", data={
+            "bank": "HDFC",
+            "pdfs": [(open(p, "rb"), "statement.pdf") for p in pdfs],
+        }, content_type="multipart/form-data")
+
+        assert resp.status_code == 302
+        assert len(os.listdir(tmp_path / "up")) == 2
+        std = sorted(f for f in os.listdir(tmp_path / "out") if "__STD_" in f)
+        assert [len(pd.read_csv(tmp_path / "out" / f)) for f in std] == [2, 3]
@@ -0,0 +1,87 @@
+import pandas as pd
+from app.config import IngestionConfig
+from app.services.ingestion.continuity import BalanceContinuity
+from app.services.ingestion.extract import parse_hdfc_df
+from app.services.ingestion.standardize import standardize_and_write
+from app.services.ingestion.validator import (
+    split_std_rejects_hdfc_like, split_std_rejects_icici, split_std_rejects_kotak,
+)
+from tests.fixtures.statements import hdfc_statement
+
+
+def _raw(rows):
+    return pd.DataFrame(
+        [{"Date": f"{i + 1:02d}/07/25", "Narration": f"TXN {i}", "Chq/Ref No": "", "Debit": d, "Credit": c, "Balance": b}
+         for i, (d, c, b) in enumerate(rows)]
+    )
+
+
+def _minor(values):
+    return pd.Series(values, dtype="Int64")
+
+
+class TestBalanceContinuity:
+
+    def test_misparsed_amount_is_rejected_with_suggestion(self):
+        raw = _raw([("", "", "1,000.00"), ("100.00", "", "900.00"), ("25.00", "", "850.00"), ("", "50.00", "900.00")])
+        std, rej = split_std_rejects_hdfc_like(raw, "HDFC")
+        assert std["Description"].tolist() == ["TXN 0", "TXN 1", "TXN 3"]
+        assert rej["Reason"].tolist() == ["balance_mismatch"]
+        assert rej[["Suggest_Debit", "Suggest_Credit", "Suggest_Balance"]].values.tolist() == [["50.00", "", "850.00"]]
+
+    def test_newest_first_statements(self):
+        check = BalanceContinuity()
+        # 850 <- 900 (debit 50) <- 1000 (debit 100, misread as credit)
+        mismatch, delta = check.check(_minor([5000, None, pd.NA]), _minor([pd.NA, 10000, pd.NA]), _minor([85000, 90000, 100000]))
+        assert check.descending is True
+        assert mismatch.tolist() == [False, True, False]
+        assert delta.tolist() == [-5000, -10000, pd.NA]
+
+    def test_running_balance_carries_across_batches(self, tmp_path):
+        batches = [_raw([("", "", "1000.00"), ("100.00", "", "900.00")]), _raw([("10.00", "", "800.00"), ("", "", "800.00")])]
+        _, rej_csv = standardize_and_write(iter(batches), "HDFC", "stmt", str(tmp_path))
+        rej = pd.read_csv(rej_csv, dtype=str, keep_default_na=False)
+        assert rej["Reason"].tolist() == ["balance_mismatch"]
+        assert rej["Suggest_Debit"].tolist() == ["100.00"]
+
+    def test_order_is_detected_across_one_row_batches(self):
+        check = BalanceContinuity()
+        assert check.check(_minor([5000]), _minor([pd.NA]), _minor([95000]))[0].tolist() == [False]
+        assert check.descending is None
+        mismatch, _ = check.check(_minor([1000]), _minor([pd.NA]), _minor([94000]))
+        assert check.descending is False
+        assert mismatch.tolist() == [False]
+        assert check.check(_minor([1000]), _minor([pd.NA]), _minor([90000]))[0].tolist() == [True]
+
+    def test_every_breaking_row_is_flagged(self):
+        raw = pd.DataFrame([
+            {"Date": "01/07/2025", "Narration": "A", "Debit": "10.00", "Credit": "", "Balance": "500.00"},
+            {"Date": "02/07/2025", "Narration": "B", "Debit": "10.00", "Credit": "", "Balance": "530.00"},
+            {"Date": "03/07/2025", "Narration": "C", "Debit": "10.00", "Credit": "", "Balance": "470.00"},
+        ])
+        std, rej = split_std_rejects_icici(raw, "ICICI")
+        assert std["Description"].tolist() == ["A"]
+        assert rej["Reason"].tolist() == ["balance_mismatch", "balance_mismatch"]
+        assert rej[["Suggest_Debit", "Suggest_Credit"]].values.tolist() == [["", "30.00"], ["60.00", ""]]
+
+    def test_kotak_overdrawn_balances_are_signed(self):
+        raw = pd.DataFrame([
+            {"Date": "01-07-2025", "Narration": "ATM", "Amount (Dr/Cr)": "100.00(Dr)", "Balance (Dr/Cr)": "50.00(Cr)"},
+            {"Date": "02-07-2025", "Narration": "EMI", "Amount (Dr/Cr)": "200.00(Dr)", "Balance (Dr/Cr)": "150.00(Dr)"},
+            {"Date": "03-07-2025", "Narration": "SALARY", "Amount (Dr/Cr)": "400.00(Cr)", "Balance (Dr/Cr)": "250.00(Cr)"},
+        ])
+        std, rej = split_std_rejects_kotak(raw, "KOTAK")
+        assert len(std) == 3 and rej.empty
+
+    def test_hdfc_text_mode_misparse_is_rejected(self, tmp_path, monkeypatch):
+        # Text mode cannot place a lone amount: it lands in Balance and both amounts stay empty
+        monkeypatch.setattr(IngestionConfig, "HDFC_PARSER_MODE", "text")
+        path, _ = hdfc_statement(tmp_path / "hdfc.pdf", n_pages=2, rows_per_page=5)
+        raw = parse_hdfc_df(path)
+        assert raw["Debit"].eq("").all() and raw["Credit"].eq("").all()
+
+        std, rej = split_std_rejects_hdfc_like(raw, "HDFC")
+        assert len(std) == 1  # the first row has no previous balance to check against
+        assert len(rej) == len(raw) - 1
+        assert set(rej["Reason"]) == {"balance_mismatch"}
+        assert (rej["Suggest_Debit"] + rej["Suggest_Credit"]).ne("").all()
@@ -0,0 +1,49 @@
+import pandas as pd
+from app.services.ingestion.dates import infer_format, normalize_dates, parse_date, parse_date_column
+from app.services.ingestion.validator import split_std_rejects_sbi
+
+
+def _iso(dates: pd.Series) -> list:
+    return dates.dt.strftime("%Y-%m-%d").fillna("").tolist()
+
+
+class TestDateEngine:
+
+    def test_dominant_format_is_inferred(self):
+        text = normalize_dates(pd.Series(["01/04/2024", "02/04/2024", "1 Apr 2024", ""]))
+        assert infer_format(text) == "%d-%m-%Y"
+        assert infer_format(pd.Series(["", "abc"])) is None
+
+    def test_stragglers_fall_back_per_value(self):
+        raw = pd.Series(["01/04/2024"] * 3 + ["05-May-24", "6 June 2024", "2024-07-08", "31/02/2024", "", None])
+        assert _iso(parse_date_column(raw)) == [
+            "2024-04-01", "2024-04-01", "2024-04-01",
+            "2024-05-05", "2024-06-06", "2024-07-08", "", "", "",
+        ]
+
+    def test_column_matches_scalar_parse(self):
+        raw = pd.Series(["03-jan-25", "3/1/25", "03–01–2025", "13/13/2025", "29/02/2023"])
+        expected = [parse_date(v) for v in normalize_dates(raw)]
+        got = parse_date_column(raw)
+        assert [d.date() if pd.notna(d) else None for d in got] == expected
+
+    def test_out_of_range_years_are_unparseable(self):
+        assert parse_date("01-08-0025") is None
+        assert _iso(parse_date_column(pd.Series(["01/07/25", "01/08/0025", "01/01/0202"]))) == ["2025-07-01", "", ""]
+
+        raw = pd.DataFrame([
+            {"Date": "01/07/25", "Narration": "OK", "Debit": "1.00", "Credit": "", "Balance": "9.00"},
+            {"Date": "01/08/0025", "Narration": "ANCIENT", "Debit": "1.00", "Credit": "", "Balance": "8.00"},
+        ])
+        std, rej = split_std_rejects_sbi(raw, "SBI")
+        assert std["Description"].tolist() == ["OK"]
+        assert rej["Reason"].tolist() == ["bad_date"]
+
+    def test_validator_uses_one_date_parser(self):
+        raw = pd.DataFrame([
+            {"Date": "01 Apr 2024", "Narration": "SPACED", "Debit": "1.00", "Credit": "", "Balance": "9.00"},
+            {"Date": "garbage", "Narration": "BAD", "Debit": "1.00", "Credit": "", "Balance": "8.00"},
+        ])
+        std, rej = split_std_rejects_sbi(raw, "SBI")
+        assert _iso(std["Transaction_Date"]) == ["2024-04-01"]
+        assert rej["Reason"].tolist() == ["bad_date"] and rej["Suggest_Date"].tolist() == [""]
@@ -0,0 +1,67 @@
+import threading
+from app.config import IngestionConfig
+from app.services.ingestion import jobs
+from app.services.ingestion.extract import iter_transactions, parse_hdfc_df
+from app.services.ingestion.jobs import JobQueue, get_job_queue
+from tests.fixtures.statements import hdfc_statement
+
+
+class TestJobQueue:
+
+    def test_jobs_run_in_background_and_report_progress(self):
+        queue = JobQueue(workers=2)
+        release = threading.Event()
+
+        def work(job_id):
+            queue.update(job_id, pages_done=1)
+            release.wait(5)
+
+        fut = queue.submit(7, work, 7)
+        assert queue.progress(7)["state"] in ("queued", "running")
+        release.set()
+        fut.result(timeout=5)
+        progress = queue.progress(7)
+        assert progress["state"] == "done"
+        assert progress["pages_done"] == 1
+        assert progress["finished_at"] >= progress["started_at"]
+        queue.shutdown()
+
+    def test_failures_are_recorded_not_raised(self):
+        queue = JobQueue(workers=1)
+
+        def boom():
+            raise ValueError("bad pdf")
+
+        queue.submit("a", boom).result(timeout=5)
+        assert queue.progress("a")["state"] == "failed"
+        assert queue.progress("a")["error"] == "bad pdf"
+        assert queue.progress("unknown") == {}
+        queue.shutdown()
+
+    def test_finished_progress_is_pruned(self):
+        queue = JobQueue(workers=1)
+        queue.submit("old", lambda: None).result(timeout=5)
+        queue.update("live", state="running")
+        queue.prune(ttl_s=3600)
+        assert queue.progress("old")["state"] == "done"
+        queue.prune(ttl_s=-1)
+        assert queue.progress("old") == {}
+        assert queue.progress("live") == {"state": "running"}
+        queue.forget("live")
+        assert queue.progress("live") == {}
+        queue.shutdown()
+
+    def test_zero_workers_means_inline(self, monkeypatch):
+        monkeypatch.setattr(IngestionConfig, "JOB_WORKERS", 0)
+        monkeypatch.setattr(jobs, "_queue", None)
+        assert get_job_queue() is None
+
+
+class TestParseProgress:
+
+    def test_progress_called_after_every_page(self, tmp_path):
+        path, _ = hdfc_statement(tmp_path / "hdfc.pdf", n_pages=3, rows_per_page=4)
+        calls = []
+        rows = sum(len(b) for b in iter_transactions(path, "HDFC", lambda done, total: calls.append((done, total))))
+        assert calls == [(1, 3), (2, 3), (3, 3)]
+        assert rows == len(parse_hdfc_df(path))
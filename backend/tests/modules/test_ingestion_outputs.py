@@ -0,0 +1,49 @@
+import os
+import pandas as pd
+import pytest
+from app.services.ingestion.outputs import count_rows, export_csv, read_std
+from app.services.ingestion.standardize import standardize_and_write
+
+pytest.importorskip("pyarrow")
+
+RAW = pd.DataFrame([
+    {"Date": "01/07/25", "Narration": "UPI-SWIGGY", "Chq/Ref No": "0000123",
+     "Debit": "1,250.50", "Credit": "", "Balance": "10,000.00"},
+    {"Date": "02/07/25", "Narration": "NEFT-SALARY", "Chq/Ref No": "0000456",
+     "Debit": "", "Credit": "5,000.00", "Balance": "15,000.00"},
+    {"Date": "03/07/25", "Narration": "NO BALANCE", "Chq/Ref No": "",
+     "Debit": "10.00", "Credit": "", "Balance": ""},
+])
+
+
+def _write(tmp_path, fmt, raw=RAW):
+    out = tmp_path / fmt
+    return standardize_and_write(raw, "HDFC", "stmt", str(out), fmt=fmt)
+
+
+class TestParquetOutputs:
+
+    def test_parquet_reads_back_as_the_typed_frame(self, tmp_path):
+        std_pq, rej_pq = _write(tmp_path, "parquet")
+        std_csv, _ = _write(tmp_path, "csv")
+        assert std_pq.endswith("__STD_HDFC.parquet") and rej_pq.endswith("__REJECTS_HDFC.parquet")
+        pd.testing.assert_frame_equal(read_std(std_pq), read_std(std_csv))
+        assert count_rows(std_pq) == count_rows(std_csv) == 2
+
+    def test_projection_reads_only_requested_columns(self, tmp_path):
+        std_pq, _ = _write(tmp_path, "parquet")
+        df = read_std(std_pq, columns=["Description", "Debit_Amount", "is_repaired"])
+        assert list(df.columns) == ["Description", "Debit_Amount", "is_repaired"]
+        assert df["Debit_Amount"].tolist() == [125050, pd.NA]
+
+    @pytest.mark.parametrize("raw", [RAW, RAW.iloc[:2]], ids=["with_rejects", "no_rejects"])
+    def test_csv_export_matches_csv_output(self, tmp_path, raw):
+        std_pq, rej_pq = _write(tmp_path, "parquet", raw)
+        std_csv, rej_csv = _write(tmp_path, "csv", raw)
+        out_dir = os.path.dirname(std_pq)
+        for written, parquet in ((std_csv, std_pq), (rej_csv, rej_pq)):
+            exported = export_csv(out_dir, os.path.basename(written))
+            assert exported == os.path.splitext(parquet)[0] + ".csv"
+            assert open(exported, "rb").read() == open(written, "rb").read()
+        assert export_csv(out_dir, "missing.csv") is None
+        assert export_csv(out_dir, "../stmt__STD_HDFC.csv") is None
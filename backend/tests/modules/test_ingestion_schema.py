@@ -0,0 +1,77 @@
+import pandas as pd
+from app.services.ingestion.fingerprint import transaction_fingerprints
+from app.services.ingestion.schema import (
+    STD_DTYPES, format_money, minor_to_decimal, parse_money, read_std_csv,
+)
+from app.services.ingestion.standardize import standardize_and_write
+from app.services.ingestion.validator import (
+    split_std_rejects_hdfc_like, split_std_rejects_icici, split_std_rejects_kotak, split_std_rejects_sbi,
+)
+
+RAW_HDFC = pd.DataFrame([
+    {"Date": "01/07/25", "Narration": "UPI-SWIGGY", "Chq/Ref No": "0000123",
+     "Debit": "1,250.50", "Credit": "", "Balance": "10,000.00"},
+    {"Date": "02/07/25", "Narration": "NEFT-SALARY", "Chq/Ref No": "0000456",
+     "Debit": "", "Credit": "5,000.00", "Balance": "15,000.00"},
+    {"Date": "03/07/25", "Narration": "NO BALANCE", "Chq/Ref No": "",
+     "Debit": "10.00", "Credit": "", "Balance": ""},
+])
+
+
+class TestTypedIntermediate:
+
+    def test_validator_emits_typed_std(self):
+        std, rej = split_std_rejects_hdfc_like(RAW_HDFC, "HDFC")
+        assert {c: str(t) for c, t in std.dtypes.items()} == {c: str(pd.Series(dtype=t).dtype) for c, t in STD_DTYPES.items()}
+        assert std["Debit_Amount"].tolist()[:1] == [125050]
+        assert std["Balance"].tolist() == [1000000, 1500000]
+        assert rej["Reason"].tolist() == ["bad_balance"]
+
+    def test_icici_dates_are_parsed(self):
+        raw = pd.DataFrame([{"Date": "16/10/2025", "Narration": "ATM", "Debit": "500.00", "Credit": "", "Balance": "900.00"},
+                            {"Date": "31/02/2025", "Narration": "BAD", "Debit": "1.00", "Credit": "", "Balance": "899.00"}])
+        std, rej = split_std_rejects_icici(raw, "ICICI")
+        assert std["Transaction_Date"].dt.strftime("%Y-%m-%d").tolist() == ["2025-10-16"]
+        assert rej["Reason"].tolist() == ["bad_date"]
+
+    def test_money_round_trip(self):
+        minor = parse_money(pd.Series(["1,234.56", "-0.05", "", None, "abc", 7.1]))
+        assert minor.tolist() == [123456, -5, pd.NA, pd.NA, pd.NA, 710]
+        assert format_money(minor).tolist() == ["1234.56", "-0.05", "", "", "", "7.10"]
+        assert str(minor_to_decimal(minor[0])) == "1234.56" and minor_to_decimal(minor[2]) is None
+
+    def test_csv_export_reads_back_typed(self, tmp_path):
+        std_csv, _ = standardize_and_write(RAW_HDFC, "HDFC", "stmt", str(tmp_path))
+        text = pd.read_csv(std_csv, dtype=str, keep_default_na=False)
+        assert text["Debit_Amount"].tolist() == ["1250.50", ""]
+        assert text["Transaction_Date"].tolist() == ["2025-07-01", "2025-07-02"]
+
+        typed = read_std_csv(std_csv)
+        assert typed["Credit_Amount"].tolist() == [pd.NA, 500000]
+        assert (transaction_fingerprints(typed).str[:12] == typed["Transaction_ID"]).all()
+
+
+class TestValidationEngine:
+
+    def test_reasons_are_joined_in_rule_order(self):
+        raw = pd.DataFrame([
+            {"Date": "99/99/99", "Narration": "BAD", "Debit": "1.00", "Credit": "2.00", "Balance": ""},
+            {"Date": "01/07/2025", "Narration": "OK", "Debit": "1.00", "Credit": "", "Balance": "5.00"},
+            {"Date": "02/07/2025", "Narration": "NAN", "Debit": "nan", "Credit": "", "Balance": "nan"},
+        ])
+        std, rej = split_std_rejects_sbi(raw, "SBI")
+        assert std["Description"].tolist() == ["OK"]
+        assert rej["Reason"].tolist() == ["bad_date;bad_balance;both_amounts_present", "bad_balance"]
+        assert list(rej.columns).index("Reason") == 6
+        assert rej["Suggest_Debit"].tolist() == ["1.00", ""]
+
+    def test_kotak_tags_pick_the_side(self):
+        raw = pd.DataFrame([
+            {"Date": "01-07-2025", "Narration": "IN", "Amount (Dr/Cr)": "1,000.00(Cr)", "Balance (Dr/Cr)": "2,000.00(Cr)"},
+            {"Date": "02-07-2025", "Narration": "OUT", "Amount (Dr/Cr)": "250.00(Dr)", "Balance (Dr/Cr)": "1,750.00(Cr)"},
+            {"Date": "03-07-2025", "Narration": "UNTAGGED", "Amount (Dr/Cr)": "50.00", "Balance (Dr/Cr)": "1,700.00"},
+        ])
+        std, rej = split_std_rejects_kotak(raw, "KOTAK")
+        assert rej.empty
+        assert std["Debit_Amount"].tolist() == [pd.NA, 25000, 5000]
+        assert std["Credit_Amount"].tolist() == [100000, pd.NA, pd.NA]
@@ -0,0 +1,87 @@
+import os
+import pytest
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+from app.config import IngestionConfig
+from app.services.ingestion import telemetry
+from app.services.ingestion.batch import PdfJob, process_pdfs
+from tests.fixtures.statements import hdfc_statement
+
+
+def _run(tmp_path):
+    path, _ = hdfc_statement(tmp_path / "t_hdfc.pdf", n_pages=2, rows_per_page=5)
+    broken = tmp_path / "t_broken.pdf"
+    broken.write_bytes(b"%PDF-1.4 not really a pdf")
+    out = str(tmp_path / "out")
+    os.makedirs(out)
+    return process_pdfs([PdfJob(str(path), "hdfc.pdf"), PdfJob(str(broken), "broken.pdf", "HDFC")], out, workers=1)
+
+
+class TestIngestionTelemetry:
+
+    def test_one_record_per_file(self, tmp_path):
+        _run(tmp_path)
+        ok, failed = telemetry.recent()
+
+        assert (ok["file"], ok["bank"], ok["status"]) == ("hdfc.pdf", "HDFC", "ok")
+        assert ok["parser"] == "HdfcPageParser/v1"
+        assert ok["pages"] == 2 and ok["rows_std"] + ok["rows_rej"] > 0
+        assert set(ok["stages_s"]) == set(telemetry.STAGES)
+        assert sum(ok["stages_s"].values()) <= ok["total_s"] + 1e-3
+        assert ok["rows_per_s"] > 0 and 0.0 <= ok["reject_rate"] <= 1.0
+
+        assert (failed["file"], failed["status"]) == ("broken.pdf", "parser_exception")
+        assert failed["error"]
+
+    def test_summary_and_bank_filter(self, tmp_path):
+        _run(tmp_path)
+        assert telemetry.recent(bank="sbi") == []
+        assert len(telemetry.recent(limit=1)) == 1
+
+        rows = {(s["bank"], s["parser"]): s for s in telemetry.summarize(telemetry.recent())}
+        assert rows[("HDFC", "HdfcPageParser/v1")]["files"] == 1
+        assert rows[("HDFC", "HdfcPageParser/v1")]["failures"] == 0
+        assert rows[("HDFC", None)]["failures"] == 1
+
+    def test_profile_filter_hides_other_users_runs(self):
+        entry = telemetry.failure_entry("salary.pdf", "HDFC", "timeout", "took too long", 1.0)
+        telemetry.record(entry, "alice")
+        telemetry.record(entry, "bob")
+        telemetry.record(entry)
+
+        assert [r["profile_id"] for r in telemetry.recent(profile_id="alice")] == ["alice"]
+        assert telemetry.recent(profile_id="carol") == []
+        assert len(telemetry.recent()) == 3
+        assert "profile_id" not in entry
+
+    def test_disabled(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(IngestionConfig, "TELEMETRY_ENABLED", False)
+        _run(tmp_path)
+        assert not os.path.exists(IngestionConfig.TELEMETRY_PATH)
+
+
+class TestTelemetryRoutes:
+
+    def _get(self, url, identity):
+        pdf_bp = pytest.importorskip("app.routes.pdf_routes").pdf_bp
+
+        app = Flask(__name__)
+        app.config["JWT_SECRET_KEY"] = "test-secret-key-of-sufficient-length"
+        JWTManager(app)
+        app.register_blueprint(pdf_bp)
+        with app.app_context():
+            token = create_access_token(identity=identity)
+        return app.test_client().get(url, headers={"Authorization": f"Bearer {token}"})
+
+    def test_users_see_their_runs_and_admins_see_all_aggregates(self, tmp_path, monkeypatch):
+        _run(tmp_path)  # batch upload page: no owner
+        telemetry.record(telemetry.failure_entry("mine.pdf", "SBI", "timeout", "slow", 1.0), "alice")
+        monkeypatch.setattr(IngestionConfig, "TELEMETRY_ADMINS", frozenset({"ops"}))
+
+        mine = self._get("/api/pdf/telemetry", "alice").get_json()["data"]
+        assert [r["file"] for r in mine["runs"]] == ["mine.pdf"]
+
+        assert self._get("/api/pdf/telemetry/all", "alice").status_code == 403
+        summary = self._get("/api/pdf/telemetry/all", "ops").get_json()["data"]["summary"]
+        assert sum(s["files"] for s in summary) == 3
+        assert all("file" not in s for s in summary)
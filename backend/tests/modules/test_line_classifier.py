@@ -0,0 +1,43 @@
+import re
+import pytest
+from app.services.ingestion.extract import (
+    NOISE_PATTERNS, SBI_FOOTER_PATTERNS, _is_noise, _is_sbi_footer, line_profile,
+)
+
+SAMPLE_LINES = [
+    "", "   ", "Page 2 of 14", "Withdrawal(Dr)", "Deposit(Cr) ",
+    "Date Narration Chq./Ref.No. Value Dt Withdrawal Amt. Deposit Amt. Closing Balance",
+    "Statement Summary :-", "Opening Balance 1,000.00", "End of Statement",
+    "From : 01/04/2025 To : 30/06/2025", "Account Branch : MG ROAD",
+    "JOINTHOLDERS: NONE", "xx HDFCBANKLIMITED yy", "Closingbalanceincludesfunds earmarked",
+    "01/07/25 UPI-SWIGGY 0000123 01/07/25 250.00 10,000.00",
+    "NEFT-SALARY ACME CORP", "Please do not share your ATM pin",
+    "OTP (One Time Password) is confidential", "page of",
+]
+
+
+def _is_noise_reference(line):
+    s = (line or "").strip()
+    return not s or any(re.search(p, s, flags=re.I) for p in NOISE_PATTERNS)
+
+
+class TestLineClassifier:
+
+    @pytest.mark.parametrize("line", SAMPLE_LINES)
+    def test_matches_per_pattern_scan(self, line):
+        assert _is_noise(line) == _is_noise_reference(line)
+        assert _is_sbi_footer(line) == any(re.search(p, line, flags=re.I) for p in SBI_FOOTER_PATTERNS)
+
+    def test_reports_fired_rule_and_counts(self):
+        noise = line_profile("HDFC")
+        assert noise.classify("Page 3 of 9") == "page_number"
+        assert noise.classify("End of Statement") == "end_of_statement"
+        assert noise.classify("Page 4 of 9") == "page_number"
+        assert noise.classify("01/07/25 UPI 10.00 20.00") is None
+        assert noise.counts == {"page_number": 2, "end_of_statement": 1}
+
+    def test_bank_profiles_are_independent(self):
+        sbi = line_profile("SBI")
+        assert sbi.classify("This is a computer generated statement") == "sbi_computer_generated"
+        assert line_profile("HDFC").classify("This is a computer generated statement") is None
+        assert line_profile("HDFC").counts == {}
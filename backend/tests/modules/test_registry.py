@@ -0,0 +1,37 @@
+import subprocess
+import sys
+from app.services.ingestion.registry import get_bank, is_supported, supported_banks
+from app.services.ingestion.validator import split_std_rejects_hdfc_like, split_std_rejects_kotak
+
+
+class TestBankRegistry:
+
+    def test_supported_banks(self):
+        assert supported_banks() == ["HDFC", "KOTAK", "SBI", "ICICI", "AXIS", "CUB", "IDFC"]
+        assert is_supported("kotak")
+        assert not is_supported("UNKNOWN")
+        assert not is_supported(None)
+
+    def test_spec_pairs_parser_and_validator(self):
+        from app.services.ingestion.banks.kotak import KotakPageParser
+        spec = get_bank("KOTAK")
+        assert spec.parser is KotakPageParser
+        assert spec.validator is split_std_rejects_kotak
+
+    def test_generic_banks_use_hdfc_layout(self):
+        from app.services.ingestion.banks.hdfc import HdfcPageParser
+        for bank in ("AXIS", "CUB", "IDFC"):
+            assert get_bank(bank).parser is HdfcPageParser
+            assert get_bank(bank).validator is split_std_rejects_hdfc_like
+
+    def test_unknown_bank_falls_back_to_hdfc(self):
+        assert get_bank("UNKNOWN").bank == "HDFC"
+
+    def test_detection_does_not_import_parsers(self):
+        code = (
+            "import sys\n"
+            "import app.services.ingestion.detect\n"
+            "loaded = [m for m in sys.modules if m.startswith('app.services.ingestion.banks.') or m == 'pdfplumber']\n"
+            "assert not loaded, loaded\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,134 @@
+import multiprocessing
+import os
+import resource
+import threading
+import time
+import pandas as pd
+import pytest
+from app.config import IngestionConfig
+from app.services.ingestion import batch
+from app.services.ingestion.batch import PdfJob, process_pdf
+from app.services.ingestion.sandbox import ParserOOM, ParserTimeout, SandboxError, run_sandboxed
+from tests.fixtures.statements import hdfc_statement
+
+
+def _ok(a, b, report):
+    report(pages_done=1, page_count=1)
+    return (a + b, os.getpid())
+
+
+def _sleep(seconds, report):
+    time.sleep(seconds)
+
+
+def _stuck_on_page_two(report):
+    report(pages_done=1, page_count=3)
+    time.sleep(30)
+
+
+def _balloon(report):
+    chunks = []
+    for _ in range(64):
+        chunks.append(bytearray(32 * 1024 * 1024))
+        time.sleep(0.05)
+
+
+def _grow_unlimited():
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    resource.setrlimit(resource.RLIMIT_AS, (hard, hard))  # only the tree-wide poll can stop it
+    _balloon(None)
+    time.sleep(30)
+
+
+def _balloon_in_worker(report):
+    worker = multiprocessing.get_context("fork").Process(target=_grow_unlimited)
+    worker.start()
+    report(worker_pid=worker.pid)
+    worker.join()
+
+
+def _gone(pid):
+    try:
+        with open(f"/proc/{pid}/stat") as fh:
+            return fh.read().split(")")[-1].split()[0] in ("Z", "X")
+    except OSError:
+        return True
+
+
+_held = threading.Lock()
+
+
+def _take_lock(report):
+    with _held:
+        return IngestionConfig.PARALLEL_MIN_PAGES
+
+
+def _fail(report):
+    raise ValueError("unreadable xref")
+
+
+def _hang_parse(job, output_dir, report):
+    report(bank="HDFC", confidence=1.0, detect_s=0.01)
+    time.sleep(30)
+
+
+@pytest.fixture(autouse=True)
+def sandbox_on(monkeypatch):
+    monkeypatch.setattr(IngestionConfig, "SANDBOX_ENABLED", True)
+
+
+class TestSandbox:
+
+    def test_result_and_reports_come_back_from_child(self):
+        seen = []
+        value, pid = run_sandboxed(_ok, 2, 3, progress=seen.append)
+        assert value == 5
+        assert pid != os.getpid()
+        assert seen == [{"pages_done": 1, "page_count": 1}]
+
+    def test_wall_clock_timeout(self):
+        started = time.monotonic()
+        with pytest.raises(ParserTimeout):
+            run_sandboxed(_sleep, 30, timeout=0.5)
+        assert time.monotonic() - started < 5
+
+    def test_per_page_timeout(self):
+        with pytest.raises(ParserTimeout, match="page 2"):
+            run_sandboxed(_stuck_on_page_two, timeout=20, page_timeout=0.5)
+
+    def test_memory_cap(self):
+        with pytest.raises(ParserOOM):
+            run_sandboxed(_balloon, timeout=20, max_rss_mb=256)
+
+    def test_memory_cap_counts_the_childs_workers(self):
+        seen = []
+        with pytest.raises(ParserOOM):
+            run_sandboxed(_balloon_in_worker, progress=seen.append, timeout=20, max_rss_mb=256)
+        worker = seen[0]["worker_pid"]
+        for _ in range(50):
+            if _gone(worker):
+                break
+            time.sleep(0.05)
+        assert _gone(worker)
+
+    def test_child_does_not_inherit_held_locks_or_lose_config(self, monkeypatch):
+        monkeypatch.setattr(IngestionConfig, "PARALLEL_MIN_PAGES", 7)
+        with _held:  # held by this thread while the child starts, as a busy web worker's would be
+            assert run_sandboxed(_take_lock, timeout=5) == 7
+
+    def test_child_exception_keeps_message_and_trace(self):
+        with pytest.raises(SandboxError) as exc:
+            run_sandboxed(_fail)
+        assert exc.value.reason == "parser_exception"
+        assert "unreadable xref" in str(exc.value)
+        assert "ValueError" in exc.value.trace
+
+    def test_breach_becomes_structured_reject_row(self, tmp_path, monkeypatch):
+        path, _ = hdfc_statement(tmp_path / "x_hdfc.pdf", n_pages=1, rows_per_page=2)
+        monkeypatch.setattr(batch, "_detect_and_parse", _hang_parse)
+        monkeypatch.setattr(IngestionConfig, "SANDBOX_TIMEOUT_S", 0.5)
+        result = process_pdf(PdfJob(path=str(path), name="x.pdf"), str(tmp_path))
+        rejects = pd.read_csv(result.rej_csv)
+        assert rejects["Reason"].tolist() == ["parser_timeout"]
+        assert rejects["Bank_Name"].tolist() == ["HDFC"]
+        assert result.error and result.bank == "HDFC"
@@ -0,0 +1,149 @@
+import pytest
+import pdfplumber
+from app.services.ingestion import document
+from app.services.ingestion.document import StatementDocument
+from app.services.ingestion.extraction_cache import ExtractionCache
+from app.services.ingestion.detect import detect_bank
+from app.services.ingestion.extract import parse_hdfc_df, parse_kotak_df
+from app.services.ingestion.pdf_backends import PdfiumBackend, PdfplumberBackend, backend_class
+from tests.fixtures.pdf_builder import build_pdf
+from tests.fixtures.statements import hdfc_statement
+
+HDFC_PAGES = [[
+    "HDFC BANK LTD",
+    "Date Narration Ref Value Dt Withdrawal Amt. Deposit Amt. Closing Bal.",
+    "01/07/25 UPI-SWIGGY 0000123 01/07/25 250.00 0.00 10,000.00",
+    "02/07/25 NEFT-SALARY 0000456 02/07/25 0.00 5,000.00 15,000.00",
+]]
+
+
+@pytest.fixture
+def hdfc_pdf(tmp_path):
+    return build_pdf(tmp_path / "hdfc.pdf", HDFC_PAGES)
+
+
+class TestStatementDocument:
+
+    def test_detect_and_parse_share_one_open(self, hdfc_pdf, monkeypatch):
+        calls = []
+        real_open = pdfplumber.open
+
+        def counting_open(path, *args, **kwargs):
+            calls.append(path)
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(pdfplumber, "open", counting_open)
+        with StatementDocument(hdfc_pdf, backend="pdfplumber") as doc:
+            assert detect_bank(doc) == "HDFC"
+            df = parse_hdfc_df(doc)
+        assert len(calls) == 1
+        assert len(df) == 2
+
+    def test_page_text_is_memoized(self, hdfc_pdf):
+        with StatementDocument(hdfc_pdf) as doc:
+            first = doc.page_text(0)
+            assert doc.page_text(0) is first
+            assert doc.page_lines(0)[0] == "HDFC BANK LTD"
+
+    def test_path_source_still_supported(self, hdfc_pdf):
+        assert detect_bank(hdfc_pdf) == "HDFC"
+        assert len(parse_hdfc_df(hdfc_pdf)) == 2
+
+
+class TestParallelPrefetch:
+
+    def test_parallel_text_matches_serial(self, tmp_path):
+        pages = [[f"Page {i} line A", f"Page {i} line B"] for i in range(5)]
+        path = build_pdf(tmp_path / "multi.pdf", pages)
+        with StatementDocument(path) as serial:
+            expected = [serial.page_text(i) for i in range(serial.page_count)]
+        with StatementDocument(path) as doc:
+            doc.prefetch("text", workers=2, min_pages=2)
+            assert sorted(doc._text) == list(range(5))
+            assert [doc.page_text(i) for i in range(5)] == expected
+
+    def test_small_documents_stay_serial(self, hdfc_pdf, monkeypatch):
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool must not start below the page threshold")
+
+        monkeypatch.setattr(document, "ProcessPoolExecutor", no_pool)
+        with StatementDocument(hdfc_pdf) as doc:
+            doc.prefetch("text", workers=4, min_pages=40)
+            assert doc._text == {}
+
+
+class TestExtractionCache:
+
+    def test_hit_skips_pdfplumber(self, hdfc_pdf, tmp_path, monkeypatch):
+        cache = ExtractionCache(str(tmp_path / "cache"), max_bytes=1 << 20)
+        with StatementDocument(hdfc_pdf, cache=cache) as doc:
+            expected = parse_hdfc_df(doc)
+        assert cache.stats()["misses"] == 1
+
+        def no_open(*args, **kwargs):
+            raise AssertionError("pdfplumber must not be opened on a cache hit")
+
+        monkeypatch.setattr(pdfplumber, "open", no_open)
+        with StatementDocument(hdfc_pdf, cache=cache) as doc:
+            assert detect_bank(doc) == "HDFC"
+            assert parse_hdfc_df(doc).equals(expected)
+        assert cache.stats()["hits"] == 1
+
+    def test_released_pages_leave_memory_but_reach_the_cache(self, tmp_path, monkeypatch):
+        path, _ = hdfc_statement(tmp_path / "hdfc.pdf", n_pages=3, rows_per_page=4)
+        cache = ExtractionCache(str(tmp_path / "cache"), max_bytes=1 << 20)
+        with StatementDocument(path, cache=cache) as doc:
+            expected = parse_hdfc_df(doc)
+            assert doc._text == {} and doc._words == {} and doc._tables == {}
+        assert sorted(cache.load(doc.cache_key)["text"]) == [0, 1, 2]
+
+        monkeypatch.setattr(pdfplumber, "open", lambda *a, **k: pytest.fail("cache hit must not open the PDF"))
+        with StatementDocument(path, cache=cache) as doc:
+            assert parse_hdfc_df(doc).equals(expected)
+
+    def test_lru_eviction_respects_size_bound(self, tmp_path):
+        cache = ExtractionCache(str(tmp_path / "cache"), max_bytes=2500)
+        for i in range(5):
+            cache.store(f"{i:064d}", 1, {0: "x" * 1000}, {})
+        assert cache.evictions == 3
+        assert cache.load(f"{4:064d}") is not None
+        assert cache.load(f"{0:064d}") is None
+
+
+class TestPdfBackends:
+
+    def test_unknown_backend_falls_back_to_pdfplumber(self):
+        assert backend_class("no-such-engine") is PdfplumberBackend
+        assert backend_class("PYPDFIUM2") is PdfiumBackend
+
+    def test_pdfium_text_and_words_match_pdfplumber(self, tmp_path):
+        path, _ = hdfc_statement(tmp_path / "hdfc.pdf", n_pages=2, rows_per_page=5)
+        with StatementDocument(path, cache=False, backend="pdfplumber") as plumber, \
+                StatementDocument(path, cache=False, backend="pypdfium2") as pdfium:
+            for i in range(plumber.page_count):
+                assert pdfium.page_text(i) == plumber.page_text(i)
+                a, b = plumber.page_words(i), pdfium.page_words(i)
+                assert [w["text"] for w in b] == [w["text"] for w in a]
+                assert all(abs(wb["x0"] - wa["x0"]) < 1 and abs(wb["top"] - wa["top"]) < 3 for wa, wb in zip(a, b))
+                assert pdfium.page_probe(i)["head"] == plumber.page_probe(i)["head"]
+
+    def test_parsers_agree_across_backends(self, tmp_path):
+        path, expected = hdfc_statement(tmp_path / "hdfc.pdf", n_pages=2, rows_per_page=5)
+        with StatementDocument(path, cache=False, backend="pypdfium2") as doc:
+            assert detect_bank(doc) == "HDFC"
+            assert parse_hdfc_df(doc, mode="words").values.tolist() == expected
+        kotak = build_pdf(tmp_path / "kotak.pdf", [[
+            "Page 1 of 1",
+            "01-07-2025 UPI/SWIGGY/123 250.00(Dr) 9,750.00(Cr)",
+            "02-07-2025 NEFT TRANSFER FROM",
+            "ACME CORP SALARY 5,000.00(Cr) 14,750.00(Cr)",
+        ]])
+        with StatementDocument(kotak, cache=False, backend="pypdfium2") as doc:
+            assert parse_kotak_df(doc).equals(parse_kotak_df(kotak))
+
+    def test_cache_entries_are_per_backend(self, hdfc_pdf, tmp_path):
+        cache = ExtractionCache(str(tmp_path / "cache"), max_bytes=1 << 20)
+        with StatementDocument(hdfc_pdf, cache=cache, backend="pdfplumber") as a, \
+                StatementDocument(hdfc_pdf, cache=cache, backend="pypdfium2") as b:
+            assert a.cache_key == a.sha256
+            assert b.cache_key == f"{a.sha256}-pypdfium2"
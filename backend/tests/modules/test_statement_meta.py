@@ -0,0 +1,43 @@
+import pytest
+from app.services.ingestion.document import StatementDocument
+from app.services.ingestion.extraction_cache import ExtractionCache
+from app.services.ingestion.statement_meta import mask_account, parse_statement_meta, statement_meta
+from tests.fixtures.statements import sbi_statement
+
+
+class TestStatementMeta:
+
+    @pytest.mark.parametrize("line, start, end", [
+        ("From : 01/07/2025 To : 31/07/2025", "2025-07-01", "2025-07-31"),
+        ("Period 01/04/2024 - 30/04/2024", "2024-04-01", "2024-04-30"),
+        ("Statement for the period 01-Apr-2024 to 30-Apr-2024", "2024-04-01", "2024-04-30"),
+        ("01 Jul 2025 - 31 Jul 2025", "2025-07-01", "2025-07-31"),
+    ])
+    def test_period_formats(self, line, start, end):
+        meta = parse_statement_meta(["HDFC BANK LTD", line])
+        assert (meta.period_start, meta.period_end) == (start, end)
+
+    def test_reversed_period_is_ignored(self):
+        meta = parse_statement_meta(["From : 31/07/2025 To : 01/07/2025"])
+        assert meta.period_start is None and meta.period_end is None
+
+    def test_account_is_masked(self):
+        assert parse_statement_meta(["Account No : 50100123456789"]).account_masked == "XXXXXXXXXX6789"
+        assert parse_statement_meta(["A/C No XXXXXXXX1234"]).account_masked == "XXXXXXXX1234"
+        assert mask_account("1234") == "1234"
+
+    def test_no_header_facts(self):
+        meta = parse_statement_meta(["01/07/25 UPI-SWIGGY 250.00 10,000.00"])
+        assert meta.account_masked is None and meta.period_start is None
+
+    def test_first_page_of_document_is_memoized(self, tmp_path):
+        path = sbi_statement(tmp_path / "sbi.pdf", n_pages=2)
+        cache = ExtractionCache(str(tmp_path / "cache"), 1 << 20)
+        with StatementDocument(path, cache=cache) as doc:
+            meta = statement_meta(doc)
+        assert (meta.period_start, meta.period_end) == ("2024-04-01", "2024-04-30")
+        assert meta.account_masked == "XXXXXXX2345"
+
+        with StatementDocument(path, cache=cache) as doc:
+            doc.page_lines = lambda index: pytest.fail("header re-read despite cached meta")
+            assert statement_meta(doc) == meta
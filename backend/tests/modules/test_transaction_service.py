@@ -1,4 +1,5 @@
 import pytest
+import pandas as pd
 from app.services.transaction_service import TransactionService
 from app.models.transaction import Transaction
 from datetime import datetime
@@ -39,3 +40,21 @@ class TestTransactionService:
             sample_user.profile_id
         )
         assert result is not None
+
+    def test_reimport_skips_known_rows(self, session, sample_statement, tmp_path):
+        csv_path = tmp_path / "std.csv"
+        pd.DataFrame({
+            'Transaction_ID': ['a', 'b'],
+            'Transaction_Date': ['2024-01-15', '2024-01-16'],
+            'Description': ['UPI/SWIGGY', 'NEFT SALARY'],
+            'Debit_Amount': [250.0, None],
+            'Credit_Amount': [None, 5000.0],
+            'Balance': [9750.0, 14750.0],
+            'Bank_Name': ['HDFC', 'HDFC'],
+        }).to_csv(csv_path, index=False)
+        sample_statement.normalized_csv_path = str(csv_path)
+        session.commit()
+
+        assert TransactionService.import_from_csv(sample_statement.file_id) == 2
+        assert TransactionService.import_from_csv(sample_statement.file_id) == 0
+        assert Transaction.query.filter_by(statement_id=sample_statement.file_id).count() == 2
@@ -8,7 +8,11 @@ export const pdfController = {
     onProgress: (progress: number) => void
   ): Promise<PDFUploadResponse> => {
     onProgress(30);
-    const result = await pdfService.uploadPDF(file, bank);
+    const result = await pdfService.uploadPDF(file, bank, (status) => {
+      if (status.page_count) {
+        onProgress(30 + Math.round((60 * (status.pages_done ?? 0)) / status.page_count));
+      }
+    });
     onProgress(100);
     return result;
   },
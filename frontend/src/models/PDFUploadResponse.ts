@@ -1,6 +1,20 @@
+export type PDFProcessingStatus = 'PENDING' | 'PROCESSING' | 'COMPLETED' | 'FAILED';
+
 export interface PDFUploadResponse {
   statement_id: string;
   bank_name: string;
   transaction_count: number;
   csv_filename?: string;
 }
+
+export interface PDFStatusResponse {
+  statement_id: string;
+  bank_name: string;
+  status: PDFProcessingStatus;
+  pages_done?: number | null;
+  page_count?: number | null;
+  rows_parsed?: number | null;
+  transaction_count?: number | null;
+  csv_filename?: string;
+  error?: string;
+}
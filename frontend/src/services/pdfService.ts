@@ -1,8 +1,18 @@
 import apiClient from '../utils/apiClient';
-import { PDFUploadResponse } from '../models/PDFUploadResponse';
+import { PDFStatusResponse, PDFUploadResponse } from '../models/PDFUploadResponse';
+
+const POLL_INTERVAL_MS = 1000;
+// Longer than the server's queue wait plus its 10-minute per-file parse limit
+const POLL_TIMEOUT_MS = 15 * 60 * 1000;
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
 
 export const pdfService = {
-  uploadPDF: async (file: File, bank: string): Promise<PDFUploadResponse> => {
+  uploadPDF: async (
+    file: File,
+    bank: string,
+    onStatus?: (status: PDFStatusResponse) => void
+  ): Promise<PDFUploadResponse> => {
     const formData = new FormData();
     formData.append('pdf', file);
     formData.append('bank', bank);
@@ -13,6 +23,33 @@ export const pdfService = {
       },
     });
 
+    // 202: processing was queued; poll until the statement is done
+    if (response.status !== 202) {
+      return response.data.data;
+    }
+    const statementId = response.data.data.statement_id;
+    const deadline = Date.now() + POLL_TIMEOUT_MS;
+    while (Date.now() < deadline) {
+      await sleep(POLL_INTERVAL_MS);
+      const status = await pdfService.getStatus(statementId);
+      onStatus?.(status);
+      if (status.status === 'FAILED') {
+        throw new Error(status.error || 'PDF processing failed');
+      }
+      if (status.status === 'COMPLETED') {
+        return {
+          statement_id: status.statement_id,
+          bank_name: status.bank_name,
+          transaction_count: status.transaction_count ?? 0,
+          csv_filename: status.csv_filename,
+        };
+      }
+    }
+    throw new Error('PDF processing is taking too long; check the statement status again later');
+  },
+
+  getStatus: async (statementId: string): Promise<PDFStatusResponse> => {
+    const response = await apiClient.get(`/api/pdf/status/${statementId}`);
     return response.data.data;
   },
 